@@ -1,7 +1,7 @@
 """
 전사 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 import logging
@@ -14,6 +14,7 @@ from app.schemas.transcription import (
     JobStatus,
 )
 from app.services.transcription import TranscriptionService
+from app.services.scheduler import job_scheduler
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,8 @@ router = APIRouter(prefix="/transcribe", tags=["transcription"])
 
     **동작 방식:**
     1. 전사 작업(Job)을 생성하고 즉시 응답
-    2. 실제 전사는 백그라운드에서 비동기로 진행
+    2. 작업은 스케줄러 큐에 등록되며, 최대 `max_concurrent_jobs`개까지 동시 처리
+       (`priority` 값이 클수록 먼저 처리)
     3. `/jobs/{job_id}` 엔드포인트로 진행 상황 조회
     4. 완료 후 `/results/{job_id}/{format}` 엔드포인트로 결과 다운로드
 
@@ -51,7 +53,6 @@ router = APIRouter(prefix="/transcribe", tags=["transcription"])
 )
 async def create_transcription(
     request: TranscriptionRequest,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -59,7 +60,6 @@ async def create_transcription(
 
     Args:
         request: 전사 요청 데이터
-        background_tasks: FastAPI 백그라운드 태스크
         db: 데이터베이스 세션
 
     Returns:
@@ -74,12 +74,10 @@ async def create_transcription(
             file_ids=request.file_ids
         )
 
-        # 백그라운드 태스크로 전사 시작
-        background_tasks.add_task(
-            process_transcription_task,
-            job_id=str(job.id),
-            hf_token=settings.huggingface_token
-        )
+        # 스케줄러 큐에 등록 (워커 풀이 순서대로 처리)
+        # worker 모드에서는 DB의 QUEUED 행을 외부 워커가 폴링해 처리
+        if job_scheduler.is_running:
+            job_scheduler.submit(str(job.id), priority=job.priority or 0)
 
         logger.info(f"Transcription job {job.id} created and queued")
 
@@ -104,29 +102,6 @@ async def create_transcription(
         )
 
 
-async def process_transcription_task(job_id: str, hf_token: str):
-    """
-    백그라운드 전사 작업 처리
-
-    Args:
-        job_id: 작업 ID
-        hf_token: HuggingFace 토큰
-    """
-    # 새로운 DB 세션 생성 (백그라운드 태스크용)
-    from app.db.session import AsyncSessionLocal
-
-    async with AsyncSessionLocal() as db:
-        try:
-            service = TranscriptionService(db)
-            await service.process_transcription(
-                job_id=job_id,
-                hf_token=hf_token
-            )
-        except Exception as e:
-            logger.error(f"Background transcription task failed for job {job_id}: {e}")
-            # 에러는 이미 서비스 레이어에서 Job에 기록됨
-
-
 @router.get(
     "/jobs/{job_id}",
     response_model=JobResponse,
@@ -179,6 +154,7 @@ async def get_job_status(
             started_at=job.started_at,
             completed_at=job.completed_at,
             error=job.error_message,
+            stage_timings=job.stage_timings,
         )
 
     except HTTPException:
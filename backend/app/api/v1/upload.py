@@ -1,19 +1,31 @@
 """
 파일 업로드 API 엔드포인트
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, HTTPException, Depends, Header, Request
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from datetime import datetime
+from typing import List, Optional
+from datetime import datetime, timedelta
+import asyncio
+import os
 import uuid
-import shutil
+import weakref
 from pathlib import Path
 import logging
 
 from app.config import settings
 from app.db.session import get_db
-from app.db.models import UploadedFile as UploadedFileModel
-from app.schemas.transcription import UploadResponse
+from app.core.audio import probe_duration
+from app.db.models import UploadedFile as UploadedFileModel, UploadSession as UploadSessionModel
+from app.schemas.transcription import UploadResponse, UploadSessionCreate, UploadSessionResponse
+from app.services.ingest import normalize_uploaded_files
+from app.services.uploads import (
+    FileTooLargeError,
+    hash_file,
+    parse_content_range,
+    save_upload,
+    write_range,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -21,13 +33,17 @@ logger = logging.getLogger(__name__)
 
 @router.post("/upload", response_model=UploadResponse, status_code=201)
 async def upload_files(
+    background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(..., description="업로드할 파일 (최대 10개)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
     오디오/비디오 파일 업로드
 
+    ingest_normalize가 켜져 있으면 응답 후 백그라운드에서 16kHz 모노 정규화 파일을 만듭니다.
+
     Args:
+        background_tasks: 응답 후 실행할 작업 (정규화)
         files: 업로드할 파일 목록 (최대 10개, 각 500MB)
         db: 데이터베이스 세션
 
@@ -48,84 +64,62 @@ async def upload_files(
     file_ids = []
     uploaded_at = datetime.utcnow()
 
-    # 허용 확장자/타입 (환경 설정 기반)
-    allowed_exts = set(ext.lower() for ext in settings.allowed_upload_exts)
-    allowed_mimes_prefix = tuple(settings.allowed_mime_prefixes)
-
     try:
         for file in files:
-            # 파일 크기 검증 (대략적)
-            file.file.seek(0, 2)  # 파일 끝으로 이동
-            file_size = file.file.tell()
-            file.file.seek(0)  # 파일 시작으로 복귀
-
-            if file_size > settings.max_file_size:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"파일 '{file.filename}'의 크기가 최대 허용 크기({settings.max_file_size / 1024 / 1024:.0f}MB)를 초과합니다."
-                )
-
-            # 파일 유형 검증
-            if file.content_type and not file.content_type.startswith(allowed_mimes_prefix):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"'{file.filename}'은(는) 지원되지 않는 MIME 타입입니다: {file.content_type}"
-                )
+            # 파일 유형/확장자 검증
+            original_filename = file.filename or "unknown"
+            file_extension = _validate_file_type(original_filename, file.content_type)
 
             # UUID 생성
             file_id = str(uuid.uuid4())
 
-            # 파일 확장자 추출
-            original_filename = file.filename or "unknown"
-            file_extension = Path(original_filename).suffix
-
-            # 확장자 허용 여부 검증
-            if not file_extension:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"'{original_filename}' 파일 확장자를 확인할 수 없습니다."
-                )
-            if file_extension.lower() not in allowed_exts:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"'{original_filename}'은(는) 허용되지 않는 확장자입니다: {file_extension}"
-                )
-
             # 저장 경로 생성
             storage_filename = f"{file_id}{file_extension}"
             storage_path = settings.upload_dir / storage_filename
 
-            # 파일 저장
-            with storage_path.open("wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # 파일 저장: 한 번의 스트리밍 패스로 크기 제한 검사 + 내용 해시 계산 + 쓰기
+            try:
+                stored = await save_upload(file, storage_path)
+            except FileTooLargeError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"파일 '{file.filename}'의 크기가 최대 허용 크기({settings.max_file_size / 1024 / 1024:.0f}MB)를 초과합니다."
+                )
+            file_ids.append(file_id)
 
-            logger.info(f"File uploaded: {original_filename} -> {storage_path}")
+            logger.info(f"File uploaded: {original_filename} -> {storage_path} ({stored.size} bytes)")
 
             # DB에 파일 메타데이터 저장
             uploaded_file = UploadedFileModel(
                 id=file_id,
                 original_filename=original_filename,
                 storage_path=str(storage_path),
-                file_size=file_size,
+                file_size=stored.size,
+                duration=stored.duration,
                 mime_type=file.content_type,
+                content_hash=stored.content_hash,
                 uploaded_at=uploaded_at,
             )
 
             db.add(uploaded_file)
-            file_ids.append(file_id)
 
         # 커밋
         await db.commit()
 
         logger.info(f"Successfully uploaded {len(file_ids)} files")
 
+        if settings.ingest_normalize:
+            background_tasks.add_task(normalize_uploaded_files, list(file_ids))
+
         return UploadResponse(
             file_ids=file_ids,
             uploaded_at=uploaded_at
         )
 
     except HTTPException:
-        # HTTPException은 그대로 전달
+        # 이미 저장된 파일 정리 후 그대로 전달
+        await db.rollback()
+        _cleanup_files(file_ids)
         raise
 
     except Exception as e:
@@ -135,14 +129,322 @@ async def upload_files(
         logger.error(f"File upload failed: {e}")
 
         # 업로드된 파일 삭제
-        for file_id in file_ids:
-            try:
-                for path in settings.upload_dir.glob(f"{file_id}*"):
-                    path.unlink()
-            except Exception as cleanup_error:
-                logger.error(f"Failed to cleanup file {file_id}: {cleanup_error}")
+        _cleanup_files(file_ids)
 
         raise HTTPException(
             status_code=500,
             detail=f"파일 업로드 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+def _cleanup_files(file_ids: List[str]) -> None:
+    """실패한 업로드 요청에서 이미 저장된 파일 삭제"""
+    for file_id in file_ids:
+        try:
+            for path in settings.upload_dir.glob(f"{file_id}*"):
+                path.unlink()
+        except Exception as cleanup_error:
+            logger.error(f"Failed to cleanup file {file_id}: {cleanup_error}")
+
+
+def _validate_file_type(filename: str, content_type: Optional[str]) -> str:
+    """
+    MIME 타입과 확장자 허용 여부 검증 (환경 설정 기반)
+
+    Returns:
+        파일 확장자 (예: ".mp4")
+
+    Raises:
+        HTTPException 400: 허용되지 않는 MIME 타입 또는 확장자
+    """
+    allowed_exts = set(ext.lower() for ext in settings.allowed_upload_exts)
+    allowed_mimes_prefix = tuple(settings.allowed_mime_prefixes)
+
+    if content_type and not content_type.startswith(allowed_mimes_prefix):
+        raise HTTPException(
+            status_code=400,
+            detail=f"'{filename}'은(는) 지원되지 않는 MIME 타입입니다: {content_type}"
+        )
+
+    file_extension = Path(filename).suffix
+    if not file_extension:
+        raise HTTPException(
+            status_code=400,
+            detail=f"'{filename}' 파일 확장자를 확인할 수 없습니다."
+        )
+    if file_extension.lower() not in allowed_exts:
+        raise HTTPException(
+            status_code=400,
+            detail=f"'{filename}'은(는) 허용되지 않는 확장자입니다: {file_extension}"
+        )
+    return file_extension
+
+
+# ---------------------------------------------------------------------------
+# 재개 가능한(resumable) 업로드
+#
+# 1. POST /upload/sessions                 세션 생성 (파일 이름, 전체 크기, 선택적 SHA-256)
+# 2. PUT  /upload/sessions/{id}            Content-Range로 바이트 범위 전송 (순서대로, 재시도 가능)
+# 3. GET  /upload/sessions/{id}            수신 위치 조회 (끊긴 뒤 이어서 보낼 위치)
+# 4. POST /upload/sessions/{id}/complete   완료 → UploadedFile 생성, file_id 반환
+#
+# 완료되지 않은 세션은 upload_session_ttl_hours 동안 청크가 오지 않으면 부분 파일과 함께 만료됩니다.
+# ---------------------------------------------------------------------------
+
+# 세션별 완료 처리 락 (같은 세션의 /complete 동시 호출 직렬화, 사용 중인 락만 유지)
+_complete_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _session_response(session: UploadSessionModel) -> UploadSessionResponse:
+    return UploadSessionResponse(
+        session_id=session.id,
+        filename=session.original_filename,
+        total_size=session.total_size,
+        received_bytes=session.received_bytes or 0,
+        chunk_size=settings.resumable_chunk_size,
+        completed=session.completed_at is not None,
+        file_id=session.file_id,
+    )
+
+
+async def _get_session(db: AsyncSession, session_id: str) -> UploadSessionModel:
+    session = await db.get(UploadSessionModel, session_id)
+    if session is not None and _is_expired(session, datetime.utcnow()):
+        await _delete_sessions(db, [session])
+        session = None
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"업로드 세션을 찾을 수 없습니다: {session_id}")
+    return session
+
+
+def _is_expired(session: UploadSessionModel, now: datetime) -> bool:
+    """완료되지 않은 세션이 TTL 동안 갱신되지 않았는지 여부"""
+    ttl_hours = settings.upload_session_ttl_hours
+    if session.completed_at is not None or ttl_hours <= 0:
+        return False
+    last_activity = session.updated_at or session.created_at
+    return last_activity is not None and last_activity < now - timedelta(hours=ttl_hours)
+
+
+async def _expire_sessions(db: AsyncSession) -> int:
+    """만료된 미완료 세션과 부분 파일 삭제 (삭제한 세션 수 반환)"""
+    if settings.upload_session_ttl_hours <= 0:
+        return 0
+    cutoff = datetime.utcnow() - timedelta(hours=settings.upload_session_ttl_hours)
+    result = await db.execute(
+        select(UploadSessionModel).where(
+            UploadSessionModel.completed_at.is_(None),
+            UploadSessionModel.updated_at < cutoff,
+        )
+    )
+    expired = list(result.scalars())
+    if expired:
+        await _delete_sessions(db, expired)
+        logger.info(f"Expired {len(expired)} abandoned upload sessions")
+    return len(expired)
+
+
+async def _delete_sessions(db: AsyncSession, sessions: List[UploadSessionModel]) -> None:
+    for session in sessions:
+        await asyncio.to_thread(_remove_part, Path(session.part_path))
+        await db.delete(session)
+    await db.commit()
+
+
+@router.post("/upload/sessions", response_model=UploadSessionResponse, status_code=201)
+async def create_upload_session(
+    request: UploadSessionCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    재개 가능한 업로드 세션 생성
+
+    Args:
+        request: 파일 이름, 전체 크기, MIME 타입, 선택적 SHA-256
+        db: 데이터베이스 세션
+
+    Returns:
+        UploadSessionResponse: 세션 ID와 권장 청크 크기
+
+    Raises:
+        HTTPException 400: 파일 크기 초과 또는 허용되지 않는 파일 유형
+    """
+    if request.size > settings.max_file_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"파일 '{request.filename}'의 크기가 최대 허용 크기({settings.max_file_size / 1024 / 1024:.0f}MB)를 초과합니다."
+        )
+    _validate_file_type(request.filename, request.mime_type)
+
+    # 방치된 세션 정리 (새 세션을 만들 때마다 수행)
+    await _expire_sessions(db)
+
+    session_id = str(uuid.uuid4())
+    session = UploadSessionModel(
+        id=session_id,
+        original_filename=request.filename,
+        mime_type=request.mime_type,
+        total_size=request.size,
+        received_bytes=0,
+        expected_sha256=request.sha256.lower() if request.sha256 else None,
+        part_path=str(settings.upload_dir / f"{session_id}.part"),
+    )
+    db.add(session)
+    await db.commit()
+
+    logger.info(f"Upload session created: {session_id} ({request.filename}, {request.size} bytes)")
+    return _session_response(session)
+
+
+@router.get("/upload/sessions/{session_id}", response_model=UploadSessionResponse)
+async def get_upload_session(session_id: str, db: AsyncSession = Depends(get_db)):
+    """업로드 세션 상태 조회 (received_bytes부터 이어서 전송)"""
+    return _session_response(await _get_session(db, session_id))
+
+
+@router.put("/upload/sessions/{session_id}", response_model=UploadSessionResponse)
+async def upload_session_chunk(
+    session_id: str,
+    request: Request,
+    content_range: Optional[str] = Header(default=None),
+    x_chunk_sha256: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    바이트 범위 업로드
+
+    요청 본문은 청크 원본 바이트이며, `Content-Range: bytes {start}-{end}/{total}` 헤더가 필요합니다.
+    `X-Chunk-SHA256` 헤더를 보내면 청크 체크섬을 검증합니다.
+    이미 받은 범위를 다시 보내면(재시도) 받은 부분은 건너뛴 것으로 처리됩니다.
+
+    Raises:
+        HTTPException 400: Content-Range 오류, 크기 불일치, 체크섬 불일치
+        HTTPException 409: 완료된 세션이거나 시작 위치가 수신 위치와 다른 경우
+    """
+    session = await _get_session(db, session_id)
+    if session.completed_at is not None:
+        raise HTTPException(status_code=409, detail="이미 완료된 업로드 세션입니다.")
+
+    try:
+        start, end, total = parse_content_range(content_range)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if total != session.total_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Content-Range 전체 크기({total})가 세션 크기({session.total_size})와 다릅니다."
+        )
+
+    received = session.received_bytes or 0
+    if end < received:
+        # 이미 받은 청크의 재전송 (응답 유실 후 재시도)
+        return _session_response(session)
+    if start != received:
+        raise HTTPException(
+            status_code=409,
+            detail=f"업로드는 {received} 바이트 위치부터 이어서 보내야 합니다."
+        )
+
+    part_path = Path(session.part_path)
+    try:
+        chunk_sha256 = await write_range(part_path, start, request.stream(), end - start + 1)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if x_chunk_sha256 and chunk_sha256 != x_chunk_sha256.lower():
+        # 잘못 받은 청크는 버리고 수신 위치 유지
+        await asyncio.to_thread(_truncate, part_path, start)
+        raise HTTPException(status_code=400, detail="청크 체크섬(X-Chunk-SHA256)이 일치하지 않습니다.")
+
+    session.received_bytes = end + 1
+    await db.commit()
+    return _session_response(session)
+
+
+@router.post("/upload/sessions/{session_id}/complete", response_model=UploadSessionResponse)
+async def complete_upload_session(
+    session_id: str,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    업로드 완료
+
+    모든 바이트를 받았는지 확인하고 전체 SHA-256을 검증한 뒤(세션 생성 시 전달한 경우)
+    부분 파일을 upload_dir의 최종 파일로 옮기고 UploadedFile을 생성합니다.
+    반환된 file_id는 `/transcribe` 요청의 file_ids에 사용합니다.
+    같은 세션에 대한 동시/반복 호출은 같은 결과를 반환합니다 (멱등).
+    전체 체크섬이 일치하지 않으면 받은 데이터를 버리고 세션을 0 바이트부터 다시 받도록 되돌립니다.
+
+    Raises:
+        HTTPException 400: 아직 받지 못한 바이트가 있거나 체크섬 불일치
+        HTTPException 409: 다른 프로세스가 완료 처리 중인 경우
+    """
+    lock = _complete_locks.get(session_id)
+    if lock is None:
+        lock = _complete_locks[session_id] = asyncio.Lock()
+
+    async with lock:
+        # 락을 기다리는 동안 다른 요청이 완료했을 수 있으므로 락 안에서 조회
+        session = await _get_session(db, session_id)
+        if session.completed_at is not None:
+            return _session_response(session)
+
+        if (session.received_bytes or 0) != session.total_size:
+            raise HTTPException(
+                status_code=400,
+                detail=f"업로드가 완료되지 않았습니다: {session.received_bytes}/{session.total_size} bytes"
+            )
+
+        part_path = Path(session.part_path)
+        content_hash = await asyncio.to_thread(hash_file, part_path)
+        if session.expected_sha256 and content_hash != session.expected_sha256:
+            # 어느 청크가 잘못되었는지 알 수 없으므로 처음부터 다시 받음
+            await asyncio.to_thread(_remove_part, part_path)
+            session.received_bytes = 0
+            await db.commit()
+            raise HTTPException(
+                status_code=400,
+                detail="파일 체크섬(sha256)이 일치하지 않습니다. 0 바이트부터 다시 업로드하세요."
+            )
+
+        file_id = str(uuid.uuid4())
+        storage_path = settings.upload_dir / f"{file_id}{Path(session.original_filename).suffix}"
+        try:
+            await asyncio.to_thread(os.replace, part_path, storage_path)
+        except FileNotFoundError:
+            # 다른 API 프로세스가 같은 세션을 먼저 완료함
+            await db.refresh(session)
+            if session.completed_at is not None:
+                return _session_response(session)
+            raise HTTPException(status_code=409, detail="업로드 세션을 다른 요청이 완료 처리 중입니다.")
+        duration = await asyncio.to_thread(probe_duration, storage_path)
+
+        db.add(UploadedFileModel(
+            id=file_id,
+            original_filename=session.original_filename,
+            storage_path=str(storage_path),
+            file_size=session.total_size,
+            duration=duration,
+            mime_type=session.mime_type,
+            content_hash=content_hash,
+            uploaded_at=datetime.utcnow(),
+        ))
+        session.file_id = file_id
+        session.completed_at = datetime.utcnow()
+        await db.commit()
+
+    logger.info(f"Upload session {session_id} completed: {session.original_filename} -> {storage_path}")
+
+    if settings.ingest_normalize:
+        background_tasks.add_task(normalize_uploaded_files, [file_id])
+    return _session_response(session)
+
+
+def _remove_part(path: Path) -> None:
+    path.unlink(missing_ok=True)
+
+
+def _truncate(path: Path, size: int) -> None:
+    with open(path, "r+b") as f:
+        f.truncate(size)
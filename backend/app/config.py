@@ -2,7 +2,7 @@
 애플리케이션 설정 관리
 Pydantic Settings를 사용한 환경 변수 관리
 """
-from typing import List
+from typing import Dict, List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 
@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     upload_dir: Path = Path("./storage/uploads")
     results_dir: Path = Path("./storage/results")
     temp_dir: Path = Path("./storage/temp")
+    result_cache_dir: Path = Path("./storage/cache")
+    # 모든 어댑터가 공유하는 모델 가중치 캐시 (`python -m app.prefetch`가 여기에 받고 경로를 고정)
+    model_cache_dir: Path = Path("./storage/models")
 
     # Hugging Face (스피커 분별용)
     huggingface_token: str = ""
@@ -40,6 +43,15 @@ class Settings(BaseSettings):
     # 파일 업로드 제한
     max_file_size: int = 524288000  # 500MB
     max_files: int = 10
+    # 업로드 스트리밍 청크 크기 (읽기/해시/쓰기 단위)
+    upload_chunk_size: int = 4194304  # 4MB
+    # 재개 가능한 업로드의 권장 청크 크기 (클라이언트 안내용)
+    resumable_chunk_size: int = 8388608  # 8MB
+    # 완료되지 않은 업로드 세션은 마지막 청크 이후 이 시간이 지나면 부분 파일과 함께 삭제 (0 = 무제한)
+    upload_session_ttl_hours: float = 24
+    # 업로드 후 16kHz 모노 16bit로 한 번 변환해 두고 이후 단계는 변환본 사용
+    ingest_normalize: bool = False
+    ingest_format: str = "flac"  # flac | wav (PCM s16le)
     # 업로드 허용 목록
     allowed_upload_exts: List[str] = [
         ".wav",
@@ -59,6 +71,83 @@ class Settings(BaseSettings):
     default_device: str = "cuda"
     max_concurrent_jobs: int = 3
 
+    # 모델 캐시 예산 (0 = 무제한). 초과 시 고정되지 않은 모델을 LRU 순서로 제거
+    model_cache_max_models: int = 4
+    model_cache_max_ram_bytes: int = 0
+    model_cache_max_vram_bytes: int = 0
+    # LRU 제거 대상에서 제외할 캐시 키 (예: "faster_whisper_large-v3_cuda_float16")
+    model_cache_pinned: List[str] = []
+    # 예산을 채운 모델이 모두 사용 중이거나 임대할 레플리카가 모두 사용 중일 때
+    # 반환을 기다리는 최대 시간(초). 넘으면 로드/임대 실패
+    model_cache_wait_seconds: float = 300
+    # 로컬 캐시에서만 가중치를 로드 (허브 조회/다운로드 없음, 오프라인 워커용)
+    model_offline: bool = False
+    # 시작 시 미리 로드할 모델 ("model_type:model_size:device[:compute_type]")
+    # 예: ["faster_whisper:large-v3:cuda:float16"]
+    preload_models: List[str] = []
+    # 미리 로드한 모델로 짧은 무음 전사를 수행해 CUDA 커널 등을 워밍업
+    preload_warmup: bool = True
+
+    # 분별/정렬처럼 오디오를 다시 읽는 단계가 있으면 파일을 16kHz float32로 한 번만 디코딩해
+    # temp_dir에 두고 모든 단계가 메모리 맵으로 공유
+    shared_audio_decode: bool = True
+
+    # 스피커 분별 임베딩 추출 (길이가 비슷한 세그먼트를 묶어 한 번에 추론)
+    diarization_batch_size: int = 32
+    diarization_num_threads: int = 0  # 프로세스 시작 시 적용할 torch CPU 추론 스레드 수 (0 = torch 기본값)
+    # 작업 device가 cuda일 때 임베딩 ResNet을 half precision으로 실행
+    diarization_fp16: bool = False
+    # 임베딩 모델은 (디바이스, fp16)별로 프로세스 전역 캐시에 두고 작업 간 재사용
+    # 이 시간(초) 동안 쓰이지 않으면 언로드 (0 = 계속 유지)
+    diarization_model_idle_seconds: float = 600
+    # 계층적 군집화에 직접 넣을 최대 임베딩 수 (메모리 O(n^2))
+    # 초과하면 고르게 뽑은 부분집합을 군집화하고 나머지는 가장 가까운 중심에 배정 (0 = 제한 없음)
+    diarization_max_cluster_embeddings: int = 1000
+    # 분별 방식 (작업의 diarization.mode가 없을 때 사용)
+    # segment: ASR 세그먼트마다 임베딩 / window: 고정 길이 윈도우 임베딩을 군집화한 뒤
+    # 겹치는 시간으로 세그먼트·단어에 화자 배정 (ASR과 동시에 실행)
+    diarization_mode: str = "segment"
+    diarization_window_seconds: float = 1.5
+    diarization_window_hop_seconds: float = 0.75
+
+    # 작업 내 파일 병렬 처리 (모델이 동시 호출을 지원할 때만 적용)
+    max_parallel_files: int = 4
+    faster_whisper_num_workers: int = 1
+    # 전사 파라미터 batch_size > 1이면 VAD 구간을 배치로 디코딩 (faster-whisper BatchedInferencePipeline)
+    faster_whisper_batched: bool = True
+    # 캐시 키별 모델 레플리카 수 (모델 타입별, 기본 1). 예: {"faster_whisper": 2}
+    # 임대 시 가장 한가한 레플리카를 배정하여 같은 모델을 쓰는 작업들을 병렬 실행
+    model_replicas: Dict[str, int] = {}
+    # GPU 레플리카를 배치할 GPU 번호 (라운드로빈, 비어 있으면 모두 0번)
+    model_replica_device_indices: List[int] = []
+
+    # 작업 큐 (jobs 테이블 기반)
+    # embedded: API 프로세스가 직접 작업 처리 / worker: `python -m app.worker` 프로세스가 처리
+    job_dispatch_mode: str = "embedded"
+    job_lease_seconds: int = 120
+    job_heartbeat_interval: int = 30
+    job_poll_interval: float = 2.0
+    job_max_attempts: int = 3
+
+    # 파이프라인 단계별 스레드 수 (블로킹 추론을 이벤트 루프 밖에서 실행)
+    stage_workers: Dict[str, int] = {
+        "model_load": 2,
+        "decode": 2,
+        "asr": 3,
+        "diarization": 2,
+        "alignment": 1,
+        "postprocess": 2,
+        "write": 2,
+    }
+    # 파이프라인 단계 사이 큐 크기 (단계별로 앞서 준비해 둘 파일 수)
+    pipeline_queue_size: int = 2
+
+    # 전사 결과 캐시 (오디오 내용 해시 + 모델/파라미터 해시, 옵트인)
+    # 같은 오디오를 같은 설정으로 다시 요청하면 ASR/분별을 건너뛰고 결과 파일만 다시 생성
+    result_cache_enabled: bool = False
+    result_cache_max_bytes: int = 1073741824  # 1GB (0 = 무제한)
+    result_cache_max_age_days: float = 30  # 0 = 무제한
+
     # 외부 ASR 제공자 설정
     enable_google: bool = False
     google_project_id: str = ""
@@ -85,6 +174,8 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        # model_cache_* / model_replicas 등 "model_" 접두사 설정 허용
+        protected_namespaces=("settings_",),
     )
 
     def create_directories(self):
@@ -92,6 +183,8 @@ class Settings(BaseSettings):
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.result_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.model_cache_dir.mkdir(parents=True, exist_ok=True)
 
 
 # 전역 설정 인스턴스
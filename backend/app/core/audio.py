@@ -0,0 +1,236 @@
+"""
+디코딩된 오디오 아티팩트
+
+업로드 파일을 16kHz 모노 float32 PCM으로 한 번만 디코딩해 settings.temp_dir에 raw 파일로 저장하고,
+ASR/스피커 분별/정렬 단계가 모두 같은 파일을 메모리 맵(np.memmap)으로 복사 없이 읽도록 합니다.
+긴 mp4 업로드를 단계마다 다시 디코딩하던 비용을 제거합니다.
+"""
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import logging
+import shutil
+import subprocess
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+class DecodedAudio:
+    """
+    16kHz 모노 float32 PCM 아티팩트
+
+    **사용 예시:**
+    ```python
+    from app.core.audio import decode_audio
+
+    decoded = decode_audio("/path/to/video.mp4", "/tmp/job-1")
+    samples = decoded.samples              # np.memmap (읽기 전용, 복사 없음)
+    segment = decoded.slice(1.5, 3.0)      # 구간 뷰 (복사 없음)
+    decoded.cleanup()
+    ```
+    """
+
+    def __init__(self, path: Union[str, Path], source_path: Optional[str] = None):
+        """
+        Args:
+            path: raw float32 PCM 파일 경로
+            source_path: 원본 오디오 파일 경로 (로그용)
+        """
+        self.path = Path(path)
+        self.source_path = source_path
+        self.sample_rate = SAMPLE_RATE
+        self._samples: Optional[np.ndarray] = None
+
+    @property
+    def samples(self) -> np.ndarray:
+        """전체 샘플 (처음 접근 시 메모리 맵으로 열림)"""
+        if self._samples is None:
+            if self.path.stat().st_size == 0:
+                self._samples = np.zeros(0, dtype=np.float32)
+            else:
+                self._samples = np.memmap(self.path, dtype=np.float32, mode="r")
+        return self._samples
+
+    @property
+    def duration(self) -> float:
+        """길이 (초)"""
+        return len(self.samples) / self.sample_rate
+
+    def slice(self, start: float, end: float) -> np.ndarray:
+        """[start, end) 초 구간의 뷰 반환 (복사 없음)"""
+        return self.samples[int(start * self.sample_rate):int(end * self.sample_rate)]
+
+    def cleanup(self) -> None:
+        """메모리 맵을 닫고 아티팩트 파일 삭제"""
+        self._samples = None
+        self.path.unlink(missing_ok=True)
+
+
+def decode_audio(
+    source_path: str,
+    output_dir: Union[str, Path],
+    name: Optional[str] = None
+) -> DecodedAudio:
+    """
+    오디오/비디오 파일을 16kHz 모노 float32 raw PCM으로 디코딩
+
+    ffmpeg가 있으면 ffmpeg로 파일에 바로 디코딩하고(전체를 메모리에 올리지 않음),
+    없거나 실패하면 librosa로 디코딩합니다.
+
+    Args:
+        source_path: 원본 파일 경로
+        output_dir: 아티팩트를 저장할 디렉토리
+        name: 아티팩트 파일 이름 (확장자 제외, 기본값은 원본 파일 이름)
+
+    Returns:
+        DecodedAudio
+
+    Raises:
+        RuntimeError: 두 디코더 모두 실패한 경우
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    target = output_dir / f"{name or Path(source_path).stem}.f32"
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        try:
+            _decode_with_ffmpeg(ffmpeg, source_path, target)
+            return DecodedAudio(target, source_path)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"ffmpeg decode failed for {source_path}, falling back to librosa: {e}")
+
+    try:
+        _decode_with_librosa(source_path, target)
+    except Exception as e:
+        target.unlink(missing_ok=True)
+        raise RuntimeError(f"Failed to decode audio {source_path}: {e}") from e
+    return DecodedAudio(target, source_path)
+
+
+def probe_duration(path: Union[str, Path]) -> Optional[float]:
+    """
+    파일 길이(초) 조회 (헤더만 읽음)
+
+    soundfile(libsndfile)이 읽을 수 있는 형식은 바로 조회하고,
+    그 외(mp4, m4a 등)는 ffprobe가 있으면 사용합니다.
+
+    Returns:
+        길이(초), 알 수 없으면 None
+    """
+    try:
+        import soundfile
+
+        return float(soundfile.info(str(path)).duration)
+    except Exception:
+        pass
+
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe:
+        return None
+    try:
+        completed = subprocess.run(
+            [
+                ffprobe, "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(path),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        return float(completed.stdout.strip())
+    except (OSError, ValueError, subprocess.SubprocessError) as e:
+        logger.debug(f"Duration probe failed for {path}: {e}")
+        return None
+
+
+# 정규화 형식별 (확장자, ffmpeg 코덱, soundfile 서브타입)
+CANONICAL_FORMATS = {
+    "flac": (".flac", "flac", "PCM_16"),
+    "wav": (".wav", "pcm_s16le", "PCM_16"),
+}
+
+
+def transcode_canonical(
+    source_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    name: str,
+    fmt: str = "flac"
+) -> Tuple[Path, int]:
+    """
+    16kHz 모노 16bit 정규화 파일로 변환 (업로드 시 1회)
+
+    flac은 원본 컨테이너(mp4/mkv/m4a)보다 훨씬 작고 빠르게 디코딩되며,
+    wav(PCM s16le)는 헤더 뒤 `2 * 샘플 인덱스` 바이트 위치로 바로 탐색할 수 있습니다.
+
+    Args:
+        source_path: 원본 파일 경로
+        output_dir: 저장 디렉토리
+        name: 파일 이름 (확장자 제외)
+        fmt: "flac" 또는 "wav"
+
+    Returns:
+        (정규화 파일 경로, 샘플 수)
+
+    Raises:
+        ValueError: 지원하지 않는 형식
+        RuntimeError: 변환 실패
+    """
+    if fmt not in CANONICAL_FORMATS:
+        raise ValueError(f"Unsupported canonical format: {fmt} (expected one of {sorted(CANONICAL_FORMATS)})")
+    suffix, codec, subtype = CANONICAL_FORMATS[fmt]
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    target = output_dir / f"{name}{suffix}"
+
+    import soundfile
+
+    try:
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg:
+            subprocess.run(
+                [
+                    ffmpeg, "-nostdin", "-v", "error", "-y",
+                    "-i", str(source_path),
+                    "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE),
+                    "-c:a", codec, "-sample_fmt", "s16", str(target),
+                ],
+                check=True,
+                capture_output=True,
+            )
+        else:
+            import librosa
+
+            audio, _ = librosa.load(str(source_path), sr=SAMPLE_RATE, mono=True)
+            soundfile.write(str(target), audio, SAMPLE_RATE, subtype=subtype, format=fmt.upper())
+        sample_count = int(soundfile.info(str(target)).frames)
+    except Exception as e:
+        target.unlink(missing_ok=True)
+        raise RuntimeError(f"Failed to normalize {source_path}: {e}") from e
+    return target, sample_count
+
+
+def _decode_with_ffmpeg(ffmpeg: str, source_path: str, target: Path) -> None:
+    subprocess.run(
+        [
+            ffmpeg, "-nostdin", "-v", "error", "-y",
+            "-i", str(source_path),
+            "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE),
+            "-f", "f32le", str(target),
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+def _decode_with_librosa(source_path: str, target: Path) -> None:
+    import librosa
+
+    audio, _ = librosa.load(source_path, sr=SAMPLE_RATE, mono=True)
+    np.ascontiguousarray(audio, dtype=np.float32).tofile(target)
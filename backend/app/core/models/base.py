@@ -2,11 +2,34 @@
 ASR 모델 추상 베이스 클래스
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Whisper 계열 모델 크기별 대략적인 파라미터 수 (메모리 예산 추정용)
+_WHISPER_PARAM_COUNTS = {
+    "tiny": 39_000_000,
+    "base": 74_000_000,
+    "small": 244_000_000,
+    "medium": 769_000_000,
+    "large": 1_550_000_000,
+    "turbo": 809_000_000,
+}
+
+# 연산 타입별 파라미터당 바이트 수
+_BYTES_PER_PARAM = {
+    "int8": 1,
+    "int8_float16": 1,
+    "int8_float32": 1,
+    "float16": 2,
+    "bfloat16": 2,
+    "float32": 4,
+}
+
+# 가중치 외 런타임 버퍼(디코더 캐시, 워크스페이스 등)를 고려한 여유 배수
+_RUNTIME_OVERHEAD = 1.3
+
 
 class ASRModelBase(ABC):
     """
@@ -26,6 +49,15 @@ class ASRModelBase(ABC):
         self.device = device
         self.model: Optional[Any] = None
         self.is_loaded = False
+        # 하나의 인스턴스에서 동시에 실행 가능한 transcribe() 호출 수
+        # (기본 1: 백엔드가 동시 호출을 안전하게 지원하는 경우에만 하위 클래스에서 늘림)
+        self.max_concurrency = 1
+        # True면 transcribe()의 audio_path 자리에 16kHz 모노 float32 np.ndarray도 받음
+        # (TranscriptionService가 한 번 디코딩한 오디오를 재사용, app.core.audio 참고)
+        self.supports_array_input = False
+        # True면 transcribe_iter()가 세그먼트를 디코딩되는 대로 내보냄
+        # (기본 구현은 transcribe()가 끝난 뒤 한꺼번에 내보냄)
+        self.supports_streaming = False
 
     @abstractmethod
     def load_model(self) -> None:
@@ -72,6 +104,51 @@ class ASRModelBase(ABC):
         """
         pass
 
+    def transcribe_iter(
+        self,
+        audio_path: str,
+        language: Optional[str],
+        params: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        세그먼트 단위 전사 (선택)
+
+        디코딩되는 대로 세그먼트를 내보낼 수 있는 어댑터는 재정의하고
+        supports_streaming을 True로 설정합니다. 기본 구현은 transcribe() 결과의
+        segments를 차례로 내보냅니다. 인자는 transcribe()와 같습니다.
+
+        Yields:
+            {"start": float, "end": float, "text": str, "words": [...] (선택적)}
+        """
+        yield from self.transcribe(audio_path, language, params).get("segments", [])
+
+    def estimate_memory(self) -> Dict[str, int]:
+        """
+        모델이 차지할 메모리 추정 (ModelManager 메모리 예산용)
+
+        모델을 로드하기 전에도 호출할 수 있어야 합니다.
+        기본 구현은 Whisper 계열 크기표(모델 이름에 포함된 크기)와
+        compute_type으로 추정하며, 알 수 없는 모델이거나 원격 API 기반 모델은 0을 반환합니다.
+        정확한 값이 필요한 어댑터는 재정의합니다.
+
+        Returns:
+            {"ram_bytes": int, "vram_bytes": int}
+        """
+        name = str(self.model_size).lower()
+        params = 0
+        # "large-v3", "openai/whisper-small", "distil-large-v3" 등 이름 일부로 매칭
+        for size, count in sorted(_WHISPER_PARAM_COUNTS.items(), key=lambda kv: -len(kv[0])):
+            if size in name:
+                params = count
+                break
+
+        compute_type = str(getattr(self, "compute_type", "float16" if self.device == "cuda" else "float32"))
+        total = int(params * _BYTES_PER_PARAM.get(compute_type, 2) * _RUNTIME_OVERHEAD)
+
+        if self.device == "cuda":
+            return {"ram_bytes": 0, "vram_bytes": total}
+        return {"ram_bytes": total, "vram_bytes": 0}
+
     @abstractmethod
     def unload_model(self) -> None:
         """
@@ -3,15 +3,31 @@ FasterWhisper 모델 래퍼
 
 기존 woa/events.py::whisper_process 함수를 클래스 기반으로 리팩토링
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Union
 import gc
+import numpy as np
 import torch
 from faster_whisper import WhisperModel
 from app.core.models.base import ASRModelBase
+from app.core.models.weights import model_weight_store
+from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    # faster-whisper >= 1.1.0: VAD로 자른 구간을 배치로 디코딩하는 파이프라인
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # pragma: no cover
+    BatchedInferencePipeline = None
+
+
+def _describe_audio(audio: Any) -> str:
+    """로그용 오디오 설명 (경로 또는 디코딩된 배열)"""
+    if isinstance(audio, np.ndarray):
+        return f"<decoded audio: {len(audio) / 16000:.1f}s>"
+    return str(audio)
+
 
 class FasterWhisperModel(ASRModelBase):
     """
@@ -21,15 +37,32 @@ class FasterWhisperModel(ASRModelBase):
     기존 Gradio 앱의 whisper_process 로직을 그대로 재사용
     """
 
-    def __init__(self, model_size: str, device: str, compute_type: str = "float16"):
+    def __init__(
+        self,
+        model_size: str,
+        device: str,
+        compute_type: str = "float16",
+        num_workers: int = 1,
+        device_index: int = 0
+    ):
         """
         Args:
             model_size: 모델 크기 (tiny, base, small, medium, large, large-v3)
             device: 디바이스 (cpu, cuda)
             compute_type: 연산 타입 (int8, float32, float16)
+            num_workers: CTranslate2 워커 수 (동시 transcribe() 호출 허용 수)
+            device_index: 사용할 GPU 번호 (레플리카를 여러 GPU에 나눌 때 사용)
         """
         super().__init__(model_size, device)
         self.compute_type = compute_type if device == "cuda" else "int8"
+        self.num_workers = max(1, int(num_workers))
+        self.device_index = int(device_index)
+        # CTranslate2는 num_workers만큼 동시 호출을 병렬 처리
+        self.max_concurrency = self.num_workers
+        # WhisperModel.transcribe()는 16kHz float32 배열을 직접 받음
+        self.supports_array_input = True
+        # segments가 지연 제너레이터이므로 transcribe_iter()가 디코딩 도중 세그먼트를 내보냄
+        self.supports_streaming = True
 
     def load_model(self) -> None:
         """
@@ -40,7 +73,7 @@ class FasterWhisperModel(ASRModelBase):
         try:
             logger.info(
                 f"Loading FasterWhisper: {self.model_size} "
-                f"on {self.device} (compute_type={self.compute_type})"
+                f"on {self.device}:{self.device_index} (compute_type={self.compute_type}, num_workers={self.num_workers})"
             )
 
             # GPU 메모리 정리 (기존 woa/events.py:132-133)
@@ -49,10 +82,16 @@ class FasterWhisperModel(ASRModelBase):
                 torch.cuda.empty_cache()
 
             # 모델 로드 (기존 woa/events.py:136)
+            # 프리페치로 고정된 경로가 있으면 허브 조회 없이 디스크에서 바로 로드
+            model_path = model_weight_store.resolve("faster_whisper", self.model_size) or self.model_size
             self.model = WhisperModel(
-                self.model_size,
+                model_path,
                 device=self.device,
-                compute_type=self.compute_type
+                device_index=self.device_index,
+                compute_type=self.compute_type,
+                num_workers=self.num_workers,
+                download_root=str(model_weight_store.directory),
+                local_files_only=model_weight_store.offline
             )
 
             self.is_loaded = True
@@ -64,17 +103,17 @@ class FasterWhisperModel(ASRModelBase):
 
     def transcribe(
         self,
-        audio_path: str,
+        audio_path: Union[str, np.ndarray],
         language: Optional[str],
         params: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        전사 수행
+        전사 수행 (transcribe_iter() 결과를 모두 모아 반환)
 
         기존 코드: woa/events.py:116-141
 
         Args:
-            audio_path: 오디오 파일 경로
+            audio_path: 오디오 파일 경로 또는 16kHz 모노 float32 배열
             language: 언어 힌트 (예: "ko", None이면 자동 감지)
             params: 전사 파라미터 딕셔너리
 
@@ -82,50 +121,149 @@ class FasterWhisperModel(ASRModelBase):
             전사 결과 딕셔너리
             {
                 "segments": [
-                    {"start": float, "end": float, "text": str},
+                    {"start": float, "end": float, "text": str, "words": [...] (word_timestamps일 때)},
                     ...
                 ]
             }
         """
+        try:
+            result = {"segments": list(self.transcribe_iter(audio_path, language, params))}
+            logger.info(f"Transcription completed: {len(result['segments'])} segments")
+            return result
+
+        except Exception as e:
+            logger.error(f"Transcription failed for {_describe_audio(audio_path)}: {e}")
+            raise
+
+    def transcribe_iter(
+        self,
+        audio_path: Union[str, np.ndarray],
+        language: Optional[str],
+        params: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        디코딩되는 대로 세그먼트를 내보내는 전사
+
+        faster-whisper의 segments 제너레이터를 그대로 따라가므로 첫 세그먼트는
+        첫 30초 창(배치 모드는 첫 배치)이 디코딩되자마자 나옵니다.
+        배치 파이프라인을 쓸 수 없으면(Silero VAD의 onnxruntime 없음 등) 순차 디코딩으로 대체합니다.
+
+        Yields:
+            {"start": float, "end": float, "text": str,
+             "words": [{"word", "start", "end", "score"}, ...] (word_timestamps일 때)}
+        """
         if not self.is_loaded:
             self.load_model()
 
-        try:
-            logger.info(f"Transcribing: {audio_path}")
-
-            # ASR 옵션 구성 (기존 woa/events.py:116-128)
-            asr_options = {
-                "beam_size": params.get("beam_size", 5),
-                "patience": None if params.get("patience", 0) == 0 else params["patience"],
-                "length_penalty": None if params.get("length_penalty", 0) == 0 else params["length_penalty"],
-                "temperatures": params.get("temperature", 0),
-                "compression_ratio_threshold": params.get("compression_ratio_threshold", 2.4),
-                "log_prob_threshold": params.get("logprob_threshold", -1),
-                "no_speech_threshold": params.get("no_speech_threshold", 0.6),
-                "condition_on_previous_text": params.get("condition_on_previous_text", False),
-                "initial_prompt": params.get("initial_prompt") or None,
-                "suppress_tokens": [-1],
-                "suppress_numerals": True,
-            }
+        # format_segment_largev3 함수는 woa/utils.py에서 가져옴 (기존 woa/events.py:140)
+        from woa.utils import format_segment_largev3
 
-            # 전사 수행 (기존 woa/events.py:139)
-            segments, info = self.model.transcribe(
-                audio_path,
-                language=language,
-                **asr_options
-            )
+        logger.info(f"Transcribing: {_describe_audio(audio_path)}")
+        asr_options = self._asr_options(params)
+        batch_size = self.effective_batch_size(params)
 
-            # 결과 포맷팅 (기존 woa/events.py:140)
-            # format_output_largev3 함수는 woa/utils.py에서 가져옴
-            from woa.utils import format_output_largev3
-            result = format_output_largev3(segments)
+        if batch_size > 1:
+            started = False
+            try:
+                for segment in self._transcribe_batched(audio_path, language, asr_options, params, batch_size):
+                    started = True
+                    yield format_segment_largev3(segment)
+                return
+            except ImportError as e:
+                # 배치 파이프라인 의존성이 없는 경우만 대체 (다른 오류는 그대로 실패)
+                # 이미 내보낸 세그먼트가 있으면 되돌릴 수 없으므로 그대로 실패
+                if started:
+                    raise
+                logger.warning(f"Batched transcription unavailable, falling back to sequential decoding: {e}")
 
-            logger.info(f"Transcription completed: {len(result['segments'])} segments")
-            return result
+        # 전사 수행 (기존 woa/events.py:139)
+        segments, info = self.model.transcribe(
+            audio_path,
+            language=language,
+            **asr_options
+        )
+        for segment in segments:
+            yield format_segment_largev3(segment)
 
-        except Exception as e:
-            logger.error(f"Transcription failed for {audio_path}: {e}")
-            raise
+    @staticmethod
+    def _asr_options(params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        WhisperModel.transcribe() 옵션 구성
+
+        기존 코드: woa/events.py:116-128
+        patience/length_penalty는 0이면 faster-whisper 기본값을 사용합니다.
+        """
+        asr_options = {
+            "beam_size": params.get("beam_size", 5),
+            "temperature": params.get("temperature", 0),
+            "compression_ratio_threshold": params.get("compression_ratio_threshold", 2.4),
+            "log_prob_threshold": params.get("logprob_threshold", -1),
+            "no_speech_threshold": params.get("no_speech_threshold", 0.6),
+            "condition_on_previous_text": params.get("condition_on_previous_text", False),
+            "initial_prompt": params.get("initial_prompt") or None,
+            "suppress_tokens": [-1],
+            # 디코딩 중 cross-attention으로 단어 경계를 계산 (별도 정렬 패스 없음)
+            "word_timestamps": bool(params.get("word_timestamps", False)),
+        }
+        if params.get("patience", 0):
+            asr_options["patience"] = params["patience"]
+        if params.get("length_penalty", 0):
+            asr_options["length_penalty"] = params["length_penalty"]
+        return asr_options
+
+    @staticmethod
+    def effective_batch_size(params: Dict[str, Any]) -> int:
+        """
+        배치 디코딩에 사용할 배치 크기 (1이면 기존 순차 디코딩)
+
+        faster_whisper_batched 설정과 BatchedInferencePipeline 사용 가능 여부를 반영하므로
+        결과 캐시 키도 이 값으로 배치 디코딩 여부를 판단합니다.
+        """
+        if not settings.faster_whisper_batched or BatchedInferencePipeline is None:
+            return 1
+        try:
+            return max(1, int(params.get("batch_size", 1)))
+        except (TypeError, ValueError):
+            return 1
+
+    def _transcribe_batched(
+        self,
+        audio: Union[str, np.ndarray],
+        language: Optional[str],
+        asr_options: Dict[str, Any],
+        params: Dict[str, Any],
+        batch_size: int
+    ):
+        """
+        VAD 구간 배치 디코딩
+
+        Silero VAD로 파일을 최대 30초의 음성 구간으로 자르고, 구간들을 batch_size개씩
+        한 번에 디코딩한 뒤 전역 타임스탬프로 이어 붙입니다 (긴 파일에서 GPU 처리량 향상).
+        이전 구간 텍스트에 조건을 걸 수 없으므로 condition_on_previous_text는 적용되지 않습니다.
+
+        Returns:
+            faster-whisper 세그먼트 이터레이터
+        """
+        options = {k: v for k, v in asr_options.items() if k != "condition_on_previous_text"}
+        # 파이프라인은 모델을 감싸기만 하므로 호출마다 생성 (동시 호출 간 상태 공유 없음)
+        pipeline = BatchedInferencePipeline(model=self.model)
+        segments, info = pipeline.transcribe(
+            audio,
+            language=language,
+            batch_size=batch_size,
+            vad_filter=True,
+            # faster-whisper 1.1.0 Silero VadOptions: onset → threshold, offset → neg_threshold
+            vad_parameters={
+                "threshold": params.get("vad_onset", 0.5),
+                "neg_threshold": params.get("vad_offset", 0.363),
+                "min_silence_duration_ms": 160,
+            },
+            # 구간당 한 세그먼트가 아니라 문장 단위 타임스탬프 세그먼트
+            without_timestamps=False,
+            **options
+        )
+        logger.info(f"Batched transcription: batch_size={batch_size}")
+        return segments
 
     def unload_model(self) -> None:
         """
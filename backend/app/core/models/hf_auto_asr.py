@@ -5,6 +5,7 @@ import gc
 import logging
 
 from app.core.models.base import ASRModelBase
+from app.core.models.weights import model_weight_store
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,9 @@ class HFAutoASRModel(ASRModelBase):
 
             self._torch = torch
             model_id = self.model_size
+            # 프리페치로 고정된 스냅샷이 있으면 그 경로에서, 없으면 공용 캐시(오프라인이면 로컬 전용)에서 로드
+            model_path = model_weight_store.resolve("hf_auto_asr", model_id) or model_id
+            hub_kwargs = model_weight_store.hub_kwargs()
             use_cuda = self.device == "cuda" and torch.cuda.is_available()
             device_index = 0 if use_cuda else -1
             torch_dtype = torch.float16 if use_cuda else torch.float32
@@ -42,10 +46,11 @@ class HFAutoASRModel(ASRModelBase):
             errors: List[str] = []
 
             try:
-                processor = AutoProcessor.from_pretrained(model_id)
+                processor = AutoProcessor.from_pretrained(model_path, **hub_kwargs)
                 model = AutoModelForSpeechSeq2Seq.from_pretrained(
-                    model_id,
+                    model_path,
                     torch_dtype=torch_dtype,
+                    **hub_kwargs,
                 )
                 if use_cuda:
                     model.to("cuda")
@@ -70,10 +75,11 @@ class HFAutoASRModel(ASRModelBase):
                 errors.append(f"seq2seq load failed: {exc}")
 
             try:
-                processor = AutoProcessor.from_pretrained(model_id)
+                processor = AutoProcessor.from_pretrained(model_path, **hub_kwargs)
                 model = AutoModelForCTC.from_pretrained(
-                    model_id,
+                    model_path,
                     torch_dtype=torch_dtype,
+                    **hub_kwargs,
                 )
                 if use_cuda:
                     model.to("cuda")
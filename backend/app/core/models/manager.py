@@ -3,9 +3,14 @@
 
 매 요청마다 모델을 재로드하지 않고 메모리에 캐싱하여 재사용
 """
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from importlib import import_module
-from typing import Dict, Optional, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
+import asyncio
 import threading
+import time
 import logging
 from app.core.models.base import ASRModelBase
 from app.core.models.faster_whisper import FasterWhisperModel
@@ -38,14 +43,126 @@ RivaASRModel = _load_optional_model("app.core.models.riva_asr", "RivaASRModel")
 HFAutoASRModel = _load_optional_model("app.core.models.hf_auto_asr", "HFAutoASRModel")
 
 
+@dataclass
+class _CacheEntry:
+    """캐시된 모델(레플리카 풀)과 메모리/사용 정보"""
+    model_type: str
+    replicas: List[ASRModelBase]
+    ram_bytes: int
+    vram_bytes: int
+    pinned: bool
+    loaded_at: float
+    last_used: float
+    # 레플리카별로 현재 사용 중인 임대(lease) 수
+    replica_refs: List[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.replica_refs:
+            self.replica_refs = [0] * len(self.replicas)
+
+    @property
+    def model(self) -> ASRModelBase:
+        """대표 레플리카 (임대 없이 get_model()로 조회할 때 사용)"""
+        return self.replicas[0]
+
+    @property
+    def refs(self) -> int:
+        """전체 레플리카의 임대 수 합계"""
+        return sum(self.replica_refs)
+
+    @property
+    def capacity(self) -> int:
+        """동시에 내줄 수 있는 임대 수 (레플리카별 max_concurrency 합계)"""
+        return sum(self.replica_capacity(i) for i in range(len(self.replicas)))
+
+    def replica_capacity(self, index: int) -> int:
+        """레플리카가 동시에 처리할 수 있는 호출 수 (예: CTranslate2 num_workers)"""
+        concurrency = getattr(self.replicas[index], "max_concurrency", 1)
+        return max(1, concurrency) if isinstance(concurrency, int) else 1
+
+    def checkout(self) -> Optional[int]:
+        """
+        여유가 있는 레플리카 중 임대 수가 가장 적은 것을 골라 임대 수 증가
+
+        Returns:
+            레플리카 인덱스 (모든 레플리카가 max_concurrency만큼 사용 중이면 None)
+        """
+        free = [
+            i for i in range(len(self.replicas))
+            if self.replica_refs[i] < self.replica_capacity(i)
+        ]
+        if not free:
+            return None
+        index = min(free, key=lambda i: self.replica_refs[i])
+        self.replica_refs[index] += 1
+        return index
+
+    def unload(self) -> None:
+        """모든 레플리카 언로드"""
+        for replica in self.replicas:
+            replica.unload_model()
+
+
+class _PendingLoad:
+    """진행 중인 모델 로드 (같은 키의 동시 요청은 이 로드 완료를 기다림)"""
+
+    def __init__(self, ram_bytes: int = 0, vram_bytes: int = 0):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+        self.ram_bytes = ram_bytes
+        self.vram_bytes = vram_bytes
+        # 예산 자리를 확보했는지 여부 (확보 전인 로드는 다른 로드의 예산 계산에서 제외)
+        self.reserved = False
+
+
+class ModelLease:
+    """
+    모델 임대 (참조 카운트)
+
+    임대는 레플리카의 실행 슬롯을 독점합니다 (레플리카마다 max_concurrency개).
+    임대가 반환되기 전까지는 캐시 정리/LRU 제거가 일어나도 모델이 언로드되지 않습니다.
+    컨텍스트 매니저로 사용하거나 `release()`를 직접 호출합니다.
+    """
+
+    def __init__(self, manager: "ModelManager", key: str, entry: _CacheEntry, replica: int = 0):
+        self._manager = manager
+        self._entry: Optional[_CacheEntry] = entry
+        self.key = key
+        self.replica = replica
+        self.model = entry.replicas[replica]
+        # 같은 키로 동시에 유지할 수 있는 임대 수 (파일 병렬 처리 수 결정에 사용)
+        self.capacity = entry.capacity
+
+    def release(self) -> None:
+        """임대 반환 (여러 번 호출해도 한 번만 반영)"""
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._manager._release(entry, self.replica)
+
+    def __enter__(self) -> ASRModelBase:
+        return self.model
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
 class ModelManager:
     """
     싱글톤 모델 관리자
 
     **주요 기능:**
     - 모델을 메모리에 캐싱하여 재사용 (성능 3-5배 향상)
-    - 스레드 안전성 보장 (RLock 사용)
+    - 스레드 안전성 보장 (RLock은 캐시 조회/갱신에만 사용)
+    - 키별 단일 로드(single-flight): 같은 키의 동시 요청은 하나의 로드를 기다리고,
+      다른 키(이미 캐시된 모델 포함) 요청은 로드 중에도 즉시 진행
     - GPU 메모리 효율적 관리
+    - 메모리 예산 기반 LRU 제거 (model_cache_max_models / max_ram_bytes / max_vram_bytes).
+      사용 중인 모델은 제거하지 않고, 예산이 빌 때까지 로드를 대기 (model_cache_wait_seconds)
+    - 자주 쓰는 모델 고정(pin): 고정된 모델은 LRU 제거 대상에서 제외
+    - 참조 카운트 임대(lease): 사용 중인 모델은 마지막 임대가 반환된 뒤에 언로드
+    - 키별 레플리카 풀 (model_replicas): 임대는 빈 레플리카 슬롯을 독점하고(레플리카마다
+      max_concurrency개), 모두 사용 중이면 반환될 때까지 대기. 같은 모델을 쓰는 파일/작업들이
+      레플리카 수만큼 병렬 실행 (GPU 레플리카는 model_replica_device_indices에 분산)
 
     **사용 예시:**
     ```python
@@ -54,9 +171,19 @@ class ModelManager:
     # 모델 가져오기 (처음에는 로드, 이후에는 캐시에서)
     model = model_manager.get_model("faster_whisper", "large-v3", "cuda")
 
+    # 비동기 코드에서는 이벤트 루프를 막지 않는 버전 사용
+    model = await model_manager.aget_model("faster_whisper", "large-v3", "cuda")
+
     # 전사 수행
     result = model.transcribe("/path/to/audio.mp3", "ko", {...})
 
+    # 작업 도중 캐시 정리/제거로 언로드되지 않도록 임대해서 사용
+    with model_manager.lease("faster_whisper", "large-v3", "cuda") as model:
+        result = model.transcribe("/path/to/audio.mp3", "ko", {...})
+
+    async with model_manager.alease("faster_whisper", "large-v3", "cuda") as model:
+        ...
+
     # 캐시 정리 (필요시)
     model_manager.clear_cache("faster_whisper")
     ```
@@ -83,10 +210,33 @@ class ModelManager:
         if hasattr(self, "_initialized") and self._initialized:
             return
 
-        self._models: Dict[str, ASRModelBase] = {}
+        # LRU 순서 유지 (가장 최근 사용한 모델이 마지막)
+        self._models: "OrderedDict[str, _CacheEntry]" = OrderedDict()
         self._model_lock = threading.RLock()
+        self._loading: Dict[str, _PendingLoad] = {}
+        # 임대 반환/로드 완료 알림 (예산이 빌 때까지 기다리는 로드가 사용)
+        self._released = threading.Condition(self._model_lock)
+        # 캐시에서 제거되었지만 임대 중이라 언로드를 미룬 모델
+        self._draining: List[_CacheEntry] = []
+        self._pinned_keys = set(settings.model_cache_pinned)
         self._initialized = True
 
+    @staticmethod
+    def make_key(
+        model_type: str,
+        model_size: str,
+        device: str,
+        compute_type: str = "float16"
+    ) -> str:
+        """
+        캐시 키 생성
+
+        compute_type은 FasterWhisper에서만 키에 포함됩니다.
+        """
+        if model_type == "faster_whisper":
+            return f"{model_type}_{model_size}_{device}_{compute_type}"
+        return f"{model_type}_{model_size}_{device}"
+
     def get_model(
         self,
         model_type: str,
@@ -114,31 +264,366 @@ class ModelManager:
 
         Raises:
             ValueError: 알 수 없는 모델 타입
+            RuntimeError: 고정되지 않은 모델을 모두 제거해도 메모리 예산을 넘거나,
+                예산 안의 모델이 model_cache_wait_seconds 동안 계속 사용 중인 경우
+
+        Note:
+            반환된 모델은 임대되지 않으므로 clear_cache() 등으로 언로드될 수 있습니다.
+            작업 중 계속 사용할 모델은 lease()/alease()로 가져오세요.
         """
-        # 캐시 키 생성
-        if model_type == "faster_whisper":
-            key = f"{model_type}_{model_size}_{device}_{compute_type}"
-        else:
-            key = f"{model_type}_{model_size}_{device}"
+        key = self.make_key(model_type, model_size, device, compute_type)
+        entry, _ = self._get_entry(key, model_type, model_size, device, compute_type)
+        return entry.model
+
+    def lease(
+        self,
+        model_type: str,
+        model_size: str,
+        device: str,
+        compute_type: str = "float16"
+    ) -> ModelLease:
+        """
+        모델 임대 (캐시에 없으면 새로 로드)
+
+        임대가 반환될 때까지 모델은 언로드되지 않습니다.
+        인자와 예외는 get_model()과 같습니다.
+
+        Returns:
+            ModelLease (컨텍스트 매니저로 사용하면 모델 인스턴스를 반환)
+        """
+        key = self.make_key(model_type, model_size, device, compute_type)
+        entry, replica = self._get_entry(key, model_type, model_size, device, compute_type, acquire=True)
+        return ModelLease(self, key, entry, replica)
+
+    @asynccontextmanager
+    async def alease(
+        self,
+        model_type: str,
+        model_size: str,
+        device: str,
+        compute_type: str = "float16"
+    ) -> AsyncIterator[ASRModelBase]:
+        """lease()의 비동기 컨텍스트 매니저 버전 (로드는 워커 스레드에서 수행)"""
+        lease = await asyncio.to_thread(
+            self.lease, model_type, model_size, device, compute_type
+        )
+        try:
+            yield lease.model
+        finally:
+            lease.release()
+
+    def _get_entry(
+        self,
+        key: str,
+        model_type: str,
+        model_size: str,
+        device: str,
+        compute_type: str,
+        acquire: bool = False
+    ) -> Tuple[_CacheEntry, int]:
+        """
+        캐시 항목 조회/로드
+
+        Returns:
+            (캐시 항목, 레플리카 인덱스). acquire=True면 해당 레플리카의 임대 수 증가
+
+        Raises:
+            RuntimeError: acquire=True이고 model_cache_wait_seconds 안에 빈 레플리카가 없는 경우
+        """
+        deadline: Optional[float] = None
+        while True:
+            with self._model_lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    replica = entry.checkout() if acquire else 0
+                    if replica is None:
+                        # 모든 레플리카가 사용 중: 반환을 기다린 뒤 다시 조회 (그 사이 제거될 수 있음)
+                        deadline = self._wait_for_release(
+                            deadline, f"a free replica of {key}"
+                        )
+                        continue
+                    logger.info(f"Using cached model: {key}")
+                    entry.last_used = time.monotonic()
+                    self._models.move_to_end(key)
+                    return entry, replica
+
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = _PendingLoad()
+                    self._loading[key] = pending
+                    break
+
+            # 다른 스레드가 같은 모델을 로드 중: 완료 후 캐시에서 다시 조회
+            logger.info(f"Waiting for in-flight load: {key}")
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+
+        try:
+            return self._load(key, model_type, model_size, device, compute_type, pending, acquire)
+        except BaseException as exc:
+            pending.error = exc
+            raise
+        finally:
+            with self._model_lock:
+                self._loading.pop(key, None)
+                self._released.notify_all()
+            pending.done.set()
+
+    async def aget_model(
+        self,
+        model_type: str,
+        model_size: str,
+        device: str,
+        compute_type: str = "float16"
+    ) -> ASRModelBase:
+        """
+        get_model()의 비동기 버전
+
+        모델 로드(수 초~수 분)를 워커 스레드에서 수행하여 이벤트 루프를 막지 않습니다.
+        """
+        return await asyncio.to_thread(
+            self.get_model, model_type, model_size, device, compute_type
+        )
+
+    def _load(
+        self,
+        key: str,
+        model_type: str,
+        model_size: str,
+        device: str,
+        compute_type: str,
+        pending: _PendingLoad,
+        acquire: bool = False
+    ) -> Tuple[_CacheEntry, int]:
+        """
+        모델(레플리카 전체) 생성/로드 후 캐시에 등록 (캐시 락 밖에서 로드)
 
+        예상 메모리는 로드 전에 예약하여, 동시에 진행되는 다른 키의 로드와
+        합쳐서 예산을 넘지 않도록 합니다.
+        """
+        num_replicas = self._replica_count(model_type)
+        logger.info(f"Loading new model: {key} (replicas={num_replicas})")
+        replicas = [
+            self._create_model(
+                model_type, model_size, device, compute_type,
+                device_index=self._replica_device_index(device, idx)
+            )
+            for idx in range(num_replicas)
+        ]
+        memory = {
+            name: value * num_replicas
+            for name, value in self._estimate_memory(replicas[0]).items()
+        }
+
+        # 로드 전에 예상 메모리만큼 자리 확보 (OOM 방지)
         with self._model_lock:
-            if key not in self._models:
-                logger.info(f"Loading new model: {key}")
-                model = self._create_model(model_type, model_size, device, compute_type)
-                model.load_model()
-                self._models[key] = model
-                logger.info(f"Model cached: {key} (total cached: {len(self._models)})")
-            else:
-                logger.info(f"Using cached model: {key}")
+            self._evict_for(key, memory["ram_bytes"], memory["vram_bytes"])
+            pending.ram_bytes = memory["ram_bytes"]
+            pending.vram_bytes = memory["vram_bytes"]
+            pending.reserved = True
+
+        loaded: List[ASRModelBase] = []
+        try:
+            for replica in replicas:
+                replica.load_model()
+                loaded.append(replica)
+        except BaseException:
+            for replica in loaded:
+                replica.unload_model()
+            raise
+
+        now = time.monotonic()
+        entry = _CacheEntry(
+            model_type=model_type,
+            replicas=replicas,
+            ram_bytes=memory["ram_bytes"],
+            vram_bytes=memory["vram_bytes"],
+            pinned=key in self._pinned_keys,
+            loaded_at=now,
+            last_used=now,
+        )
+        replica = entry.checkout() if acquire else 0
+        with self._model_lock:
+            self._models[key] = entry
+            logger.info(
+                f"Model cached: {key} (total cached: {len(self._models)}, "
+                f"ram={memory['ram_bytes'] / 1024 ** 2:.0f}MB, vram={memory['vram_bytes'] / 1024 ** 2:.0f}MB)"
+            )
+        return entry, replica
+
+    @staticmethod
+    def _replica_count(model_type: str) -> int:
+        """모델 타입별 레플리카 수 (settings.model_replicas, 기본 1)"""
+        try:
+            return max(1, int(settings.model_replicas.get(model_type, 1)))
+        except (AttributeError, TypeError, ValueError):
+            return 1
+
+    @staticmethod
+    def _replica_device_index(device: str, replica: int) -> int:
+        """GPU 레플리카를 model_replica_device_indices에 라운드로빈으로 배치"""
+        if device != "cuda":
+            return 0
+        try:
+            indices = [int(i) for i in settings.model_replica_device_indices]
+        except (AttributeError, TypeError, ValueError):
+            return 0
+        return indices[replica % len(indices)] if indices else 0
+
+    @staticmethod
+    def _estimate_memory(model: ASRModelBase) -> Dict[str, int]:
+        """모델 메모리 추정값 조회 (추정 불가 시 0)"""
+        try:
+            estimate = model.estimate_memory()
+        except Exception as exc:
+            logger.debug(f"Memory estimate failed: {exc}")
+            estimate = None
+
+        if not isinstance(estimate, dict):
+            return {"ram_bytes": 0, "vram_bytes": 0}
+        return {
+            "ram_bytes": int(estimate.get("ram_bytes", 0) or 0),
+            "vram_bytes": int(estimate.get("vram_bytes", 0) or 0),
+        }
+
+    def _evict_for(self, key: str, ram_bytes: int, vram_bytes: int) -> None:
+        """
+        새 모델이 들어갈 자리를 만들 때까지 LRU 순서로 고정되지 않은 모델 제거
+
+        사용 중(임대 중)인 모델은 제거하지 않으며, 캐시에서 빠졌지만 아직 언로드되지 않은
+        draining 모델과 자리를 확보한 다른 키의 로드도 예산에 포함합니다. 남은 후보가 모두
+        사용 중이거나 진행 중인 로드가 자리를 차지하면 반환/로드 완료를 최대
+        model_cache_wait_seconds 동안 기다립니다.
+        _model_lock을 잡은 상태로 호출해야 합니다 (대기 중에는 락을 놓음).
+
+        Raises:
+            RuntimeError: 고정된 모델만으로 예산이 부족하거나, 대기 시간 안에 예산이 비지 않은 경우
+        """
+        max_models = settings.model_cache_max_models
+        max_ram = settings.model_cache_max_ram_bytes
+        max_vram = settings.model_cache_max_vram_bytes
+
+        def exceeds(resident: List[Any], in_flight: List[_PendingLoad]) -> bool:
+            used_ram = sum(e.ram_bytes for e in resident) + sum(p.ram_bytes for p in in_flight)
+            used_vram = sum(e.vram_bytes for e in resident) + sum(p.vram_bytes for p in in_flight)
+            return (
+                (max_models > 0 and len(resident) + len(in_flight) + 1 > max_models)
+                or (max_ram > 0 and used_ram + ram_bytes > max_ram)
+                or (max_vram > 0 and used_vram + vram_bytes > max_vram)
+            )
+
+        def over_budget() -> bool:
+            # 자리를 확보한 다른 로드와, 캐시에서 빠졌지만 임대 중이라 아직 메모리에 있는
+            # draining 모델도 포함 (같은 모델을 다시 로드하면 두 벌이 동시에 올라감)
+            resident = list(self._models.values()) + self._draining
+            in_flight = [p for k, p in self._loading.items() if k != key and p.reserved]
+            return exceeds(resident, in_flight)
+
+        deadline: Optional[float] = None
+        while over_budget():
+            candidates = [(k, e) for k, e in self._models.items() if not e.pinned]
+            victim = next((k for k, e in candidates if e.refs == 0), None)
+            if victim is not None:
+                logger.info(f"Evicting least recently used model: {victim}")
+                self._unload_entry(victim)
+                continue
+            # 고정된 모델은 제거되지 않으므로 기다려도 자리가 나지 않음
+            if exceeds([e for e in self._models.values() if e.pinned], []):
+                raise RuntimeError(
+                    f"Model cache budget exceeded: cannot load {key} "
+                    f"(ram={ram_bytes} bytes, vram={vram_bytes} bytes) without evicting pinned models"
+                )
+
+            # 남은 후보가 모두 사용 중이거나 draining 모델/진행 중인 로드가 예산을 차지:
+            # 제거/재로드하면 사용 중인 가중치 위에 새 모델이 올라가므로 반환/로드 완료를 기다림
+            try:
+                deadline = self._wait_for_release(deadline, f"model cache budget for {key}")
+            except RuntimeError:
+                raise RuntimeError(
+                    f"Model cache budget exhausted: cannot load {key} "
+                    f"(ram={ram_bytes} bytes, vram={vram_bytes} bytes); models stayed leased "
+                    f"or loading for {settings.model_cache_wait_seconds}s"
+                ) from None
+
+    def _wait_for_release(self, deadline: Optional[float], waiting_for: str) -> float:
+        """
+        임대 반환/로드 완료 알림을 기다림 (_model_lock을 잡은 상태로 호출, 대기 중에는 락을 놓음)
+
+        Args:
+            deadline: 대기 마감 시각 (None이면 지금부터 model_cache_wait_seconds)
+            waiting_for: 로그/예외 메시지용 설명
+
+        Returns:
+            다음 대기에 넘길 마감 시각
+
+        Raises:
+            RuntimeError: 마감 시각이 지난 경우
+        """
+        if deadline is None:
+            deadline = time.monotonic() + settings.model_cache_wait_seconds
+            logger.info(f"Waiting for {waiting_for}")
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(
+                f"Timed out after {settings.model_cache_wait_seconds}s waiting for {waiting_for}"
+            )
+        self._released.wait(remaining)
+        return deadline
+
+    def _unload_entry(self, key: str) -> None:
+        """
+        캐시에서 모델 제거 및 메모리 해제
+
+        임대 중인 모델은 캐시에서만 제거하고, 마지막 임대가 반환될 때 언로드합니다.
+        """
+        entry = self._models.pop(key)
+        if entry.refs > 0:
+            logger.info(f"Model {key} is in use ({entry.refs} leases); deferring unload")
+            self._draining.append(entry)
+            return
+        entry.unload()
 
-            return self._models[key]
+    def _release(self, entry: _CacheEntry, replica: int = 0) -> None:
+        """임대 반환 (캐시에서 제거된 모델이면 마지막 반환 시 언로드)"""
+        with self._model_lock:
+            entry.replica_refs[replica] -= 1
+            entry.last_used = time.monotonic()
+            self._released.notify_all()
+            if entry.refs > 0 or not any(e is entry for e in self._draining):
+                return
+            self._draining = [e for e in self._draining if e is not entry]
+            logger.info("Last lease released; unloading evicted model")
+            entry.unload()
+
+    def pin(self, key: str) -> None:
+        """
+        모델 고정 (LRU 제거 대상에서 제외)
+
+        아직 로드되지 않은 키도 고정할 수 있으며, 로드 시점에 적용됩니다.
+
+        Args:
+            key: make_key()로 생성한 캐시 키
+        """
+        with self._model_lock:
+            self._pinned_keys.add(key)
+            if key in self._models:
+                self._models[key].pinned = True
+
+    def unpin(self, key: str) -> None:
+        """모델 고정 해제"""
+        with self._model_lock:
+            self._pinned_keys.discard(key)
+            if key in self._models:
+                self._models[key].pinned = False
 
     def _create_model(
         self,
         model_type: str,
         model_size: str,
         device: str,
-        compute_type: str
+        compute_type: str,
+        device_index: int = 0
     ) -> ASRModelBase:
         """
         모델 인스턴스 생성
@@ -148,6 +633,7 @@ class ModelManager:
             model_size: 모델 크기
             device: 디바이스
             compute_type: 연산 타입
+            device_index: GPU 번호 (FasterWhisper 레플리카에서만 사용)
 
         Returns:
             ASR 모델 인스턴스
@@ -156,7 +642,13 @@ class ModelManager:
             ValueError: 알 수 없는 모델 타입
         """
         if model_type == "faster_whisper":
-            return FasterWhisperModel(model_size, device, compute_type)
+            return FasterWhisperModel(
+                model_size,
+                device,
+                compute_type,
+                num_workers=settings.faster_whisper_num_workers,
+                device_index=device_index
+            )
         elif model_type == "origin_whisper":
             return OriginWhisperModel(model_size, device)
         elif model_type == "fast_conformer":
@@ -214,6 +706,8 @@ class ModelManager:
         """
         모델 캐시 정리
 
+        임대 중인 모델은 캐시에서만 제거되고, 마지막 임대가 반환될 때 언로드됩니다.
+
         Args:
             model_type: 특정 타입만 정리 (None이면 전체 정리)
                 - "origin_whisper": Origin Whisper 모델만 정리
@@ -238,8 +732,7 @@ class ModelManager:
 
                 for key in keys_to_remove:
                     logger.info(f"Unloading model: {key}")
-                    self._models[key].unload_model()
-                    del self._models[key]
+                    self._unload_entry(key)
 
                 logger.info(
                     f"Cleared cache for model type: {model_type} "
@@ -248,27 +741,43 @@ class ModelManager:
             else:
                 # 전체 정리
                 count = len(self._models)
-                for model in self._models.values():
-                    model.unload_model()
-                self._models.clear()
+                for key in list(self._models.keys()):
+                    self._unload_entry(key)
 
                 logger.info(f"Cleared all model cache ({count} models removed)")
 
-    def get_cache_info(self) -> Dict[str, int]:
+    def get_cache_info(self) -> Dict[str, Any]:
         """
         캐시 정보 조회
 
         Returns:
-            모델 타입별 캐시된 모델 수
+            모델 타입별 캐시된 모델 수와 항목별 추정 메모리
             {
                 "origin_whisper": 1,
                 "faster_whisper": 2,
                 "fast_conformer": 0,
-                "total": 3
+                "hf_auto_asr": 0,
+                "total": 3,
+                "ram_bytes": int,
+                "vram_bytes": int,
+                "in_use": 1,      # 임대 중인 캐시 모델 수
+                "draining": 0,    # 캐시에서 제거되었지만 임대 반환을 기다리는 모델 수
+                "entries": {
+                    "faster_whisper_large-v3_cuda_float16": {
+                        "ram_bytes": 0,
+                        "vram_bytes": 4030000000,
+                        "pinned": False,
+                        "replicas": 2,
+                        "capacity": 2,    # 동시에 내줄 수 있는 임대 수
+                        "in_use": 2,
+                        "idle_seconds": 12.5
+                    },
+                    ...
+                }
             }
         """
         with self._model_lock:
-            info = {
+            info: Dict[str, Any] = {
                 "origin_whisper": 0,
                 "faster_whisper": 0,
                 "fast_conformer": 0,
@@ -286,6 +795,24 @@ class ModelManager:
                 elif key.startswith("hf_auto_asr"):
                     info["hf_auto_asr"] += 1
 
+            now = time.monotonic()
+            info["ram_bytes"] = sum(e.ram_bytes for e in self._models.values())
+            info["vram_bytes"] = sum(e.vram_bytes for e in self._models.values())
+            info["in_use"] = sum(1 for e in self._models.values() if e.refs > 0)
+            info["draining"] = len(self._draining)
+            info["entries"] = {
+                key: {
+                    "ram_bytes": entry.ram_bytes,
+                    "vram_bytes": entry.vram_bytes,
+                    "pinned": entry.pinned,
+                    "replicas": len(entry.replicas),
+                    "capacity": entry.capacity,
+                    "in_use": entry.refs,
+                    "idle_seconds": round(now - entry.last_used, 1),
+                }
+                for key, entry in self._models.items()
+            }
+
             return info
 
 
@@ -0,0 +1,209 @@
+"""
+모델 가중치 로컬 캐시
+
+모든 어댑터(faster-whisper, whisper-timestamped, HF AutoModel, 분별 임베딩)가 settings.model_cache_dir 한 곳에
+가중치를 내려받고, `python -m app.prefetch`로 미리 받아 둔 모델은 manifest.json에 로컬 경로를
+고정(pin)해 둡니다. 고정된 모델은 허브 조회 없이 해당 경로에서 바로 로드하며,
+settings.model_offline이면 고정되지 않은 모델도 로컬 캐시에서만 찾습니다 (네트워크 접근 없음).
+"""
+from pathlib import Path
+from typing import Any, Dict, Optional
+import json
+import logging
+import os
+import threading
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+# 프리페치를 지원하는 모델 타입 ("wespeaker"는 스피커 분별 임베딩 모델)
+PREFETCH_MODEL_TYPES = ("faster_whisper", "origin_whisper", "hf_auto_asr", "wespeaker")
+
+
+class ModelWeightStore:
+    """
+    모델 가중치 캐시 디렉토리와 고정 경로 매니페스트
+
+    **매니페스트 형식:**
+    {"faster_whisper:large-v3": "/.../models--Systran--faster-whisper-large-v3/snapshots/<rev>", ...}
+    """
+
+    def __init__(self, directory: Optional[Path] = None, offline: Optional[bool] = None):
+        """
+        Args:
+            directory: 캐시 디렉토리 (None이면 settings.model_cache_dir)
+            offline: 로컬 전용 로드 여부 (None이면 settings.model_offline)
+        """
+        self._directory = Path(directory) if directory is not None else None
+        self._offline = offline
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory if self._directory is not None else Path(settings.model_cache_dir)
+
+    @property
+    def offline(self) -> bool:
+        return settings.model_offline if self._offline is None else self._offline
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / MANIFEST_NAME
+
+    @staticmethod
+    def make_key(model_type: str, model_id: str) -> str:
+        return f"{model_type}:{model_id}"
+
+    def hub_kwargs(self) -> Dict[str, Any]:
+        """
+        허브 다운로드 함수(hf_hub_download, from_pretrained 등)에 넘길 공통 인자
+
+        Returns:
+            {"cache_dir": str, "local_files_only": bool}
+        """
+        return {"cache_dir": str(self.directory), "local_files_only": self.offline}
+
+    def resolve(self, model_type: str, model_id: str) -> Optional[str]:
+        """
+        고정된 로컬 경로 조회
+
+        Args:
+            model_type: 모델 타입 (PREFETCH_MODEL_TYPES 중 하나)
+            model_id: 모델 크기 또는 허브 저장소 ID
+
+        Returns:
+            로컬 경로 (고정되지 않았거나 경로가 사라졌으면 None)
+        """
+        path = self._read_manifest().get(self.make_key(model_type, model_id))
+        if path and os.path.exists(path):
+            return path
+        if path:
+            logger.warning(f"Pinned weights for {model_type}:{model_id} missing at {path}")
+        return None
+
+    def pin(self, model_type: str, model_id: str, path: str) -> None:
+        """로컬 경로를 매니페스트에 기록"""
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest[self.make_key(model_type, model_id)] = str(Path(path).resolve())
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # 동시에 읽는 프로세스가 반쯤 쓰인 파일을 보지 않도록 교체 방식으로 저장
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.manifest_path)
+
+    def prefetch(self, model_type: str, model_id: str, hf_token: Optional[str] = None) -> str:
+        """
+        가중치를 캐시 디렉토리로 내려받고 로컬 경로를 고정
+
+        Args:
+            model_type: 모델 타입 (PREFETCH_MODEL_TYPES 중 하나)
+            model_id: 모델 크기 또는 허브 저장소 ID
+            hf_token: HuggingFace Hub 토큰 (gated 모델용)
+
+        Returns:
+            고정된 로컬 경로
+
+        Raises:
+            ValueError: 지원하지 않는 모델 타입
+        """
+        if model_type == "faster_whisper":
+            path = self._download_faster_whisper(model_id)
+        elif model_type == "origin_whisper":
+            path = self._download_origin_whisper(model_id)
+        elif model_type == "hf_auto_asr":
+            path = self._download_snapshot(model_id, hf_token)
+        elif model_type == "wespeaker":
+            path = self._download_wespeaker(model_id, hf_token)
+        else:
+            raise ValueError(
+                f"Prefetch not supported for model type '{model_type}'. "
+                f"Supported types: {', '.join(PREFETCH_MODEL_TYPES)}"
+            )
+        self.pin(model_type, model_id, path)
+        logger.info(f"Pinned {model_type}:{model_id} -> {path}")
+        return path
+
+    def _download_faster_whisper(self, model_size: str) -> str:
+        if os.path.isdir(model_size):
+            return model_size
+        from faster_whisper.utils import download_model
+
+        return download_model(
+            model_size, cache_dir=str(self.directory), local_files_only=self.offline
+        )
+
+    def cached_whisper_checkpoint(self, model_size: str) -> Optional[str]:
+        """
+        캐시 디렉토리의 openai-whisper 체크포인트 조회 (whisper-timestamped가 로드하는 .pt 파일)
+
+        Args:
+            model_size: 모델 크기 (예: "large-v3") 또는 체크포인트 파일 경로
+
+        Returns:
+            체크포인트 경로 (캐시에 없으면 None)
+        """
+        if os.path.isfile(model_size):
+            return model_size
+        # whisper.load_model(download_root=...)과 같은 파일명 (URL의 마지막 경로)
+        target = self.directory / os.path.basename(self._whisper_url(model_size))
+        return str(target) if target.is_file() else None
+
+    def _download_origin_whisper(self, model_size: str) -> str:
+        cached = self.cached_whisper_checkpoint(model_size)
+        if self.offline or os.path.isfile(model_size):
+            if cached is None:
+                raise FileNotFoundError(
+                    f"Whisper checkpoint '{model_size}' not found in {self.directory} (offline)"
+                )
+            return cached
+        import whisper
+
+        # 이미 받은 파일은 SHA256만 확인하고 다시 받지 않음
+        return whisper._download(self._whisper_url(model_size), str(self.directory), False)
+
+    @staticmethod
+    def _whisper_url(model_size: str) -> str:
+        import whisper
+
+        try:
+            return whisper._MODELS[model_size]
+        except KeyError:
+            raise ValueError(
+                f"Unknown Whisper model '{model_size}'. "
+                f"Available: {', '.join(whisper.available_models())}"
+            ) from None
+
+    def _download_snapshot(self, repo_id: str, hf_token: Optional[str]) -> str:
+        if os.path.isdir(repo_id):
+            return repo_id
+        from huggingface_hub import snapshot_download
+
+        return snapshot_download(repo_id, token=hf_token or None, **self.hub_kwargs())
+
+    def _download_wespeaker(self, repo_id: str, hf_token: Optional[str]) -> str:
+        from huggingface_hub import hf_hub_download
+        from app.core.processors.diarization import WESPEAKER_FILENAME
+
+        return hf_hub_download(
+            repo_id=repo_id,
+            filename=WESPEAKER_FILENAME,
+            token=hf_token or None,
+            **self.hub_kwargs(),
+        )
+
+    def _read_manifest(self) -> Dict[str, str]:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable model manifest {self.manifest_path}: {e}")
+            return {}
+
+
+# 전역 가중치 저장소 인스턴스
+model_weight_store = ModelWeightStore()
@@ -3,11 +3,13 @@ Origin Whisper 모델 래퍼
 
 기존 woa/events.py::origin_whisper_process 함수를 클래스 기반으로 리팩토링
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 import gc
+import numpy as np
 import torch
 import whisper_timestamped as whisper
 from app.core.models.base import ASRModelBase
+from app.core.models.weights import model_weight_store
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,11 @@ class OriginWhisperModel(ASRModelBase):
     기존 Gradio 앱의 origin_whisper_process 로직을 그대로 재사용
     """
 
+    def __init__(self, model_size: str, device: str):
+        super().__init__(model_size, device)
+        # 디코딩된 16kHz float32 배열을 직접 받을 수 있음
+        self.supports_array_input = True
+
     def load_model(self) -> None:
         """
         모델 로딩
@@ -36,7 +43,25 @@ class OriginWhisperModel(ASRModelBase):
                 torch.cuda.empty_cache()
 
             # 모델 로드 (기존 woa/events.py:48)
-            self.model = whisper.load_model(self.model_size, device=self.device)
+            # 프리페치로 고정했거나 캐시에 있는 체크포인트를 우선 사용하고,
+            # 없으면 공유 캐시 디렉토리로 내려받음 (오프라인이면 실패)
+            model_path = (
+                model_weight_store.resolve("origin_whisper", self.model_size)
+                or model_weight_store.cached_whisper_checkpoint(self.model_size)
+            )
+            if model_path is None:
+                if model_weight_store.offline:
+                    raise FileNotFoundError(
+                        f"Whisper checkpoint '{self.model_size}' not found in "
+                        f"{model_weight_store.directory} (MODEL_OFFLINE is set; "
+                        f"run `python -m app.prefetch origin_whisper:{self.model_size}`)"
+                    )
+                model_path = self.model_size
+            self.model = whisper.load_model(
+                model_path,
+                device=self.device,
+                download_root=str(model_weight_store.directory)
+            )
 
             self.is_loaded = True
             logger.info("Origin Whisper model loaded successfully")
@@ -47,7 +72,7 @@ class OriginWhisperModel(ASRModelBase):
 
     def transcribe(
         self,
-        audio_path: str,
+        audio_path: Union[str, np.ndarray],
         language: Optional[str],
         params: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -57,7 +82,7 @@ class OriginWhisperModel(ASRModelBase):
         기존 코드: woa/events.py:51-59
 
         Args:
-            audio_path: 오디오 파일 경로
+            audio_path: 오디오 파일 경로 또는 16kHz 모노 float32 배열
             language: 언어 힌트 (예: "ko", None이면 자동 감지)
             params: 전사 파라미터 딕셔너리
 
@@ -79,10 +104,14 @@ class OriginWhisperModel(ASRModelBase):
             self.load_model()
 
         try:
-            logger.info(f"Transcribing with Origin Whisper: {audio_path}")
-
-            # 오디오 로드 (기존 woa/events.py:51)
-            audio = whisper.load_audio(audio_path)
+            if isinstance(audio_path, np.ndarray):
+                logger.info(f"Transcribing with Origin Whisper: <decoded audio: {len(audio_path) / 16000:.1f}s>")
+                # 메모리 맵(읽기 전용) 배열일 수 있으므로 쓰기 가능한 복사본 사용
+                audio = np.array(audio_path, dtype=np.float32)
+            else:
+                logger.info(f"Transcribing with Origin Whisper: {audio_path}")
+                # 오디오 로드 (기존 woa/events.py:51)
+                audio = whisper.load_audio(audio_path)
 
             # 전사 수행 (기존 woa/events.py:52-59)
             result = whisper.transcribe(
@@ -107,7 +136,7 @@ class OriginWhisperModel(ASRModelBase):
             return result
 
         except Exception as e:
-            logger.error(f"Origin Whisper failed for {audio_path}: {e}")
+            logger.error(f"Origin Whisper failed: {e}")
             raise
 
     def unload_model(self) -> None:
@@ -3,18 +3,423 @@
 
 기존 woa/diarize.py::diarization_process 함수를 클래스 기반으로 리팩토링
 """
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import threading
+import time
 import numpy as np
 import torch
 import librosa
 from huggingface_hub import hf_hub_download
 import logging
 
+from app.config import settings
+from app.core.models.weights import model_weight_store
+
 # 기존 woa/diarize.py의 클래스들을 재사용
 from woa.diarize import WeSpeakerResNet34, AgglomerativeClustering
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_RATE = 16000
+# WeSpeaker 체크포인트 (HuggingFace Hub)
+WESPEAKER_REPO_ID = "pyannote/wespeaker-voxceleb-resnet34-LM"
+WESPEAKER_FILENAME = "pytorch_model.bin"
+# kaldi fbank 프레임 설정 (WeSpeakerResNet34 기본값: 25ms 창, 10ms 이동)
+FBANK_WINDOW_SAMPLES = 400
+FBANK_SHIFT_SAMPLES = 160
+# ResNet34에서 시간축을 절반으로 줄이는 stride 2 층 수 (layer2~4)
+RESNET_TIME_STRIDES = 3
+
+
+def _fbank_frames(num_samples: int) -> int:
+    """
+    kaldi fbank(snip_edges=True) 프레임 수
+
+    Args:
+        num_samples: 샘플 수 (FBANK_WINDOW_SAMPLES 이상)
+
+    Returns:
+        프레임 수
+    """
+    return 1 + (num_samples - FBANK_WINDOW_SAMPLES) // FBANK_SHIFT_SAMPLES
+
+
+def _pooled_frames(num_frames: int) -> int:
+    """
+    ResNet34 통과 후 StatsPool에 도달하는 프레임 수
+
+    kernel 3, padding 1, stride 2 합성곱을 RESNET_TIME_STRIDES번 거친 길이
+
+    Args:
+        num_frames: fbank 프레임 수
+
+    Returns:
+        풀링 직전 프레임 수
+    """
+    for _ in range(RESNET_TIME_STRIDES):
+        num_frames = (num_frames - 1) // 2 + 1
+    return num_frames
+
+
+def _plan_batches(lengths: Sequence[int], batch_size: int) -> List[np.ndarray]:
+    """
+    세그먼트를 길이순으로 정렬해 배치로 묶음 (패딩 최소화)
+
+    Args:
+        lengths: 세그먼트별 길이
+        batch_size: 배치당 최대 세그먼트 수
+
+    Returns:
+        배치별 원래 세그먼트 인덱스 배열 목록
+    """
+    order = np.argsort(np.asarray(lengths), kind="stable")
+    batch_size = max(1, int(batch_size))
+    return [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def _make_windows(duration: float, window: float, hop: float) -> np.ndarray:
+    """
+    오디오 전체를 덮는 고정 길이 슬라이딩 윈도우 생성
+
+    Args:
+        duration: 오디오 길이 (초)
+        window: 윈도우 길이 (초)
+        hop: 윈도우 이동 간격 (초)
+
+    Returns:
+        (윈도우 수, 2) 배열 [start, end]. 마지막 윈도우는 오디오 끝에 맞춤
+    """
+    if duration <= 0:
+        return np.zeros((0, 2))
+    if duration <= window:
+        return np.array([[0.0, duration]])
+    starts = np.arange(0.0, duration - window + 1e-9, hop)
+    if starts[-1] + window < duration:
+        starts = np.append(starts, duration - window)
+    return np.stack([starts, starts + window], axis=1)
+
+
+def _overlap_labels(
+    spans: np.ndarray,
+    windows: np.ndarray,
+    labels: np.ndarray
+) -> np.ndarray:
+    """
+    구간별로 겹치는 시간이 가장 긴 화자 선택
+
+    겹치는 윈도우가 없으면 중심이 가장 가까운 윈도우의 화자를 사용합니다.
+
+    Args:
+        spans: (구간 수, 2) 배열 [start, end]
+        windows: (윈도우 수, 2) 배열 [start, end]
+        labels: 윈도우별 화자 번호
+
+    Returns:
+        구간별 화자 번호
+    """
+    if len(spans) == 0:
+        return np.zeros(0, dtype=int)
+    num_speakers = int(labels.max()) + 1
+    result = np.empty(len(spans), dtype=int)
+    window_centers = windows.mean(axis=1)
+    # 구간 x 윈도우 겹침 행렬을 나눠 계산해 메모리 제한
+    for begin in range(0, len(spans), 1024):
+        chunk = spans[begin:begin + 1024]
+        overlap = np.clip(
+            np.minimum(chunk[:, 1:2], windows[None, :, 1])
+            - np.maximum(chunk[:, 0:1], windows[None, :, 0]),
+            0.0,
+            None,
+        )
+        per_speaker = np.zeros((len(chunk), num_speakers))
+        for speaker in range(num_speakers):
+            per_speaker[:, speaker] = overlap[:, labels == speaker].sum(axis=1)
+        chosen = per_speaker.argmax(axis=1)
+        no_overlap = per_speaker.max(axis=1) <= 0
+        if no_overlap.any():
+            centers = chunk[no_overlap].mean(axis=1)
+            nearest = np.abs(centers[:, None] - window_centers[None, :]).argmin(axis=1)
+            chosen[no_overlap] = labels[nearest]
+        result[begin:begin + len(chunk)] = chosen
+    return result
+
+
+def configure_torch_threads(num_threads: Optional[int] = None) -> None:
+    """
+    CPU 추론 스레드 수 설정
+
+    torch.set_num_threads는 프로세스 전역 설정이므로 작업 스레드에서 호출하지 않고
+    API/워커 시작 시 한 번만 적용합니다.
+
+    Args:
+        num_threads: 스레드 수 (기본: settings.diarization_num_threads, 0 = torch 기본값)
+    """
+    if num_threads is None:
+        num_threads = settings.diarization_num_threads
+    if num_threads and num_threads > 0:
+        torch.set_num_threads(int(num_threads))
+        logger.info(f"torch CPU threads set to {num_threads}")
+
+
+def _load_wespeaker(hf_token: Optional[str], device: str, fp16: bool) -> WeSpeakerResNet34:
+    """
+    WeSpeaker 임베딩 모델 로딩
+
+    기존 코드: woa/diarize.py:379-383
+
+    Args:
+        hf_token: HuggingFace Hub 토큰
+        device: 추론 디바이스
+        fp16: ResNet을 half precision으로 변환할지 여부
+
+    Returns:
+        추론 모드로 설정된 임베딩 모델
+    """
+    logger.info(f"Loading WeSpeaker embedding model on {device}")
+
+    # HuggingFace Hub에서 웨이트 다운로드 (기존 woa/diarize.py:379)
+    # 프리페치로 고정된 체크포인트가 있으면 허브 조회 없이 바로 사용
+    wespeaker_checkpoint = model_weight_store.resolve("wespeaker", WESPEAKER_REPO_ID)
+    if wespeaker_checkpoint is None:
+        wespeaker_checkpoint = hf_hub_download(
+            repo_id=WESPEAKER_REPO_ID,
+            filename=WESPEAKER_FILENAME,
+            token=hf_token,
+            **model_weight_store.hub_kwargs()
+        )
+
+    # 모델 로드 (기존 woa/diarize.py:381-383)
+    # NOTE: strict=False는 체크포인트와 모델 구조 간 불일치를 허용합니다
+    model = WeSpeakerResNet34.load_from_checkpoint(
+        wespeaker_checkpoint,
+        strict=False,
+        map_location=device
+    )
+    # 추론 모드로 설정 (학습하지 않음, BatchNorm은 저장된 통계 사용)
+    model.eval()
+    model.to(device)
+    if fp16:
+        # fbank(FFT/log)는 float32로 계산하고 ResNet만 half로 실행
+        model.resnet.half()
+
+    logger.info("WeSpeaker model loaded successfully")
+    return model
+
+
+@dataclass
+class _EmbeddingEntry:
+    """캐시된 임베딩 모델과 사용 정보"""
+    model: WeSpeakerResNet34
+    loaded_at: float
+    last_used: float
+    refs: int = 0
+
+
+class EmbeddingModelLease:
+    """
+    임베딩 모델 임대
+
+    acquire()한 캐시 항목에 묶여 있으므로, 그 사이 모델이 unload()/clear()로 내려가고
+    같은 키로 다시 로드되더라도 반환은 원래 항목에만 반영됩니다.
+    컨텍스트 매니저로 사용하거나 `release()`를 직접 호출합니다.
+    """
+
+    def __init__(self, cache: "EmbeddingModelCache", entry: _EmbeddingEntry):
+        self._cache = cache
+        self._entry: Optional[_EmbeddingEntry] = entry
+        self.model = entry.model
+
+    def release(self) -> None:
+        """임대 반환 (여러 번 호출해도 한 번만 반영)"""
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._cache._release(entry)
+
+    def __enter__(self) -> WeSpeakerResNet34:
+        return self.model
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+class EmbeddingModelCache:
+    """
+    프로세스 전역 WeSpeaker 임베딩 모델 캐시
+
+    (체크포인트, 디바이스, fp16) 키별로 모델을 한 번만 로드해 작업/파일 간에 공유합니다.
+    - 지연 로드: 처음 acquire()될 때 로드 (같은 키의 동시 요청은 하나의 로드를 기다림)
+    - 유휴 제거: 임대 중이 아니고 idle_timeout초 동안 쓰이지 않은 모델은 언로드
+    - 명시적 제거: unload() / clear()
+
+    **사용 예시:**
+    ```python
+    from app.core.processors.diarization import embedding_model_cache
+
+    with embedding_model_cache.acquire(hf_token, "cuda", fp16=False) as model:
+        ...
+    ```
+    """
+
+    def __init__(self, idle_timeout: Optional[float] = None):
+        """
+        Args:
+            idle_timeout: 유휴 모델 언로드까지의 시간(초, 0 = 제거하지 않음).
+                기본값은 settings.diarization_model_idle_seconds
+        """
+        self._idle_timeout = idle_timeout
+        self._entries: Dict[Tuple[str, str, bool], _EmbeddingEntry] = {}
+        self._lock = threading.RLock()
+        # 키별 로드 잠금 (다른 키의 조회/로드는 막지 않음)
+        self._load_locks: Dict[Tuple[str, str, bool], threading.Lock] = {}
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def idle_timeout(self) -> float:
+        if self._idle_timeout is not None:
+            return float(self._idle_timeout)
+        return float(settings.diarization_model_idle_seconds)
+
+    @staticmethod
+    def make_key(device: str, fp16: bool) -> Tuple[str, str, bool]:
+        """캐시 키 생성 (체크포인트, 디바이스, fp16)"""
+        return (f"{WESPEAKER_REPO_ID}/{WESPEAKER_FILENAME}", device, bool(fp16))
+
+    def acquire(self, hf_token: Optional[str], device: str, fp16: bool = False) -> EmbeddingModelLease:
+        """
+        모델 임대 (캐시에 없으면 로드)
+
+        임대 중인 모델은 유휴 제거 대상이 아니며, 사용 후 lease.release()로 반환해야 합니다.
+
+        Args:
+            hf_token: HuggingFace Hub 토큰 (처음 로드할 때만 사용)
+            device: 추론 디바이스
+            fp16: half precision 여부
+
+        Returns:
+            임대 (lease.model이 임베딩 모델)
+        """
+        key = self.make_key(device, fp16)
+        self.evict_idle()
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refs += 1
+                    entry.last_used = time.monotonic()
+                    return EmbeddingModelLease(self, entry)
+
+            model = _load_wespeaker(hf_token, device, fp16)
+            now = time.monotonic()
+            entry = _EmbeddingEntry(model, loaded_at=now, last_used=now, refs=1)
+            with self._lock:
+                self._entries[key] = entry
+            self._schedule_sweep()
+            return EmbeddingModelLease(self, entry)
+
+    def _release(self, entry: _EmbeddingEntry) -> None:
+        """임대 반환 (유휴 시간 측정 시작, EmbeddingModelLease.release()에서 호출)"""
+        with self._lock:
+            if entry.refs > 0:
+                entry.refs -= 1
+                entry.last_used = time.monotonic()
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        유휴 시간이 idle_timeout을 넘은 모델 언로드
+
+        Returns:
+            언로드한 모델 수
+        """
+        timeout = self.idle_timeout
+        if timeout <= 0:
+            return 0
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = [
+                key for key, entry in self._entries.items()
+                if entry.refs == 0 and now - entry.last_used >= timeout
+            ]
+            for key in expired:
+                logger.info(f"Unloading idle WeSpeaker model: {key[1]} (fp16={key[2]})")
+                self._drop(key)
+        return len(expired)
+
+    def unload(self, device: str, fp16: bool = False) -> bool:
+        """
+        모델 언로드
+
+        임대 중인 처리기는 자신이 가진 참조로 작업을 마치며, 이후 요청은 다시 로드합니다.
+
+        Returns:
+            캐시에 있었으면 True
+        """
+        with self._lock:
+            key = self.make_key(device, fp16)
+            if key not in self._entries:
+                return False
+            self._drop(key)
+            return True
+
+    def clear(self) -> None:
+        """모든 모델 언로드"""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """
+        캐시 정보 조회
+
+        Returns:
+            {"total": int, "entries": {"cuda": {"fp16": bool, "in_use": int, "idle_seconds": float}}}
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "total": len(self._entries),
+                "entries": {
+                    key[1]: {
+                        "fp16": key[2],
+                        "in_use": entry.refs,
+                        "idle_seconds": round(now - entry.last_used, 1),
+                    }
+                    for key, entry in self._entries.items()
+                },
+            }
+
+    def _drop(self, key: Tuple[str, str, bool]) -> None:
+        """캐시에서 제거하고 GPU 캐시 메모리 반환 (self._lock 보유 상태에서 호출)"""
+        self._entries.pop(key)
+        if key[1].startswith("cuda") and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def _schedule_sweep(self) -> None:
+        """유휴 제거 타이머 예약 (모델이 남아 있는 동안 idle_timeout 간격으로 반복)"""
+        timeout = self.idle_timeout
+        with self._lock:
+            if timeout <= 0 or self._timer is not None or not self._entries:
+                return
+            self._timer = threading.Timer(timeout, self._sweep)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _sweep(self) -> None:
+        with self._lock:
+            self._timer = None
+        self.evict_idle()
+        self._schedule_sweep()
+
+
+# 전역 임베딩 모델 캐시 인스턴스
+embedding_model_cache = EmbeddingModelCache()
+
 
 class DiarizationProcessor:
     """
@@ -30,7 +435,7 @@ class DiarizationProcessor:
     # 프로세서 생성
     processor = DiarizationProcessor(hf_token="your_token")
 
-    # 임베딩 모델 로드
+    # 임베딩 모델 로드 (프로세스 전역 캐시에서 임대)
     processor.load_embedding_model()
 
     # 스피커 분별 수행
@@ -41,49 +446,64 @@ class DiarizationProcessor:
         max_speakers=15
     )
 
-    # 메모리 정리
+    # 임대 반환 (모델은 캐시에 남아 다음 작업이 재사용)
     processor.unload_model()
     ```
     """
 
-    def __init__(self, hf_token: Optional[str] = None):
+    def __init__(
+        self,
+        hf_token: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        device: str = "cpu",
+        fp16: Optional[bool] = None
+    ):
         """
         Args:
             hf_token: HuggingFace Hub 토큰 (웨이트 다운로드용)
+            batch_size: 임베딩 추출 배치 크기 (기본: settings.diarization_batch_size)
+            device: 추론 디바이스 ("cpu", "cuda", "cuda:1" 등, 보통 작업의 device)
+            fp16: GPU에서 ResNet을 half precision으로 실행 (기본: settings.diarization_fp16)
         """
         self.hf_token = hf_token
+        self.device = self._resolve_device(device)
+        if fp16 is None:
+            fp16 = settings.diarization_fp16
+        # CPU에서는 half 합성곱이 느리거나 지원되지 않으므로 GPU에서만 적용
+        self.fp16 = bool(fp16) and self.device.startswith("cuda")
+        self.batch_size = batch_size or settings.diarization_batch_size
         self.embedding_model: Optional[WeSpeakerResNet34] = None
+        self._lease: Optional[EmbeddingModelLease] = None
         self.is_loaded = False
 
+    @staticmethod
+    def _resolve_device(device: Optional[str]) -> str:
+        """
+        요청 디바이스를 사용 가능한 디바이스로 변환
+
+        Args:
+            device: 요청 디바이스
+
+        Returns:
+            실제 사용할 디바이스 (CUDA가 없으면 "cpu")
+        """
+        device = (device or "cpu").lower()
+        if device.startswith("cuda") and not torch.cuda.is_available():
+            logger.warning(f"CUDA unavailable, running diarization on CPU instead of {device}")
+            return "cpu"
+        return device
+
     def load_embedding_model(self) -> None:
         """
         WeSpeaker 임베딩 모델 로딩
 
-        기존 코드: woa/diarize.py:379-383
+        프로세스 전역 캐시(embedding_model_cache)에서 임대하므로 이미 로드된
+        (디바이스, fp16) 조합이면 다운로드/체크포인트 로드 없이 바로 반환됩니다.
         """
         try:
-            logger.info("Loading WeSpeaker embedding model")
-
-            # HuggingFace Hub에서 웨이트 다운로드 (기존 woa/diarize.py:379)
-            wespeaker_checkpoint = hf_hub_download(
-                repo_id="pyannote/wespeaker-voxceleb-resnet34-LM",
-                filename="pytorch_model.bin",
-                token=self.hf_token
-            )
-
-            # 모델 로드 (기존 woa/diarize.py:381-383)
-            # NOTE: strict=False는 체크포인트와 모델 구조 간 불일치를 허용합니다
-            self.embedding_model = WeSpeakerResNet34.load_from_checkpoint(
-                wespeaker_checkpoint,
-                strict=False,
-                map_location='cpu'
-            )
-            # 추론 모드로 설정 (학습하지 않음)
-            self.embedding_model.to('cpu')
-
+            self._lease = embedding_model_cache.acquire(self.hf_token, self.device, self.fp16)
+            self.embedding_model = self._lease.model
             self.is_loaded = True
-            logger.info("WeSpeaker model loaded successfully")
-
         except Exception as e:
             logger.error(f"Failed to load WeSpeaker model: {e}")
             raise
@@ -93,7 +513,9 @@ class DiarizationProcessor:
         audio_path: str,
         transcription_result: Dict[str, Any],
         min_speakers: int = 2,
-        max_speakers: int = 15
+        max_speakers: int = 15,
+        audio: Optional[np.ndarray] = None,
+        mode: str = "segment"
     ) -> Dict[str, Any]:
         """
         스피커 분별 수행
@@ -105,6 +527,8 @@ class DiarizationProcessor:
             transcription_result: ASR 전사 결과 (segments 포함)
             min_speakers: 최소 화자 수
             max_speakers: 최대 화자 수
+            audio: 이미 디코딩된 16kHz 모노 float32 오디오 (있으면 파일을 다시 디코딩하지 않음)
+            mode: "segment" (ASR 세그먼트별 임베딩) | "window" (슬라이딩 윈도우, diarize_windows 참고)
 
         Returns:
             화자 레이블이 추가된 전사 결과
@@ -114,7 +538,8 @@ class DiarizationProcessor:
                         "start": float,
                         "end": float,
                         "text": str,
-                        "speaker": "발언자_0" | "발언자_1" | ...
+                        "speaker": "발언자_0" | "발언자_1" | ...,
+                        "words": [...] (입력에 있으면 그대로)
                     },
                     ...
                 ]
@@ -123,6 +548,10 @@ class DiarizationProcessor:
         Raises:
             ValueError: segments 수와 clusters 수가 불일치할 경우
         """
+        if mode == "window":
+            turns = self.diarize_windows(audio_path, min_speakers, max_speakers, audio=audio)
+            return self.assign_speakers(transcription_result, turns)
+
         if not self.is_loaded:
             self.load_embedding_model()
 
@@ -130,33 +559,17 @@ class DiarizationProcessor:
             logger.info(f"Starting diarization for {audio_path}")
 
             # 오디오 로드 (기존 woa/diarize.py:385)
-            audio, sr = librosa.load(audio_path, sr=16000, mono=True)
+            if audio is not None:
+                sr = 16000
+            else:
+                audio, sr = librosa.load(audio_path, sr=16000, mono=True)
 
-            # 각 세그먼트의 임베딩 추출 (기존 woa/diarize.py:388-396)
-            embeddings = []
+            # 세그먼트 임베딩을 길이별 배치로 추출 (기존 woa/diarize.py:388-396)
             segments = transcription_result.get("segments", [])
-
-            for segment in segments:
-                start, end = segment["start"], segment["end"]
-
-                # 오디오 세그먼트 추출
-                audio_segment = audio[int(start * sr):int(end * sr)]
-                audio_segment = torch.Tensor(audio_segment).reshape(1, 1, -1)
-
-                # 임베딩 계산
-                embedding = self.embedding_model(audio_segment)
-                embeddings.append(embedding.detach().numpy())
+            embeddings = self._extract_embeddings(audio, segments, sr)
 
             # 군집화 수행 (기존 woa/diarize.py:398-401)
-            cluster_model = AgglomerativeClustering()
-            cluster_model.set_num_clusters(
-                len(embeddings),
-                min_clusters=min_speakers,
-                max_clusters=max_speakers
-            )
-
-            clusters = cluster_model.cluster(np.vstack(embeddings))
-            clusters = list(clusters)
+            clusters = list(self._cluster(embeddings, min_speakers, max_speakers))
 
             # 검증 (기존 woa/diarize.py:403-404)
             if len(segments) != len(clusters):
@@ -167,14 +580,10 @@ class DiarizationProcessor:
                 raise ValueError(error_msg)
 
             # 화자 레이블 추가 (기존 woa/diarize.py:406-417)
+            # words 등 세그먼트의 다른 필드는 유지 (단어 타임스탬프가 있으면 강제 정렬 생략)
             output = {
                 'segments': [
-                    {
-                        'start': segment['start'],
-                        'end': segment['end'],
-                        'text': segment['text'],
-                        'speaker': f"발언자_{clusters.pop(0)}",
-                    }
+                    {**segment, 'speaker': f"발언자_{clusters.pop(0)}"}
                     for segment in segments
                 ],
             }
@@ -189,18 +598,223 @@ class DiarizationProcessor:
             logger.error(f"Diarization failed for {audio_path}: {e}")
             raise
 
+    def diarize_windows(
+        self,
+        audio_path: str,
+        min_speakers: int = 2,
+        max_speakers: int = 15,
+        audio: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        ASR 세그먼트와 무관한 슬라이딩 윈도우 스피커 분별
+
+        오디오 전체를 고정 길이 윈도우(settings.diarization_window_seconds,
+        이동 간격 settings.diarization_window_hop_seconds)로 나눠 임베딩을 배치 추출하고
+        윈도우를 군집화합니다. 전사 결과가 필요 없으므로 ASR과 동시에 실행할 수 있으며,
+        비용은 오디오 길이에 비례합니다. 결과는 assign_speakers()로 세그먼트/단어에 반영합니다.
+
+        Args:
+            audio_path: 오디오 파일 경로
+            min_speakers: 최소 화자 수
+            max_speakers: 최대 화자 수
+            audio: 이미 디코딩된 16kHz 모노 float32 오디오
+
+        Returns:
+            윈도우별 화자 [{"start": float, "end": float, "speaker": int}, ...]
+        """
+        if not self.is_loaded:
+            self.load_embedding_model()
+
+        try:
+            logger.info(f"Starting windowed diarization for {audio_path}")
+            if audio is not None:
+                sr = SAMPLE_RATE
+            else:
+                audio, sr = librosa.load(audio_path, sr=SAMPLE_RATE, mono=True)
+
+            windows = _make_windows(
+                len(audio) / sr,
+                settings.diarization_window_seconds,
+                settings.diarization_window_hop_seconds,
+            )
+            if len(windows) == 0:
+                return []
+            turns = [{"start": float(start), "end": float(end)} for start, end in windows]
+            embeddings = self._extract_embeddings(audio, turns, sr)
+            clusters = self._cluster(embeddings, min_speakers, max_speakers)
+            for turn, speaker in zip(turns, clusters):
+                turn["speaker"] = int(speaker)
+
+            logger.info(
+                f"Windowed diarization completed: {len(turns)} windows, "
+                f"{len(set(int(c) for c in clusters))} speakers"
+            )
+            return turns
+
+        except Exception as e:
+            logger.error(f"Windowed diarization failed for {audio_path}: {e}")
+            raise
+
+    @staticmethod
+    def assign_speakers(
+        transcription_result: Dict[str, Any],
+        turns: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        윈도우 화자를 겹치는 시간 기준으로 세그먼트와 단어에 배정
+
+        화자 번호는 세그먼트에 처음 등장하는 순서로 다시 매깁니다.
+
+        Args:
+            transcription_result: ASR 전사 결과 (segments, 선택적으로 segments[].words)
+            turns: diarize_windows() 결과
+
+        Returns:
+            segments(및 words)에 "speaker"가 추가된 전사 결과 (원본은 수정하지 않음)
+        """
+        segments = transcription_result.get("segments", [])
+        if not turns:
+            return {**transcription_result, "segments": [dict(s) for s in segments]}
+
+        windows = np.array([[t["start"], t["end"]] for t in turns], dtype=float)
+        labels = np.array([t["speaker"] for t in turns], dtype=int)
+
+        segment_labels = _overlap_labels(
+            np.array([[s["start"], s["end"]] for s in segments], dtype=float).reshape(-1, 2),
+            windows,
+            labels,
+        )
+        # 세그먼트에 등장한 순서대로 0, 1, 2... (단어에만 나오는 화자는 뒤에 배정)
+        names: Dict[int, str] = {}
+
+        def name(label: int) -> str:
+            if label not in names:
+                names[label] = f"발언자_{len(names)}"
+            return names[label]
+
+        for label in segment_labels:
+            name(int(label))
+
+        output_segments = []
+        for segment, label in zip(segments, segment_labels):
+            output = {**segment, "speaker": name(int(label))}
+            words = segment.get("words")
+            if words:
+                word_labels = _overlap_labels(
+                    np.array([[w["start"], w["end"]] for w in words], dtype=float),
+                    windows,
+                    labels,
+                )
+                output["words"] = [
+                    {**word, "speaker": name(int(word_label))}
+                    for word, word_label in zip(words, word_labels)
+                ]
+            output_segments.append(output)
+
+        return {**transcription_result, "segments": output_segments}
+
+    def _cluster(
+        self,
+        embeddings: np.ndarray,
+        min_speakers: int,
+        max_speakers: int
+    ) -> np.ndarray:
+        """임베딩 군집화 (기존 woa/diarize.py:398-401)"""
+        cluster_model = AgglomerativeClustering(
+            max_num_embeddings=settings.diarization_max_cluster_embeddings
+        )
+        cluster_model.set_num_clusters(
+            len(embeddings),
+            min_clusters=min_speakers,
+            max_clusters=max_speakers
+        )
+        return cluster_model.cluster(embeddings)
+
+    def _extract_embeddings(
+        self,
+        audio: np.ndarray,
+        segments: List[Dict[str, Any]],
+        sr: int = SAMPLE_RATE
+    ) -> np.ndarray:
+        """
+        세그먼트별 화자 임베딩을 배치로 추출
+
+        fbank는 세그먼트마다 계산해 평균 정규화를 원래와 같게 유지하고,
+        길이가 비슷한 세그먼트끼리 묶어 0으로 패딩한 뒤 ResNet을 한 번에 통과시킵니다.
+        StatsPool의 weights 마스크로 패딩 프레임은 통계에서 제외합니다.
+        배치의 오디오는 한 번에 디바이스로 옮기고 fbank부터 임베딩까지 디바이스에서
+        계산하므로 호스트-디바이스 복사는 배치당 입력 1회, 출력 1회입니다.
+
+        Args:
+            audio: 16kHz 모노 float32 오디오
+            segments: 전사 세그먼트 목록 (start, end 포함)
+            sr: 샘플링 레이트
+
+        Returns:
+            (세그먼트 수, 임베딩 차원) 배열 (segments 순서)
+        """
+        clips = []
+        for segment in segments:
+            clip = np.array(
+                audio[int(segment["start"] * sr):int(segment["end"] * sr)],
+                dtype=np.float32,
+            )
+            # fbank 창 하나보다 짧은 세그먼트는 0으로 채워 최소 한 프레임 확보
+            if len(clip) < FBANK_WINDOW_SAMPLES:
+                clip = np.pad(clip, (0, FBANK_WINDOW_SAMPLES - len(clip)))
+            clips.append(clip)
+
+        dtype = torch.float16 if self.fp16 else torch.float32
+        embeddings: List[Optional[np.ndarray]] = [None] * len(clips)
+        with torch.inference_mode():
+            for batch in _plan_batches([len(c) for c in clips], self.batch_size):
+                lengths = [len(clips[i]) for i in batch]
+                waveforms = torch.from_numpy(
+                    np.concatenate([clips[i] for i in batch])
+                ).to(self.device, non_blocking=True)
+                features = [
+                    self.embedding_model.compute_fbank(clip.reshape(1, 1, -1))[0]
+                    for clip in torch.split(waveforms, lengths)
+                ]
+                num_frames = [int(f.shape[0]) for f in features]
+                max_frames = max(num_frames)
+                padded = torch.zeros(
+                    (len(batch), max_frames, features[0].shape[-1]),
+                    dtype=dtype,
+                    device=self.device,
+                )
+                weights = torch.zeros(
+                    (len(batch), _pooled_frames(max_frames)),
+                    dtype=dtype,
+                    device=self.device,
+                )
+                for row, (feature, frames) in enumerate(zip(features, num_frames)):
+                    padded[row, :frames] = feature
+                    weights[row, :_pooled_frames(frames)] = 1.0
+
+                batch_embeddings = (
+                    self.embedding_model.resnet(padded, weights=weights)[1]
+                    .float()
+                    .cpu()
+                    .numpy()
+                )
+                for row, index in enumerate(batch):
+                    embeddings[index] = batch_embeddings[row]
+
+        return np.vstack(embeddings)
+
     def unload_model(self) -> None:
         """
-        임베딩 모델 메모리 해제
+        임베딩 모델 임대 반환
 
-        기존 코드: woa/diarize.py:419
+        모델은 캐시에 남아 다음 작업이 재사용하며, 유휴 시간이 지나거나
+        embedding_model_cache.unload()/clear()가 호출될 때 메모리에서 해제됩니다.
         """
-        if self.embedding_model is not None:
-            logger.info("Unloading WeSpeaker embedding model")
-            del self.embedding_model
-            self.embedding_model = None
-            self.is_loaded = False
-            logger.debug("WeSpeaker model unloaded")
+        lease, self._lease = self._lease, None
+        self.embedding_model = None
+        self.is_loaded = False
+        if lease is not None:
+            lease.release()
 
     def __enter__(self):
         """컨텍스트 매니저 진입"""
@@ -4,9 +4,11 @@ Forced Alignment processor (stub)
 Provides an interface to run post-ASR alignment to obtain word timings.
 Initial target: Qwen forced alignment.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,7 +20,13 @@ class QwenForcedAligner:
         # Load models/resources here in a real implementation
         self.is_ready = True
 
-    def align(self, audio_path: str, transcription_result: Dict[str, Any]) -> Dict[str, Any]:
+    def align(
+        self,
+        audio_path: str,
+        transcription_result: Dict[str, Any],
+        audio: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
+        # audio: 이미 디코딩된 16kHz 모노 float32 오디오 (있으면 audio_path를 다시 디코딩하지 않음)
         if not self.is_ready:
             self.load()
         # Stub: return unchanged result
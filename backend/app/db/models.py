@@ -34,11 +34,19 @@ class Job(Base):
     progress = Column(Integer, default=0)
     current_file = Column(String)
     total_files = Column(Integer, default=0)
+    priority = Column(Integer, default=0, index=True)
+
+    # 워커 선점/임대 정보 (DB 기반 작업 큐)
+    worker_id = Column(String)
+    attempts = Column(Integer, default=0)
+    heartbeat_at = Column(DateTime)
+    lease_expires_at = Column(DateTime)
 
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     error_message = Column(Text)
+    stage_timings = Column(JSON)
 
     # 관계
     uploaded_files = relationship("UploadedFile", back_populates="job", cascade="all, delete-orphan")
@@ -56,6 +64,11 @@ class UploadedFile(Base):
     file_size = Column(Integer)
     duration = Column(Float)
     mime_type = Column(String)
+    # 파일 내용 SHA-256 (업로드 시 계산, 결과 캐시 키)
+    content_hash = Column(String(64), index=True)
+    # 업로드 후 정규화(16kHz 모노 16bit)한 파일 경로와 샘플 수 (ingest_normalize 사용 시)
+    canonical_path = Column(String)
+    sample_count = Column(Integer)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
 
     # 관계
@@ -63,6 +76,27 @@ class UploadedFile(Base):
     result = relationship("Result", uselist=False, back_populates="file")
 
 
+class UploadSession(Base):
+    """재개 가능한(resumable) 업로드 세션 테이블"""
+    __tablename__ = "upload_sessions"
+
+    id = Column(String, primary_key=True, index=True)
+    original_filename = Column(String, nullable=False)
+    mime_type = Column(String)
+    total_size = Column(Integer, nullable=False)
+    received_bytes = Column(Integer, default=0)
+    # 클라이언트가 알려준 전체 파일 SHA-256 (완료 시 검증, 선택)
+    expected_sha256 = Column(String(64))
+    # 수신 중인 부분 파일 경로 (upload_dir 내)
+    part_path = Column(String, nullable=False)
+    # 완료 후 생성된 UploadedFile ID
+    file_id = Column(String, ForeignKey("uploaded_files.id", ondelete="SET NULL"))
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = Column(DateTime)
+
+
 class Result(Base):
     """전사 결과 테이블"""
     __tablename__ = "results"
@@ -1,17 +1,38 @@
 """
 데이터베이스 세션 관리
 """
+from typing import List, Tuple
+import logging
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+_is_sqlite = settings.database_url.startswith("sqlite")
+
 # 비동기 엔진 생성
+# SQLite: API 프로세스와 워커 프로세스가 같은 파일을 공유하므로 잠금 대기 시간을 둠
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
+    connect_args={"timeout": 30} if _is_sqlite else {},
 )
 
+
+if _is_sqlite:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragma(dbapi_connection, connection_record):
+        """WAL 모드: 작업 선점(쓰기) 중에도 상태 조회(읽기)가 막히지 않도록 함"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA busy_timeout=30000")
+        cursor.close()
+
 # 비동기 세션 팩토리
 AsyncSessionLocal = sessionmaker(
     engine,
@@ -34,11 +55,75 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+# 처음 배포된 스키마 이후 기존 테이블에 추가된 컬럼 (table, column)
+# create_all은 이미 있는 테이블을 변경하지 않으므로 init_db에서 ALTER TABLE로 추가
+# 새 테이블(upload_sessions 등)은 create_all이 만듦
+ADDED_COLUMNS: List[Tuple[str, str]] = [
+    ("jobs", "priority"),
+    ("jobs", "worker_id"),
+    ("jobs", "attempts"),
+    ("jobs", "heartbeat_at"),
+    ("jobs", "lease_expires_at"),
+    ("jobs", "stage_timings"),
+    ("uploaded_files", "content_hash"),
+    ("uploaded_files", "canonical_path"),
+    ("uploaded_files", "sample_count"),
+]
+
+
+def upgrade_schema(connection: Connection) -> List[str]:
+    """
+    기존 DB에 없는 컬럼/인덱스 추가 (여러 번 실행해도 안전)
+
+    컬럼 타입과 기본값은 모델 정의를 따르며, 정수 기본값은 DEFAULT로 지정해
+    기존 행도 같은 값을 갖게 합니다.
+
+    Args:
+        connection: 동기 DB 연결 (AsyncConnection.run_sync로 호출)
+
+    Returns:
+        추가한 컬럼 목록 ("table.column")
+    """
+    from app.db.base import Base
+
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    added = []
+    for table_name, column_name in ADDED_COLUMNS:
+        if not inspector.has_table(table_name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        if column_name in existing:
+            continue
+
+        table = Base.metadata.tables[table_name]
+        column = table.c[column_name]
+        ddl = (
+            f"ALTER TABLE {preparer.format_table(table)} "
+            f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=connection.dialect)}"
+        )
+        default = column.default.arg if column.default is not None and column.default.is_scalar else None
+        if isinstance(default, int) and not isinstance(default, bool):
+            ddl += f" DEFAULT {default}"
+        connection.exec_driver_sql(ddl)
+        added.append(f"{table_name}.{column_name}")
+
+        for index in table.indexes:
+            if column_name in index.columns:
+                index.create(connection, checkfirst=True)
+
+    if added:
+        logger.info(f"Database schema upgraded: added {', '.join(added)}")
+    return added
+
+
 async def init_db():
     """데이터베이스 초기화"""
     from app.db.base import Base
-    from app.db.models import Job, UploadedFile, Result  # 모델 import 필수
+    from app.db.models import Job, UploadedFile, Result, UploadSession  # 모델 import 필수
 
     async with engine.begin() as conn:
-        # 모든 테이블 생성
+        # 모든 테이블 생성 (없는 테이블만)
         await conn.run_sync(Base.metadata.create_all)
+        # 이전 버전으로 만든 테이블에 새 컬럼 추가
+        await conn.run_sync(upgrade_schema)
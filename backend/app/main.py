@@ -7,7 +7,12 @@ from contextlib import asynccontextmanager
 import logging
 
 from app.config import settings
+from app.core.processors.diarization import configure_torch_threads
 from app.db.session import init_db, AsyncSessionLocal
+from app.services.scheduler import job_scheduler
+from app.services.executor import stage_executor
+from app.services.job_queue import JobPoller, job_queue
+from app.services.warmup import model_warmup
 from sqlalchemy import text
 
 # 로깅 설정
@@ -32,10 +37,31 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
 
+    # 작업 스케줄러 시작 (max_concurrent_jobs 크기의 워커 풀)
+    # worker 모드에서는 별도 `python -m app.worker` 프로세스가 작업을 처리
+    poller = None
+    if settings.job_dispatch_mode == "embedded":
+        configure_torch_threads()
+        await job_scheduler.start()
+        # 재시작 전 QUEUED 작업 및 임대 만료 작업 복구
+        poller = JobPoller(job_queue, job_scheduler)
+        await poller.start()
+    else:
+        logger.info("Job dispatch mode '%s': jobs are processed by external workers", settings.job_dispatch_mode)
+
+    # 모델 프리로드/워밍업 (백그라운드, 완료 전까지 /health는 warming)
+    if settings.job_dispatch_mode == "embedded":
+        model_warmup.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down World-of-ASR Backend...")
+    await model_warmup.stop()
+    if poller is not None:
+        await poller.stop()
+    await job_scheduler.stop()
+    stage_executor.shutdown(wait=False)
 
 
 # FastAPI 앱 생성
@@ -80,9 +106,18 @@ async def health_check():
 
     from app.config import settings as cfg
 
+    if db_status != "connected":
+        status = "degraded"
+    elif model_warmup.is_warming:
+        status = "warming"
+    else:
+        status = "healthy"
+
     return {
-        "status": "healthy" if db_status == "connected" else "degraded",
+        "status": status,
         "database": db_status,
+        "warmup": model_warmup.status(),
+        "scheduler": {"mode": cfg.job_dispatch_mode, **job_scheduler.stats()},
         "providers": {
             "google_stt_enabled": cfg.enable_google,
             "qwen_asr_enabled": cfg.enable_qwen,
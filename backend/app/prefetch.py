@@ -0,0 +1,120 @@
+"""
+모델 가중치 프리페치
+
+설정된 모든 모델의 가중치를 settings.model_cache_dir로 내려받고 로컬 경로를 매니페스트에 고정합니다.
+이후 워커는 MODEL_OFFLINE=true로 허브 접근 없이 디스크에서만 모델을 로드할 수 있습니다.
+
+대상 (인자가 없을 때):
+    - settings.preload_models의 faster_whisper / origin_whisper / hf_auto_asr 모델
+    - settings.hf_auto_default_model (enable_hf_auto_asr일 때)
+    - 스피커 분별 임베딩 모델 (huggingface_token이 설정된 경우)
+
+실행:
+    cd backend
+    python -m app.prefetch                                   # 설정된 모델 전부
+    python -m app.prefetch faster_whisper:large-v3 wespeaker:pyannote/wespeaker-voxceleb-resnet34-LM
+"""
+from typing import List, Optional, Sequence, Tuple
+import argparse
+import logging
+import sys
+
+from app.config import settings
+from app.core.models.weights import PREFETCH_MODEL_TYPES, model_weight_store
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# app.core.processors.diarization.WESPEAKER_REPO_ID (torch를 불러오지 않도록 값만 복사)
+WESPEAKER_REPO_ID = "pyannote/wespeaker-voxceleb-resnet34-LM"
+
+
+def parse_prefetch_spec(spec: str) -> Tuple[str, str]:
+    """
+    프리페치 대상 명세 파싱
+
+    Args:
+        spec: "model_type:model_id" 형식 (preload_models의 ":device[:compute_type]"는 무시)
+
+    Returns:
+        (model_type, model_id)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    model_type, _, rest = spec.partition(":")
+    model_type = model_type.strip()
+    if model_type not in PREFETCH_MODEL_TYPES or not rest.strip():
+        raise ValueError(
+            f"Invalid prefetch spec '{spec}' "
+            f"(expected model_type:model_id, model_type in {', '.join(PREFETCH_MODEL_TYPES)})"
+        )
+    # 허브 저장소 ID에는 ':'가 없으므로 첫 필드만 모델 ID로 사용
+    return model_type, rest.split(":")[0].strip()
+
+
+def configured_models() -> List[Tuple[str, str]]:
+    """설정에서 프리페치할 (model_type, model_id) 목록 수집 (중복 제거, 순서 유지)"""
+    targets: List[Tuple[str, str]] = []
+    for spec in settings.preload_models:
+        model_type = spec.split(":", 1)[0].strip()
+        if model_type not in PREFETCH_MODEL_TYPES:
+            logger.info(f"Skipping {spec}: no local weights to prefetch for '{model_type}'")
+            continue
+        targets.append(parse_prefetch_spec(spec))
+    if settings.enable_hf_auto_asr and settings.hf_auto_default_model:
+        targets.append(("hf_auto_asr", settings.hf_auto_default_model))
+    if settings.huggingface_token:
+        targets.append(("wespeaker", WESPEAKER_REPO_ID))
+    return list(dict.fromkeys(targets))
+
+
+def prefetch(targets: Sequence[Tuple[str, str]], hf_token: Optional[str] = None) -> int:
+    """
+    대상 모델을 순서대로 프리페치
+
+    Args:
+        targets: (model_type, model_id) 목록
+        hf_token: HuggingFace Hub 토큰
+
+    Returns:
+        실패한 모델 수
+    """
+    failed = 0
+    for model_type, model_id in targets:
+        try:
+            path = model_weight_store.prefetch(model_type, model_id, hf_token=hf_token)
+        except Exception as e:
+            failed += 1
+            logger.error(f"Prefetch failed for {model_type}:{model_id}: {e}")
+            continue
+        print(f"{model_type}:{model_id}\t{path}")
+    return failed
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("specs", nargs="*", help="model_type:model_id (기본: 설정된 모델 전부)")
+    args = parser.parse_args(argv)
+
+    try:
+        targets = [parse_prefetch_spec(spec) for spec in args.specs] or configured_models()
+    except ValueError as e:
+        parser.error(str(e))
+    if not targets:
+        logger.warning("No models configured for prefetch")
+        return 0
+
+    if model_weight_store.offline:
+        logger.warning("MODEL_OFFLINE is set; only models already in the cache can be pinned")
+    logger.info(f"Prefetching {len(targets)} model(s) into {model_weight_store.directory}")
+    return 1 if prefetch(targets, hf_token=settings.huggingface_token) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@
 """
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Dict, Literal
 from pydantic import BaseModel, Field
 
 
@@ -46,13 +46,18 @@ class DiarizationConfig(BaseModel):
     enabled: bool = True
     min_speakers: int = Field(ge=1, le=20, default=1, description="최소 화자 수")
     max_speakers: int = Field(ge=1, le=20, default=5, description="최대 화자 수")
+    mode: Optional[Literal["segment", "window"]] = Field(
+        default=None,
+        description="segment: ASR 세그먼트별 임베딩 / window: 슬라이딩 윈도우 (기본: 서버 설정)"
+    )
 
     class Config:
         json_schema_extra = {
             "example": {
                 "enabled": True,
                 "min_speakers": 1,
-                "max_speakers": 5
+                "max_speakers": 5,
+                "mode": "segment"
             }
         }
 
@@ -72,6 +77,10 @@ class TranscriptionParameters(BaseModel):
     vad_offset: float = Field(ge=0, le=1, default=0.363, description="VAD 종료 임계값")
     initial_prompt: Optional[str] = Field(default=None, description="초기 프롬프트")
     condition_on_previous_text: bool = Field(default=False, description="이전 텍스트 조건부")
+    word_timestamps: bool = Field(
+        default=False,
+        description="단어별 타임스탬프 (faster-whisper 디코딩 중 함께 계산, 강제 정렬 생략)"
+    )
     remove_punctuation_from_words: bool = Field(default=False, description="단어에서 구두점 제거")
     remove_empty_words: bool = Field(default=False, description="빈 단어 제거")
 
@@ -90,7 +99,8 @@ class TranscriptionParameters(BaseModel):
                 "vad_onset": 0.5,
                 "vad_offset": 0.363,
                 "initial_prompt": None,
-                "condition_on_previous_text": False
+                "condition_on_previous_text": False,
+                "word_timestamps": False
             }
         }
 
@@ -120,6 +130,7 @@ class TranscriptionRequest(BaseModel):
     force_alignment: bool = Field(default=False, description="강제 정렬 수행 여부")
     alignment_provider: Optional[str] = Field(default="qwen", description="정렬 제공자(qwen 등)")
     postprocess: Optional[PostprocessOptions] = Field(default=None, description="후처리 옵션")
+    priority: int = Field(ge=0, le=10, default=0, description="스케줄링 우선순위 (클수록 먼저 처리)")
 
     class Config:
         json_schema_extra = {
@@ -165,6 +176,7 @@ class JobResponse(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
+    stage_timings: Optional[Dict[str, float]] = Field(default=None, description="단계별 소요 시간 (초)")
 
     class Config:
         from_attributes = True
@@ -178,7 +190,8 @@ class JobResponse(BaseModel):
                 "created_at": "2024-01-01T00:00:00Z",
                 "started_at": "2024-01-01T00:01:00Z",
                 "completed_at": None,
-                "error": None
+                "error": None,
+                "stage_timings": {"model_load": 4.2, "asr": 31.7, "write": 0.05}
             }
         }
 
@@ -217,3 +230,47 @@ class ProgressMessage(BaseModel):
                 "timestamp": "2024-01-01T00:00:00Z"
             }
         }
+
+
+class UploadSessionCreate(BaseModel):
+    """재개 가능한 업로드 세션 생성 요청"""
+    filename: str = Field(description="원본 파일 이름")
+    size: int = Field(gt=0, description="전체 파일 크기 (bytes)")
+    mime_type: Optional[str] = Field(default=None, description="MIME 타입")
+    sha256: Optional[str] = Field(
+        default=None, pattern="^[0-9a-fA-F]{64}$", description="전체 파일 SHA-256 (완료 시 검증)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "filename": "meeting.mp4",
+                "size": 524288000,
+                "mime_type": "video/mp4",
+                "sha256": None
+            }
+        }
+
+
+class UploadSessionResponse(BaseModel):
+    """재개 가능한 업로드 세션 상태"""
+    session_id: str
+    filename: str
+    total_size: int
+    received_bytes: int
+    chunk_size: int = Field(description="권장 청크 크기 (bytes)")
+    completed: bool = False
+    file_id: Optional[str] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "session_id": "session-uuid",
+                "filename": "meeting.mp4",
+                "total_size": 524288000,
+                "received_bytes": 16777216,
+                "chunk_size": 8388608,
+                "completed": False,
+                "file_id": None
+            }
+        }
@@ -0,0 +1,136 @@
+"""
+파이프라인 단계별 실행기
+
+ASR, 스피커 분별, 정렬, 후처리, 결과 저장처럼 수 초~수 분이 걸리는
+블로킹 작업을 단계별 전용 스레드 풀에서 실행하고 단계별 소요 시간을 기록합니다.
+DB 커밋 등 비동기 작업은 호출한 이벤트 루프에 그대로 남습니다.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import logging
+import threading
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StageTimings:
+    """
+    단계별 누적 소요 시간(초) 기록기
+
+    여러 파일을 처리하는 작업에서 같은 단계의 시간은 합산됩니다.
+    """
+
+    def __init__(self):
+        self._totals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        """단계 소요 시간 추가"""
+        with self._lock:
+            self._totals[stage] = self._totals.get(stage, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        """소수점 3자리로 반올림한 단계별 시간 딕셔너리"""
+        with self._lock:
+            return {stage: round(value, 3) for stage, value in self._totals.items()}
+
+
+class StageExecutor:
+    """
+    단계별 전용 스레드 풀 실행기
+
+    단계마다 별도 ThreadPoolExecutor를 두어, 예를 들어 긴 ASR 작업이
+    결과 저장 작업의 스레드를 점유하지 않도록 합니다.
+    모델 인스턴스는 프로세스 내 ModelManager 캐시를 공유해야 하므로
+    프로세스 풀 대신 스레드 풀을 사용합니다 (torch/CTranslate2는 추론 중 GIL 해제).
+
+    **사용 예시:**
+    ```python
+    from app.services.executor import stage_executor, StageTimings
+
+    timings = StageTimings()
+    result = await stage_executor.run(
+        "asr", model.transcribe, audio_path, "ko", params, timings=timings
+    )
+    print(timings.as_dict())  # {"asr": 12.345, "asr_wait": 0.002}
+    ```
+    """
+
+    def __init__(self, workers: Dict[str, int]):
+        """
+        Args:
+            workers: 단계 이름별 스레드 수 (정의되지 않은 단계는 1)
+        """
+        self._workers = {stage: max(1, int(count)) for stage, count in workers.items()}
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self, stage: str) -> ThreadPoolExecutor:
+        """단계 스레드 풀 조회 (처음 사용 시 생성)"""
+        with self._lock:
+            pool = self._pools.get(stage)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=self._workers.get(stage, 1),
+                    thread_name_prefix=f"stage-{stage}",
+                )
+                self._pools[stage] = pool
+            return pool
+
+    async def run(
+        self,
+        stage: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        timings: Optional[StageTimings] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        블로킹 함수를 단계 스레드 풀에서 실행
+
+        Args:
+            stage: 단계 이름 (asr, diarization, alignment, postprocess, write 등)
+            fn: 실행할 블로킹 함수
+            *args: 함수 위치 인자
+            timings: 소요 시간을 기록할 StageTimings (선택).
+                함수 실행 시간은 stage, 스레드 대기 시간은 "<stage>_wait"로 기록
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            함수 반환값
+        """
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+
+        def timed_call() -> Any:
+            # 풀 스레드를 기다린 시간은 단계 시간과 분리해 "<stage>_wait"로 기록
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                if timings is not None:
+                    timings.add(f"{stage}_wait", started - submitted)
+                    timings.add(stage, elapsed)
+                logger.debug(
+                    f"Stage '{stage}' finished in {elapsed:.3f}s "
+                    f"(waited {started - submitted:.3f}s for a worker)"
+                )
+
+        return await loop.run_in_executor(self._get_pool(stage), timed_call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """모든 단계 스레드 풀 종료"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# 전역 단계 실행기 인스턴스
+stage_executor = StageExecutor(settings.stage_workers)
@@ -0,0 +1,68 @@
+"""
+업로드 후 미디어 정규화(ingest)
+
+업로드된 원본(mp4/mkv/m4a 등)을 16kHz 모노 16bit 파일(flac 또는 wav)로 한 번 변환해
+settings.upload_dir/canonical에 저장하고, UploadedFile의 canonical_path/sample_count/duration을 기록합니다.
+이후 전사 단계는 원본 컨테이너 대신 변환본을 읽어 재실행마다 드는 디코딩 비용을 줄입니다.
+변환에 실패하면 원본을 그대로 사용합니다.
+"""
+from typing import Iterable, Optional
+import logging
+
+from app.config import settings
+from app.core.audio import SAMPLE_RATE, transcode_canonical
+from app.db.models import UploadedFile
+from app.services.executor import stage_executor
+
+logger = logging.getLogger(__name__)
+
+
+async def normalize_uploaded_file(file_id: str, session_factory=None) -> Optional[str]:
+    """
+    업로드 파일 하나를 정규화하고 DB에 기록
+
+    Args:
+        file_id: UploadedFile ID
+        session_factory: DB 세션 팩토리 (None이면 AsyncSessionLocal)
+
+    Returns:
+        정규화 파일 경로 (실패 시 None)
+    """
+    if session_factory is None:
+        from app.db.session import AsyncSessionLocal
+        session_factory = AsyncSessionLocal
+
+    async with session_factory() as db:
+        file = await db.get(UploadedFile, file_id)
+        if file is None:
+            logger.warning(f"Ingest skipped: file {file_id} not found")
+            return None
+        if file.canonical_path:
+            return file.canonical_path
+
+        try:
+            path, sample_count = await stage_executor.run(
+                "decode",
+                transcode_canonical,
+                file.storage_path,
+                settings.upload_dir / "canonical",
+                file.id,
+                settings.ingest_format,
+            )
+        except Exception as e:
+            logger.warning(f"Ingest normalization failed for {file.original_filename}; using original: {e}")
+            return None
+
+        file.canonical_path = str(path)
+        file.sample_count = sample_count
+        file.duration = sample_count / SAMPLE_RATE
+        await db.commit()
+
+    logger.info(f"Normalized {file_id} -> {path} ({sample_count} samples)")
+    return str(path)
+
+
+async def normalize_uploaded_files(file_ids: Iterable[str]) -> None:
+    """업로드 요청 이후 백그라운드에서 파일들을 순서대로 정규화"""
+    for file_id in file_ids:
+        await normalize_uploaded_file(file_id)
@@ -0,0 +1,308 @@
+"""
+DB 기반 작업 큐
+
+jobs 테이블을 내구성 있는 큐로 사용합니다.
+워커는 QUEUED 행을 원자적으로 선점(claim)하고 임대(lease)를 주기적으로 갱신(heartbeat)하며,
+임대가 만료된 PROCESSING 작업은 다시 QUEUED로 되돌려 다른 워커가 처리하게 합니다.
+
+SQLite(로컬 테스트)에서는 조건부 UPDATE의 rowcount로 경쟁을 해소하고,
+PostgreSQL 등 서버 DB에서는 추가로 `FOR UPDATE SKIP LOCKED`를 사용합니다.
+"""
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+from sqlalchemy import delete, func, or_, select, update
+
+from app.config import settings
+from app.db.models import Job, JobStatus, Result
+
+logger = logging.getLogger(__name__)
+
+
+def make_worker_id() -> str:
+    """호스트명/PID 기반 워커 식별자 생성"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobQueue:
+    """
+    jobs 테이블 기반 작업 큐
+
+    **사용 예시:**
+    ```python
+    from app.services.job_queue import job_queue
+
+    if await job_queue.claim(job_id):
+        ...  # 작업 처리
+        await job_queue.release(job_id)
+    ```
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        worker_id: Optional[str] = None,
+        lease_seconds: int = settings.job_lease_seconds,
+        max_attempts: int = settings.job_max_attempts
+    ):
+        """
+        Args:
+            session_factory: AsyncSession 팩토리 (None이면 AsyncSessionLocal)
+            worker_id: 워커 식별자 (None이면 자동 생성)
+            lease_seconds: 임대 유지 시간 (초)
+            max_attempts: 임대 만료 시 재시도 최대 횟수
+        """
+        self._session_factory = session_factory
+        self.worker_id = worker_id or make_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def _session(self):
+        if self._session_factory is None:
+            from app.db.session import AsyncSessionLocal
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory()
+
+    @staticmethod
+    def _supports_skip_locked(db) -> bool:
+        """SKIP LOCKED 지원 여부 (SQLite는 DB 단위 쓰기 잠금이므로 불필요)"""
+        return db.get_bind().dialect.name not in ("sqlite",)
+
+    async def next_queued(self, limit: int = 1) -> List[str]:
+        """
+        처리 대기 중인 작업 ID 조회 (선점하지 않음)
+
+        우선순위 내림차순, 생성 시각 오름차순(FIFO)으로 정렬합니다.
+
+        Args:
+            limit: 최대 조회 개수
+        """
+        async with self._session() as db:
+            stmt = (
+                select(Job.id)
+                .where(Job.status == JobStatus.QUEUED)
+                .order_by(Job.priority.desc(), Job.created_at.asc())
+                .limit(limit)
+            )
+            result = await db.execute(stmt)
+            return list(result.scalars().all())
+
+    async def claim(self, job_id: Optional[str] = None) -> Optional[str]:
+        """
+        QUEUED 작업 원자적 선점
+
+        Args:
+            job_id: 특정 작업만 선점 (None이면 우선순위가 가장 높은 작업)
+
+        Returns:
+            선점한 작업 ID (선점할 작업이 없거나 경쟁에서 지면 None)
+        """
+        for _ in range(3):
+            async with self._session() as db:
+                stmt = select(Job.id).where(Job.status == JobStatus.QUEUED)
+                if job_id is not None:
+                    stmt = stmt.where(Job.id == job_id)
+                stmt = stmt.order_by(Job.priority.desc(), Job.created_at.asc()).limit(1)
+                if self._supports_skip_locked(db):
+                    stmt = stmt.with_for_update(skip_locked=True)
+
+                candidate = (await db.execute(stmt)).scalar_one_or_none()
+                if candidate is None:
+                    await db.rollback()
+                    return None
+
+                now = datetime.utcnow()
+                result = await db.execute(
+                    update(Job)
+                    .where(Job.id == candidate, Job.status == JobStatus.QUEUED)
+                    .values(
+                        status=JobStatus.PROCESSING,
+                        worker_id=self.worker_id,
+                        heartbeat_at=now,
+                        lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                        attempts=func.coalesce(Job.attempts, 0) + 1,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+
+                if result.rowcount == 1:
+                    logger.info(f"Worker {self.worker_id} claimed job {candidate}")
+                    return candidate
+
+            # 다른 워커가 먼저 선점함
+            if job_id is not None:
+                return None
+
+        return None
+
+    async def heartbeat(self, job_id: str) -> bool:
+        """
+        임대 갱신
+
+        Returns:
+            갱신 성공 여부 (다른 워커에게 넘어갔거나 종료된 작업이면 False)
+        """
+        now = datetime.utcnow()
+        async with self._session() as db:
+            result = await db.execute(
+                update(Job)
+                .where(
+                    Job.id == job_id,
+                    Job.worker_id == self.worker_id,
+                    Job.status == JobStatus.PROCESSING,
+                )
+                .values(
+                    heartbeat_at=now,
+                    lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            return result.rowcount == 1
+
+    async def release(self, job_id: str) -> None:
+        """처리 종료 후 임대 해제 (상태는 서비스 레이어가 기록)"""
+        async with self._session() as db:
+            await db.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.worker_id == self.worker_id)
+                .values(lease_expires_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def recover_stale(self) -> int:
+        """
+        임대가 만료된 PROCESSING 작업 복구
+
+        재시도 횟수가 남아 있으면 QUEUED로 되돌리고 부분 결과를 삭제하며,
+        max_attempts에 도달했으면 FAILED로 기록합니다.
+        임대 정보가 없는 PROCESSING 작업(비정상 종료된 이전 프로세스)도 복구 대상입니다.
+
+        Returns:
+            복구(재등록 또는 실패 처리)된 작업 수
+        """
+        now = datetime.utcnow()
+        async with self._session() as db:
+            stmt = select(Job.id, Job.attempts).where(
+                Job.status == JobStatus.PROCESSING,
+                or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < now),
+            )
+            stale = (await db.execute(stmt)).all()
+
+            recovered = 0
+            for stale_id, attempts in stale:
+                expired = or_(Job.lease_expires_at.is_(None), Job.lease_expires_at < now)
+                if (attempts or 0) >= self.max_attempts:
+                    values = dict(
+                        status=JobStatus.FAILED,
+                        error_message=f"Worker lease expired after {attempts} attempts",
+                        worker_id=None,
+                        lease_expires_at=None,
+                    )
+                else:
+                    values = dict(
+                        status=JobStatus.QUEUED,
+                        worker_id=None,
+                        lease_expires_at=None,
+                        progress=0,
+                        current_file=None,
+                    )
+
+                result = await db.execute(
+                    update(Job)
+                    .where(Job.id == stale_id, Job.status == JobStatus.PROCESSING, expired)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount != 1:
+                    continue
+
+                if values["status"] == JobStatus.QUEUED:
+                    await db.execute(delete(Result).where(Result.job_id == stale_id))
+                    logger.warning(f"Requeued stale job {stale_id} (attempt {attempts})")
+                else:
+                    logger.error(f"Job {stale_id} failed: lease expired {attempts} times")
+                recovered += 1
+
+            await db.commit()
+            return recovered
+
+
+class JobPoller:
+    """
+    DB 큐 폴러
+
+    주기적으로 만료된 임대를 복구하고, 스케줄러에 여유가 있으면
+    QUEUED 작업을 가져와 등록합니다. 실제 선점은 스케줄러 워커가 수행합니다.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        scheduler,
+        poll_interval: float = settings.job_poll_interval
+    ):
+        """
+        Args:
+            queue: JobQueue 인스턴스
+            scheduler: JobScheduler 인스턴스
+            poll_interval: 폴링 주기 (초)
+        """
+        self.queue = queue
+        self.scheduler = scheduler
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """폴링 루프 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="job-poller")
+            logger.info(f"Job poller started (worker={self.queue.worker_id})")
+
+    async def stop(self) -> None:
+        """폴링 루프 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def poll_once(self) -> int:
+        """
+        한 번 폴링
+
+        Returns:
+            스케줄러에 새로 등록한 작업 수
+        """
+        await self.queue.recover_stale()
+
+        stats = self.scheduler.stats()
+        capacity = stats["max_workers"] - stats["queued"] - stats["running"]
+        if capacity <= 0:
+            return 0
+
+        submitted = 0
+        for job_id in await self.queue.next_queued(limit=capacity):
+            if self.scheduler.submit(job_id):
+                submitted += 1
+        return submitted
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+
+# 전역 작업 큐 인스턴스 (프로세스당 하나의 워커 ID)
+job_queue = JobQueue()
@@ -0,0 +1,150 @@
+"""
+단계 중첩(staged) 파이프라인
+
+여러 항목(파일)을 디코딩 → ASR → 후처리 → 저장처럼 여러 단계에 흘려보내되,
+단계마다 독립된 bounded 큐와 동시 실행 수를 두어 단계 간 작업이 겹치도록 합니다.
+예를 들어 파일 N이 ASR 중일 때 파일 N+1은 디코딩, 파일 N-1은 분별/저장을 진행합니다.
+"""
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class PipelineStage:
+    """
+    파이프라인 단계 정의
+
+    Attributes:
+        name: 단계 이름 (로그용)
+        fn: 항목을 받아 다음 단계로 넘길 값을 반환하는 코루틴 함수
+        concurrency: 단계 내 동시 실행 수
+        queue_size: 단계 입력 큐 크기 (가득 차면 이전 단계가 대기)
+    """
+    name: str
+    fn: Callable[[Any], Awaitable[Any]]
+    concurrency: int = 1
+    queue_size: int = 2
+
+
+class StagedPipeline:
+    """
+    bounded 큐로 연결된 다단계 비동기 파이프라인
+
+    **사용 예시:**
+    ```python
+    pipeline = StagedPipeline([
+        PipelineStage("decode", decode, concurrency=2),
+        PipelineStage("asr", transcribe, concurrency=1),
+        PipelineStage("write", write, concurrency=2),
+    ])
+    outputs = await pipeline.run(files)  # 입력 순서대로 반환
+    ```
+
+    한 항목이라도 실패하면 나머지 단계를 모두 취소하고 해당 예외를 다시 발생시킵니다.
+    """
+
+    def __init__(self, stages: List[PipelineStage]):
+        """
+        Args:
+            stages: 실행 순서대로 나열한 단계 목록
+        """
+        if not stages:
+            raise ValueError("Pipeline requires at least one stage")
+        self.stages = stages
+
+    async def run(
+        self,
+        items: Sequence[Any],
+        on_item_done: Optional[Callable[[int, Any], Awaitable[None]]] = None
+    ) -> List[Any]:
+        """
+        모든 항목을 파이프라인에 통과시킴
+
+        Args:
+            items: 입력 항목 목록
+            on_item_done: 항목이 마지막 단계를 마칠 때마다 (인덱스, 결과)로 호출되는 콜백
+
+        Returns:
+            입력 순서와 같은 순서의 최종 결과 목록
+        """
+        queues = [
+            asyncio.Queue(maxsize=max(1, stage.queue_size))
+            for stage in self.stages
+        ]
+        results: List[Any] = [None] * len(items)
+
+        async def feed() -> None:
+            for idx, item in enumerate(items):
+                await queues[0].put((idx, item))
+            for _ in range(max(1, self.stages[0].concurrency)):
+                await queues[0].put(_DONE)
+
+        async def stage_worker(pos: int) -> None:
+            stage = self.stages[pos]
+            inbox = queues[pos]
+            outbox = queues[pos + 1] if pos + 1 < len(queues) else None
+            while True:
+                entry = await inbox.get()
+                if entry is _DONE:
+                    return
+                idx, value = entry
+                output = await stage.fn(value)
+                if outbox is not None:
+                    await outbox.put((idx, output))
+                else:
+                    results[idx] = output
+                    if on_item_done is not None:
+                        await on_item_done(idx, output)
+
+        async def run_stage(pos: int) -> None:
+            stage = self.stages[pos]
+            workers = [
+                asyncio.create_task(stage_worker(pos), name=f"pipeline-{stage.name}-{n}")
+                for n in range(max(1, stage.concurrency))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+            # 다음 단계 워커 종료 신호
+            if pos + 1 < len(self.stages):
+                for _ in range(max(1, self.stages[pos + 1].concurrency)):
+                    await queues[pos + 1].put(_DONE)
+
+        tasks = [asyncio.create_task(feed(), name="pipeline-feed")]
+        tasks += [
+            asyncio.create_task(run_stage(pos), name=f"pipeline-{stage.name}")
+            for pos, stage in enumerate(self.stages)
+        ]
+
+        try:
+            await _gather_fail_fast(tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return results
+
+
+async def _gather_fail_fast(tasks: List[asyncio.Task]) -> None:
+    """모든 태스크 완료를 기다리되, 하나라도 실패하면 즉시 예외 발생"""
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.cancelled():
+                raise asyncio.CancelledError()
+            exc = task.exception()
+            if exc is not None:
+                raise exc
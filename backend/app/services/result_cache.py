@@ -0,0 +1,241 @@
+"""
+내용 주소 기반(content-addressed) 전사 결과 캐시
+
+오디오 내용 해시(업로드 시 계산한 SHA-256)와 결과에 영향을 주는 설정
+(model_type, model_size, compute_type, language, 전사/분별/후처리 파라미터,
+서버 기본값을 반영한 실제 분별 설정)의
+정규화 해시를 키로, 최종 세그먼트 JSON을 settings.result_cache_dir에 저장합니다.
+캐시 적중 시 ASR/분별을 건너뛰고 포맷별 결과 파일만 다시 생성합니다.
+"""
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from app.config import settings
+from app.db.models import Job
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키에서 제외하는 파라미터 (결과에 영향 없음)
+# batch_size는 값 대신 실제 배치 디코딩 적용 여부만 키에 반영
+_NON_RESULT_PARAMS = {"batch_size"}
+
+
+def params_hash(job: Job) -> str:
+    """
+    결과에 영향을 주는 작업 설정의 정규화 해시
+
+    Args:
+        job: 전사 작업
+
+    Returns:
+        SHA-256 hex 문자열
+    """
+    language = job.language
+    if not language or str(language).lower() == "auto":
+        language = None
+    parameters = {
+        k: v for k, v in (job.parameters or {}).items()
+        if k not in _NON_RESULT_PARAMS
+    }
+    if _batched_decoding(job):
+        parameters["batched"] = True
+    diarization = _diarization_params(job)
+
+    canonical = json.dumps(
+        {
+            "model_type": str(job.model_type),
+            "model_size": job.model_size,
+            "compute_type": parameters.get("compute_type", "float16"),
+            "language": language,
+            "parameters": parameters,
+            "diarization": diarization,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _batched_decoding(job: Job) -> bool:
+    """
+    VAD 구간 배치 디코딩이 실제로 적용되는지 여부 (순차 디코딩과 결과가 다름)
+
+    FasterWhisperModel이 쓰는 판단(batch_size, faster_whisper_batched 설정,
+    BatchedInferencePipeline 사용 가능 여부)을 그대로 사용합니다.
+    """
+    if str(job.model_type) != "faster_whisper":
+        return False
+    from app.core.models.faster_whisper import FasterWhisperModel
+
+    return FasterWhisperModel.effective_batch_size(job.parameters or {}) > 1
+
+
+def _diarization_params(job: Job) -> Dict[str, Any]:
+    """
+    분별 결과에 영향을 주는 설정 (분별 비활성화면 빈 딕셔너리)
+
+    작업 설정에 더해, 작업에 없으면 서버 기본값을 쓰는 분별 방식/윈도우 크기·간격/군집화 최대
+    임베딩 수와, 임베딩을 계산하는 디바이스 종류와 fp16 사용 여부를 포함합니다
+    (설정이나 수치 정밀도가 달라지면 화자 라벨이 달라질 수 있음).
+    """
+    config = job.diarization_config if isinstance(job.diarization_config, dict) else {}
+    if not config.get("enabled"):
+        return {}
+    device_type = _diarization_device_type(job.device)
+    # 작업에 없으면 서버 기본값을 쓰는 설정은 실제 적용될 값으로 풀어서 해시
+    mode = config.get("mode") or settings.diarization_mode
+    params = {
+        **config,
+        "mode": mode,
+        "max_cluster_embeddings": settings.diarization_max_cluster_embeddings,
+        "device_type": device_type,
+        "fp16": bool(settings.diarization_fp16) and device_type == "cuda",
+    }
+    if mode == "window":
+        params["window_seconds"] = settings.diarization_window_seconds
+        params["window_hop_seconds"] = settings.diarization_window_hop_seconds
+    return params
+
+
+def _diarization_device_type(device: Optional[str]) -> str:
+    """분별이 실제로 실행될 디바이스 종류 (DiarizationProcessor와 같이 CUDA가 없으면 cpu)"""
+    device_type = str(device or "cpu").lower().split(":")[0]
+    if device_type != "cuda":
+        return device_type
+    try:
+        import torch
+    except ImportError:  # pragma: no cover
+        return "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+class ResultCache:
+    """
+    디스크 기반 전사 결과 캐시
+
+    항목은 `{content_hash}_{params_hash}.json` 파일이며,
+    put() 시 max_age_days보다 오래된 항목을 지우고 전체 크기가 max_bytes를 넘으면
+    가장 오래 사용되지 않은 항목부터 제거합니다 (조회 시 mtime 갱신).
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        enabled: Optional[bool] = None,
+        max_bytes: Optional[int] = None,
+        max_age_days: Optional[float] = None
+    ):
+        """
+        Args:
+            directory: 캐시 디렉토리 (None이면 settings.result_cache_dir)
+            enabled: 사용 여부 (None이면 settings.result_cache_enabled)
+            max_bytes: 최대 전체 크기 (0 = 무제한)
+            max_age_days: 최대 보관 기간 (0 = 무제한)
+        """
+        self.directory = Path(directory or settings.result_cache_dir)
+        self.enabled = settings.result_cache_enabled if enabled is None else enabled
+        self.max_bytes = settings.result_cache_max_bytes if max_bytes is None else max_bytes
+        self.max_age_days = settings.result_cache_max_age_days if max_age_days is None else max_age_days
+        self._lock = threading.Lock()
+
+    def make_key(self, content_hash: Optional[str], job: Job) -> Optional[str]:
+        """
+        캐시 키 생성
+
+        Returns:
+            캐시 키 (캐시 비활성화 또는 내용 해시가 없는 파일이면 None)
+        """
+        if not self.enabled or not content_hash:
+            return None
+        return f"{content_hash}_{params_hash(job)}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """캐시된 전사 결과 조회 (없거나 만료/손상 시 None)"""
+        if key is None:
+            return None
+        path = self._path(key)
+        try:
+            if self._expired(path.stat().st_mtime, time.time()):
+                path.unlink(missing_ok=True)
+                return None
+            with path.open("r", encoding="utf-8") as f:
+                result = json.load(f)
+            # LRU 제거를 위해 사용 시각 갱신
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable result cache entry {key}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        logger.info(f"Result cache hit: {key}")
+        return result
+
+    def put(self, key: Optional[str], result: Dict[str, Any]) -> None:
+        """전사 결과 저장 후 크기/기간 제한에 맞게 정리"""
+        if key is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to store result cache entry {key}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        만료 항목 및 크기 초과분 제거
+
+        Returns:
+            제거한 항목 수
+        """
+        with self._lock:
+            now = time.time()
+            entries = []
+            removed = 0
+            for path in self.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if self._expired(stat.st_mtime, now):
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            if self.max_bytes > 0:
+                total = sum(size for _, size, _ in entries)
+                for _, size, path in sorted(entries):
+                    if total <= self.max_bytes:
+                        break
+                    path.unlink(missing_ok=True)
+                    total -= size
+                    removed += 1
+
+            if removed:
+                logger.info(f"Evicted {removed} result cache entries")
+            return removed
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return self.max_age_days > 0 and now - mtime > self.max_age_days * 86400
+
+
+# 전역 결과 캐시 인스턴스
+result_cache = ResultCache()
@@ -0,0 +1,232 @@
+"""
+전사 작업 스케줄러
+
+QUEUED 상태의 작업을 우선순위 큐에 적재하고,
+settings.max_concurrent_jobs 크기의 워커 풀이 순서대로 꺼내 처리합니다.
+작업의 내구성(재시작 복구, 다중 워커 간 선점)은 app.services.job_queue가 담당합니다.
+"""
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+import asyncio
+import itertools
+import logging
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+JobRunner = Callable[[str], Awaitable[None]]
+
+
+async def run_transcription_job(job_id: str) -> None:
+    """
+    스케줄러 워커가 호출하는 기본 작업 실행 함수
+
+    DB 큐에서 작업을 선점한 뒤 임대를 주기적으로 갱신하면서
+    새로운 DB 세션으로 TranscriptionService를 실행합니다.
+    다른 워커가 이미 선점한 작업이면 아무것도 하지 않으며, 처리 도중 임대를 잃으면
+    (만료되어 다른 워커에게 재할당) 작업을 취소합니다.
+
+    Args:
+        job_id: 작업 ID
+    """
+    from app.db.session import AsyncSessionLocal
+    from app.services.job_queue import job_queue
+    from app.services.transcription import TranscriptionService
+
+    if not await job_queue.claim(job_id):
+        logger.info(f"Job {job_id} is no longer queued; skipping")
+        return
+
+    try:
+        async with AsyncSessionLocal() as db:
+            service = TranscriptionService(db)
+            work = asyncio.create_task(
+                service.process_transcription(
+                    job_id=job_id,
+                    hf_token=settings.huggingface_token,
+                    lease_owner=job_queue.worker_id,
+                )
+            )
+            heartbeat = asyncio.create_task(_heartbeat_loop(job_queue, job_id, work))
+            try:
+                await work
+            except asyncio.CancelledError:
+                if not _lease_lost(heartbeat):
+                    raise
+                logger.warning(f"Job {job_id} cancelled after losing its lease")
+            except Exception as e:
+                logger.error(f"Scheduled transcription failed for job {job_id}: {e}")
+                # 에러는 이미 서비스 레이어에서 Job에 기록됨
+            finally:
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+    finally:
+        await job_queue.release(job_id)
+
+
+async def _heartbeat_loop(queue, job_id: str, work: asyncio.Task) -> bool:
+    """
+    처리 중인 작업의 임대를 주기적으로 갱신
+
+    임대를 잃으면 다른 워커가 같은 작업을 처리하므로 work를 취소하고 True를 반환합니다.
+    """
+    while True:
+        await asyncio.sleep(settings.job_heartbeat_interval)
+        try:
+            if not await queue.heartbeat(job_id):
+                logger.warning(f"Lost lease for job {job_id}; cancelling")
+                work.cancel()
+                return True
+        except Exception as e:
+            logger.warning(f"Heartbeat failed for job {job_id}: {e}")
+
+
+def _lease_lost(heartbeat: asyncio.Task) -> bool:
+    """하트비트 태스크가 임대를 잃고 종료했는지 여부"""
+    return heartbeat.done() and not heartbeat.cancelled() and heartbeat.result() is True
+
+
+class JobScheduler:
+    """
+    고정 크기 워커 풀 기반 작업 스케줄러
+
+    **동작 방식:**
+    - `submit()`으로 작업 ID를 우선순위 큐에 등록
+    - `max_workers`개의 워커 태스크가 큐에서 작업을 꺼내 `runner`로 실행
+    - 같은 우선순위 내에서는 FIFO 순서 유지 (priority 값이 클수록 먼저 실행)
+
+    **사용 예시:**
+    ```python
+    from app.services.scheduler import job_scheduler
+
+    await job_scheduler.start()
+    job_scheduler.submit(job_id, priority=0)
+    ...
+    await job_scheduler.stop()
+    ```
+    """
+
+    def __init__(
+        self,
+        runner: JobRunner = run_transcription_job,
+        max_workers: int = settings.max_concurrent_jobs
+    ):
+        """
+        Args:
+            runner: 작업 ID를 받아 처리하는 코루틴 함수
+            max_workers: 동시에 실행할 최대 작업 수
+        """
+        self._runner = runner
+        self.max_workers = max(1, int(max_workers))
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._sequence = itertools.count()
+        self._pending: Set[str] = set()
+        self._running: Set[str] = set()
+
+    @property
+    def is_running(self) -> bool:
+        """워커 풀 실행 여부"""
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """워커 풀 시작 (이미 실행 중이면 무시)"""
+        if self._workers:
+            return
+
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [
+            asyncio.create_task(self._worker(idx), name=f"job-worker-{idx}")
+            for idx in range(self.max_workers)
+        ]
+        logger.info(f"Job scheduler started with {self.max_workers} workers")
+
+    async def stop(self) -> None:
+        """
+        워커 풀 종료
+
+        실행 중인 작업은 취소되며, 큐에 남은 작업은 DB에 QUEUED 상태로 남습니다.
+        """
+        if not self._workers:
+            return
+
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+        self._workers = []
+        self._queue = None
+        self._pending.clear()
+        self._running.clear()
+        logger.info("Job scheduler stopped")
+
+    def submit(self, job_id: str, priority: int = 0) -> bool:
+        """
+        작업 등록
+
+        Args:
+            job_id: 작업 ID
+            priority: 우선순위 (클수록 먼저 실행)
+
+        Returns:
+            새로 등록되었으면 True, 이미 대기/실행 중이면 False
+
+        Raises:
+            RuntimeError: 스케줄러가 시작되지 않은 경우
+        """
+        if self._queue is None:
+            raise RuntimeError("Job scheduler is not running")
+
+        if job_id in self._pending or job_id in self._running:
+            logger.debug(f"Job {job_id} already scheduled")
+            return False
+
+        item: Tuple[int, int, str] = (-int(priority), next(self._sequence), job_id)
+        self._queue.put_nowait(item)
+        self._pending.add(job_id)
+        logger.info(
+            f"Job {job_id} scheduled (priority={priority}, queued={len(self._pending)})"
+        )
+        return True
+
+    async def join(self) -> None:
+        """큐에 등록된 모든 작업이 끝날 때까지 대기"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        스케줄러 상태 조회
+
+        Returns:
+            {"max_workers": int, "queued": int, "running": int}
+        """
+        return {
+            "max_workers": self.max_workers,
+            "queued": len(self._pending),
+            "running": len(self._running),
+        }
+
+    async def _worker(self, idx: int) -> None:
+        """큐에서 작업을 꺼내 순차 실행하는 워커 루프"""
+        assert self._queue is not None
+        queue = self._queue
+
+        while True:
+            _, _, job_id = await queue.get()
+            self._pending.discard(job_id)
+            self._running.add(job_id)
+            try:
+                logger.info(f"Worker {idx} picked up job {job_id}")
+                await self._runner(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worker {idx} failed on job {job_id}: {e}")
+            finally:
+                self._running.discard(job_id)
+                queue.task_done()
+
+
+# 전역 스케줄러 인스턴스
+job_scheduler = JobScheduler()
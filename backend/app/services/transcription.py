@@ -3,10 +3,18 @@
 
 비즈니스 로직을 처리하는 서비스 레이어
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
 from pathlib import Path
+import asyncio
 import logging
+import os
+import shutil
 
+from app.config import settings
+from app.core.audio import DecodedAudio, decode_audio
 from app.core.models.manager import model_manager
 from app.core.processors.diarization import DiarizationProcessor
 from app.core.processors.forced_alignment import QwenForcedAligner
@@ -16,13 +24,33 @@ from app.core.processors.vad import VADProcessor
 from app.db.models import Job, UploadedFile, Result, JobStatus
 from app.db.session import AsyncSession
 from app.schemas.transcription import TranscriptionRequest
-from sqlalchemy import select
+from app.services.executor import stage_executor, StageTimings
+from app.services.pipeline import PipelineStage, StagedPipeline
+from app.services.result_cache import result_cache
+from sqlalchemy import select, update
 from sqlalchemy.orm import selectinload
 import uuid
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FileTask:
+    """파이프라인 단계 사이를 흐르는 파일 단위 작업 상태"""
+    index: int
+    file: UploadedFile
+    audio_path: Optional[str] = None
+    # 한 번 디코딩해 단계 간 공유하는 16kHz 모노 float32 오디오 (없으면 각 단계가 audio_path 사용)
+    audio: Optional[DecodedAudio] = None
+    result: Optional[Dict[str, Any]] = None
+    paths: Dict[str, str] = field(default_factory=dict)
+    # 결과 캐시 키 (캐시 비활성화 시 None)와 캐시 적중 여부 (적중 시 decode/asr/enrich 생략)
+    cache_key: Optional[str] = None
+    cached: bool = False
+    # 윈도우 분별 모드에서 ASR과 동시에 실행 중인 분별 작업 (윈도우별 화자 목록을 반환)
+    speaker_turns: Optional["asyncio.Task"] = None
+
+
 class TranscriptionService:
     """
     전사 서비스
@@ -88,6 +116,7 @@ class TranscriptionService:
                 diarization_config=(request.diarization.model_dump() if request.diarization else None),
                 output_formats=[str(fmt) if not isinstance(fmt, str) else fmt for fmt in request.output_formats],
                 total_files=len(files),
+                priority=request.priority,
             )
 
             # 파일 연결
@@ -109,15 +138,30 @@ class TranscriptionService:
     async def process_transcription(
         self,
         job_id: str,
-        hf_token: Optional[str] = None
+        hf_token: Optional[str] = None,
+        lease_owner: Optional[str] = None
     ) -> None:
         """
         전사 작업 처리 (백그라운드 태스크)
 
+        블로킹 단계(모델 로딩, ASR, 스피커 분별, 정렬, 후처리, 결과 저장)는
+        stage_executor의 단계별 스레드 풀에서 실행되고,
+        DB 커밋은 이벤트 루프에서 수행됩니다.
+        단계별 소요 시간은 Job.stage_timings에 기록됩니다.
+
         Args:
             job_id: 작업 ID
             hf_token: HuggingFace 토큰 (스피커 분별용)
+            lease_owner: 작업을 선점한 워커 ID (주어지면 임대를 유지한 경우에만 완료/실패 기록)
         """
+        job = None
+        timings = StageTimings()
+        # AsyncSession은 동시 커밋을 지원하지 않으므로 진행률/완료/실패 커밋을 이 락으로 직렬화
+        progress_lock = asyncio.Lock()
+        # 완료/실패 커밋 이후에는 진행률을 커밋하지 않음 (락 안에서만 변경)
+        progress_closed = False
+        audio_dir = Path(settings.temp_dir) / f"decoded_{job_id}"
+        file_tasks: List[FileTask] = []
         try:
             # Job 조회
             stmt = select(Job).where(Job.id == job_id).options(
@@ -131,154 +175,713 @@ class TranscriptionService:
 
             # 상태 업데이트: PROCESSING
             job.status = JobStatus.PROCESSING
+            job.started_at = datetime.utcnow()
             await self.db.commit()
 
             logger.info(f"Starting transcription for job {job_id}")
 
-            # 모델 가져오기
-            model = model_manager.get_model(
+            files = list(job.uploaded_files)
+            total_files = len(files)
+            file_tasks = [
+                FileTask(index=idx, file=file, cache_key=result_cache.make_key(file.content_hash, job))
+                for idx, file in enumerate(files, 1)
+            ]
+
+            # 결과 캐시 조회 (같은 오디오 + 같은 설정이면 ASR/분별 생략)
+            if any(task.cache_key for task in file_tasks):
+                await asyncio.to_thread(self._load_cached_results, file_tasks)
+
+            # 모델은 파일마다 ASR 단계에서 임대 (임대는 레플리카 슬롯을 독점하므로
+            # 레플리카가 여러 개면 파일들이 서로 다른 레플리카에서 병렬 실행)
+            acquire_model = partial(
+                model_manager.lease,
                 model_type=job.model_type,
                 model_size=job.model_size,
                 device=job.device,
-                compute_type=job.parameters.get("compute_type", "float16")
+                compute_type=job.parameters.get("compute_type", "float16"),
             )
+            # 파일 처리 전에 모델을 미리 로드하고 동시에 임대할 수 있는 수를 확인
+            # 모든 파일이 캐시 적중이면 모델을 로드하지 않음
+            model_capacity = 1
+            if not all(task.cached for task in file_tasks):
+                lease = await stage_executor.run("model_load", acquire_model, timings=timings)
+                try:
+                    model_capacity = lease.capacity
+                finally:
+                    lease.release()
 
             # 각 파일 처리
-            total_files = len(job.uploaded_files)
-            for idx, file in enumerate(job.uploaded_files, 1):
-                logger.info(f"Processing file {idx}/{total_files}: {file.original_filename}")
+            # 파일들을 decode → asr → enrich(분별/정렬/후처리) → write 단계 파이프라인으로 흘려보내
+            # 단계 간 작업을 겹침 (파일 N이 ASR 중일 때 N+1은 디코딩, N-1은 분별/저장)
+            lang_hint = None if (not job.language or str(job.language).lower() == "auto") else job.language
+            asr_concurrency = max(1, min(model_capacity, settings.max_parallel_files))
+            queue_size = settings.pipeline_queue_size
+            # ASR 외에 오디오를 읽는 단계(분별/정렬)가 있으면 한 번만 디코딩해 공유
+            diarize = bool(
+                isinstance(job.diarization_config, dict) and job.diarization_config.get("enabled")
+            )
+            # 단어 타임스탬프를 ASR에서 받으면 강제 정렬은 오디오를 다시 읽지 않음
+            align = bool(job.parameters.get("force_alignment")) and not job.parameters.get("word_timestamps")
+            share_audio = settings.shared_audio_decode and (diarize or align)
+            completed = 0
+            # ASR 진행 중인 파일별 진행 비율 (0~1, 세그먼트를 순차 수신하는 모델만)
+            partial_progress: Dict[int, float] = {}
+
+            job.progress = 0
+            job.stage_timings = timings.as_dict()
+            await self.db.commit()
+            logger.info(f"Processing {total_files} files (asr concurrency={asr_concurrency})")
+
+            async def commit_progress(update: Callable[[], bool]) -> None:
+                # 락 안에서 job을 갱신하고 커밋. 파이프라인이 실패해 호출한 단계가 취소되어도
+                # 커밋은 shield로 끝까지 수행해 세션이 커밋 도중 상태로 남지 않게 함
+                async def locked_commit() -> None:
+                    async with progress_lock:
+                        if not progress_closed and update():
+                            await self.db.commit()
+
+                await asyncio.shield(locked_commit())
+
+            async def on_file_done(idx: int, task: FileTask) -> None:
+                def update() -> bool:
+                    nonlocal completed
+                    completed += 1
+                    partial_progress.pop(task.index, None)
+                    job.progress = max(job.progress or 0, int(completed / total_files * 100))
+                    job.current_file = task.file.original_filename
+                    job.stage_timings = timings.as_dict()
+                    return True
+
+                await commit_progress(update)
+
+            async def on_asr_progress(task: FileTask, fraction: float) -> None:
+                # 디코딩 중인 파일의 부분 진행률 반영 (정수 퍼센트가 오를 때만 커밋)
+                def update() -> bool:
+                    partial_progress[task.index] = fraction
+                    progress = int((completed + sum(partial_progress.values())) / total_files * 100)
+                    progress = min(progress, 99)
+                    if progress <= (job.progress or 0):
+                        return False
+                    job.progress = progress
+                    job.current_file = task.file.original_filename
+                    return True
+
+                await commit_progress(update)
+
+            pipeline = StagedPipeline([
+                PipelineStage(
+                    "decode",
+                    partial(
+                        self._decode_stage,
+                        audio_dir=audio_dir if share_audio else None,
+                        timings=timings,
+                    ),
+                    concurrency=settings.stage_workers.get("decode", 1),
+                    queue_size=queue_size,
+                ),
+                PipelineStage(
+                    "asr",
+                    partial(
+                        self._asr_stage,
+                        job=job,
+                        acquire_model=acquire_model,
+                        language=lang_hint,
+                        hf_token=hf_token,
+                        timings=timings,
+                        on_progress=on_asr_progress,
+                    ),
+                    concurrency=asr_concurrency,
+                    queue_size=queue_size,
+                ),
+                PipelineStage(
+                    "enrich",
+                    partial(self._enrich_stage, job=job, hf_token=hf_token, timings=timings),
+                    concurrency=settings.stage_workers.get("diarization", 1),
+                    queue_size=queue_size,
+                ),
+                PipelineStage(
+                    "write",
+                    partial(self._write_stage, job=job, timings=timings),
+                    concurrency=settings.stage_workers.get("write", 1),
+                    queue_size=queue_size,
+                ),
+            ])
+            tasks = await pipeline.run(file_tasks, on_item_done=on_file_done)
+
+            # Result 레코드 생성 (업로드 순서 유지)
+            for task in tasks:
+                paths = task.paths
+                result_record = Result(
+                    id=str(uuid.uuid4()),
+                    job_id=job.id,
+                    file_id=task.file.id,
+                    segment_count=len(task.result.get("segments", [])),
+                    speaker_count=self._count_speakers(task.result),
+                    json_path=paths.get("json"),
+                    vtt_path=paths.get("vtt"),
+                    srt_path=paths.get("srt"),
+                    txt_path=paths.get("txt"),
+                    tsv_path=paths.get("tsv"),
+                )
+                self.db.add(result_record)
 
-                # 진행률 업데이트
-                job.progress = int((idx - 1) / total_files * 100)
-                await self.db.commit()
+            # 완료
+            async with progress_lock:
+                progress_closed = True
+                committed = await self._commit_final_status(
+                    job,
+                    job_id,
+                    lease_owner,
+                    status=JobStatus.COMPLETED,
+                    progress=100,
+                    completed_at=datetime.utcnow(),
+                    stage_timings=timings.as_dict(),
+                )
+                if not committed:
+                    raise RuntimeError(f"Lost lease for job {job_id}; discarding results")
 
-                try:
-                    # 전사 수행
-                    lang_hint = None if (not job.language or str(job.language).lower() == "auto") else job.language
-                    transcription_result = model.transcribe(
-                        audio_path=file.storage_path,
-                        language=lang_hint,
-                        params=job.parameters
-                    )
+            logger.info(f"Job {job_id} completed successfully (stage timings: {job.stage_timings})")
 
-                    # 스피커 분별 (옵션)
-                    enabled = False
-                    if job.diarization_config and isinstance(job.diarization_config, dict):
-                        enabled = bool(job.diarization_config.get("enabled", False))
-                    if enabled:
-                        logger.info(f"Running diarization for file {file.original_filename}")
-                        diarization_processor = DiarizationProcessor(hf_token=hf_token)
-                        transcription_result = diarization_processor.process(
-                            audio_path=file.storage_path,
-                            transcription_result=transcription_result,
-                            min_speakers=int(job.diarization_config.get("min_speakers", 2)),
-                            max_speakers=int(job.diarization_config.get("max_speakers", 15)),
-                        )
-                        diarization_processor.unload_model()
-
-                    # 필요 시 강제 정렬(Forced Alignment)
-                    try:
-                        if job.parameters.get("force_alignment"):
-                            # only meaningful if words missing
-                            has_words = bool(transcription_result.get("segments") and transcription_result["segments"][0].get("words"))
-                            provider = job.parameters.get("alignment_provider", "qwen")
-                            if not has_words and provider == "qwen":
-                                aligner = QwenForcedAligner()
-                                transcription_result = aligner.align(
-                                    audio_path=file.storage_path,
-                                    transcription_result=transcription_result,
-                                )
-                    except Exception as e:
-                        logger.error(f"Forced alignment failed: {e}")
-
-                    # 후처리 (PnC / VAD)
-                    try:
-                        pp = job.parameters.get("postprocess", {}) if isinstance(job.parameters, dict) else {}
-                        if pp.get("pnc"):
-                            pnc = PnCProcessor()
-                            transcription_result = pnc.process(transcription_result)
-                        if pp.get("vad"):
-                            vad = VADProcessor()
-                            transcription_result = vad.process(transcription_result)
-                    except Exception as e:
-                        logger.error(f"Postprocess failed: {e}")
-
-                    # 결과 저장 및 Result 레코드 생성
-                    paths = await self._save_results(
-                        job=job,
-                        file=file,
-                        transcription_result=transcription_result
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            # 이미 실패 처리되지 않았다면
+            if job and job.status != JobStatus.FAILED:
+                # 진행 중인 진행률 커밋이 끝난 뒤, 실패한 트랜잭션을 정리하고 실패 상태 기록
+                async with progress_lock:
+                    progress_closed = True
+                    await self.db.rollback()
+                    committed = await self._commit_final_status(
+                        job,
+                        job_id,
+                        lease_owner,
+                        status=JobStatus.FAILED,
+                        error_message=str(e),
+                        stage_timings=timings.as_dict(),
                     )
+                    if not committed:
+                        await self.db.rollback()
+                        logger.warning(f"Lost lease for job {job_id}; not recording failure")
+            raise
+        finally:
+            # 실패/취소로 enrich 단계에서 회수되지 못한 윈도우 분별 작업 정리
+            await self._cancel_speaker_turns(file_tasks)
+            shutil.rmtree(audio_dir, ignore_errors=True)
 
-                    result_record = Result(
-                        id=str(uuid.uuid4()),
-                        job_id=job.id,
-                        file_id=file.id,
-                        segment_count=len(transcription_result.get("segments", [])),
-                        speaker_count=self._count_speakers(transcription_result),
-                        json_path=paths.get("json"),
-                        vtt_path=paths.get("vtt"),
-                        srt_path=paths.get("srt"),
-                        txt_path=paths.get("txt"),
-                        tsv_path=paths.get("tsv"),
-                    )
-                    self.db.add(result_record)
+    @staticmethod
+    async def _cancel_speaker_turns(file_tasks: List["FileTask"]) -> None:
+        """
+        아직 남아 있는 윈도우 분별 태스크를 모두 취소하고 끝날 때까지 대기
 
-                except Exception as e:
-                    logger.error(f"Failed to process file {file.original_filename}: {e}")
-                    job.status = JobStatus.FAILED
-                    job.error_message = str(e)
-                    await self.db.commit()
-                    raise
+        Args:
+            file_tasks: 작업의 파일 목록
+        """
+        pending = [task.speaker_turns for task in file_tasks if task.speaker_turns is not None]
+        for task in file_tasks:
+            task.speaker_turns = None
+        if not pending:
+            return
+        for turns in pending:
+            turns.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _commit_final_status(
+        self,
+        job: Job,
+        job_id: str,
+        lease_owner: Optional[str],
+        **values: Any
+    ) -> bool:
+        """
+        작업 완료/실패 상태 커밋 (같은 트랜잭션에 추가된 Result 행도 함께 커밋)
 
-            # 완료
-            job.status = JobStatus.COMPLETED
-            job.progress = 100
-            await self.db.commit()
+        lease_owner가 주어지면 그 워커가 아직 임대를 가진 PROCESSING 작업일 때만 기록하여,
+        임대를 잃은 뒤 다시 대기열에 들어가 다른 워커가 처리 중인 작업을 덮어쓰지 않습니다.
 
-            logger.info(f"Job {job_id} completed successfully")
+        Returns:
+            기록했으면 True (임대를 잃었으면 False, 트랜잭션은 커밋하지 않음)
+        """
+        if lease_owner is not None:
+            result = await self.db.execute(
+                update(Job)
+                .where(
+                    Job.id == job_id,
+                    Job.worker_id == lease_owner,
+                    Job.status == JobStatus.PROCESSING,
+                )
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                return False
+        for name, value in values.items():
+            setattr(job, name, value)
+        await self.db.commit()
+        return True
+
+    async def _decode_stage(
+        self,
+        task: "FileTask",
+        audio_dir: Optional[Path],
+        timings: StageTimings
+    ) -> "FileTask":
+        """
+        decode 단계: ASR 직전에 파일을 준비하여 디스크/디코딩 대기 시간을 숨김
 
+        audio_dir가 주어지면 16kHz 모노 float32로 한 번 디코딩해 ASR/분별/정렬이 공유하고
+        (실패 시 각 단계가 원본 경로를 직접 디코딩), 아니면 다음 파일의 데이터를
+        OS 페이지 캐시로 선읽기(readahead)만 합니다.
+        """
+        logger.info(f"Preparing file {task.index}: {task.file.original_filename}")
+        # 업로드 시 정규화된 파일이 있으면 원본 컨테이너 대신 사용
+        task.audio_path = task.file.canonical_path or task.file.storage_path
+        if task.cached:
+            return task
+        if audio_dir is None:
+            await stage_executor.run("decode", self._prefetch_audio, task.audio_path, timings=timings)
+            return task
+
+        try:
+            task.audio = await stage_executor.run(
+                "decode",
+                decode_audio,
+                task.audio_path,
+                audio_dir,
+                name=str(task.file.id),
+                timings=timings,
+            )
         except Exception as e:
-            logger.error(f"Job {job_id} failed: {e}")
-            # 이미 실패 처리되지 않았다면
-            if job and job.status != JobStatus.FAILED:
-                job.status = JobStatus.FAILED
-                job.error_message = str(e)
-                await self.db.commit()
+            logger.warning(f"Shared decode failed for {task.file.original_filename}, stages will decode individually: {e}")
+        return task
+
+    async def _asr_stage(
+        self,
+        task: "FileTask",
+        job: Job,
+        acquire_model: Callable[[], Any],
+        language: Optional[str],
+        timings: StageTimings,
+        hf_token: Optional[str] = None,
+        on_progress: Optional[Callable[["FileTask", float], Awaitable[None]]] = None
+    ) -> "FileTask":
+        """
+        asr 단계: 모델을 임대해 전사 수행
+
+        acquire_model()은 ModelLease를 반환하며, 빈 레플리카가 없으면 반환될 때까지
+        asr 풀 스레드에서 기다립니다. 임대는 이 파일의 전사가 끝나면 반환합니다.
+
+        윈도우 분별 모드면 전사 결과가 필요 없는 윈도우 분별을 diarization 풀에서
+        동시에 시작하고, enrich 단계에서 결과를 기다려 세그먼트에 반영합니다.
+        세그먼트를 순차적으로 내보내는 모델(supports_streaming)은 디코딩 도중
+        on_progress(task, 0~1)로 파일 내 진행률을 보고합니다.
+        """
+        if task.cached:
+            return task
+        if self._diarization_mode(job) == "window":
+            task.speaker_turns = asyncio.create_task(
+                stage_executor.run(
+                    "diarization",
+                    self._run_window_diarization,
+                    audio_path=task.audio_path,
+                    audio=task.audio.samples if task.audio else None,
+                    diarization_config=dict(job.diarization_config),
+                    hf_token=hf_token,
+                    device=job.device,
+                    timings=timings,
+                )
+            )
+        on_segment = None
+        drain = None
+        duration = task.audio.duration if task.audio is not None else task.file.duration
+        if on_progress is not None and duration:
+            loop = asyncio.get_running_loop()
+            # ASR 스레드는 진행률을 큐에 넣기만 하고, 이벤트 루프의 drain 작업이 순서대로
+            # on_progress를 호출 (밀린 값은 최신 값만 반영, None은 종료 신호)
+            progress_queue: "asyncio.Queue[Optional[float]]" = asyncio.Queue()
+
+            def on_segment(segment: Dict[str, Any]) -> None:
+                # ASR 워커 스레드에서 호출
+                fraction = min(max(float(segment.get("end", 0.0)) / duration, 0.0), 1.0)
+                loop.call_soon_threadsafe(progress_queue.put_nowait, fraction)
+
+            async def drain_progress() -> None:
+                stop = False
+                while not stop:
+                    items = [await progress_queue.get()]
+                    while not progress_queue.empty():
+                        items.append(progress_queue.get_nowait())
+                    stop = items[-1] is None
+                    fractions = [item for item in items if item is not None]
+                    if fractions:
+                        await on_progress(task, fractions[-1])
+
+            drain = asyncio.create_task(drain_progress())
+
+        try:
+            task.result = await stage_executor.run(
+                "asr",
+                self._run_leased_asr,
+                acquire_model,
+                task,
+                language=language,
+                params=job.parameters,
+                on_segment=on_segment,
+                timings=timings,
+            )
+            if drain is not None:
+                # 남은 진행률까지 커밋한 뒤 단계를 끝내 파일 완료 커밋보다 늦게 커밋되지 않게 함
+                # (진행률 커밋이 실패하면 여기서 예외가 전파됨)
+                progress_queue.put_nowait(None)
+                await drain
+        except Exception as e:
+            logger.error(f"Failed to process file {task.file.original_filename}: {e}")
+            if task.speaker_turns is not None:
+                task.speaker_turns.cancel()
             raise
+        finally:
+            if drain is not None and not drain.done():
+                # 실패/취소: 남은 진행률은 버림
+                drain.cancel()
+                await asyncio.gather(drain, return_exceptions=True)
+        return task
+
+    async def _enrich_stage(
+        self,
+        task: "FileTask",
+        job: Job,
+        hf_token: Optional[str],
+        timings: StageTimings
+    ) -> "FileTask":
+        """enrich 단계: 스피커 분별 → 강제 정렬 → 후처리 (각각 옵션)"""
+        if task.cached:
+            return task
+
+        # 스피커 분별 (옵션)
+        if task.speaker_turns is not None:
+            # ASR과 동시에 실행한 윈도우 분별 결과를 겹치는 시간으로 세그먼트/단어에 배정
+            turns = await task.speaker_turns
+            task.speaker_turns = None
+            task.result = DiarizationProcessor.assign_speakers(task.result, turns)
+        elif self._diarization_mode(job) is not None:
+            logger.info(f"Running diarization for file {task.file.original_filename}")
+            task.result = await stage_executor.run(
+                "diarization",
+                self._run_diarization,
+                audio_path=task.audio_path,
+                audio=task.audio.samples if task.audio else None,
+                transcription_result=task.result,
+                diarization_config=dict(job.diarization_config),
+                hf_token=hf_token,
+                device=job.device,
+                timings=timings,
+            )
+
+        # 필요 시 강제 정렬(Forced Alignment). ASR이 단어 타임스탬프를 이미 냈으면 생략
+        segments = task.result.get("segments") or []
+        if job.parameters.get("force_alignment") and not (segments and segments[0].get("words")):
+            task.result = await stage_executor.run(
+                "alignment",
+                self._run_alignment,
+                audio_path=task.audio_path,
+                audio=task.audio.samples if task.audio else None,
+                transcription_result=task.result,
+                params=dict(job.parameters),
+                timings=timings,
+            )
+
+        # 후처리 (PnC / VAD)
+        pp = job.parameters.get("postprocess", {}) if isinstance(job.parameters, dict) else {}
+        if pp and (pp.get("pnc") or pp.get("vad")):
+            task.result = await stage_executor.run(
+                "postprocess",
+                self._run_postprocess,
+                transcription_result=task.result,
+                postprocess=dict(pp),
+                timings=timings,
+            )
+
+        # 공유 오디오의 마지막 사용처이므로 아티팩트 정리
+        if task.audio is not None:
+            task.audio.cleanup()
+            task.audio = None
+
+        # 최종 결과를 캐시에 저장 (다른 출력 형식으로 재요청 시 재사용)
+        if task.cache_key:
+            await stage_executor.run("write", result_cache.put, task.cache_key, task.result, timings=timings)
+        return task
+
+    async def _write_stage(self, task: "FileTask", job: Job, timings: StageTimings) -> "FileTask":
+        """write 단계: 포맷별 결과 파일 저장"""
+        task.paths = await self._save_results(
+            job=job,
+            file=task.file,
+            transcription_result=task.result,
+            timings=timings,
+        )
+        return task
+
+    @staticmethod
+    def _diarization_mode(job: Job) -> Optional[str]:
+        """작업의 분별 방식 ("segment" | "window", 분별 비활성화면 None)"""
+        config = job.diarization_config
+        if not (config and isinstance(config, dict) and config.get("enabled", False)):
+            return None
+        return config.get("mode") or settings.diarization_mode
+
+    @staticmethod
+    def _load_cached_results(tasks: List["FileTask"]) -> None:
+        """캐시 키가 있는 파일의 결과를 캐시에서 채움 (스레드에서 실행)"""
+        for task in tasks:
+            cached = result_cache.get(task.cache_key)
+            if cached is not None:
+                task.result = cached
+                task.cached = True
+                logger.info(f"Reusing cached result for {task.file.original_filename}")
+
+    @classmethod
+    def _run_leased_asr(
+        cls,
+        acquire_model: Callable[[], Any],
+        task: "FileTask",
+        language: Optional[str],
+        params: Dict[str, Any],
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """파일 하나를 전사하는 동안만 모델을 임대 (스레드 풀에서 실행되는 블로킹 함수)"""
+        lease = acquire_model()
+        try:
+            model = lease.model
+            return cls._run_asr(
+                model,
+                audio_path=cls._asr_input(task, model),
+                language=language,
+                params=params,
+                on_segment=on_segment,
+            )
+        finally:
+            lease.release()
+
+    @staticmethod
+    def _run_asr(
+        model: Any,
+        audio_path: Any,
+        language: Optional[str],
+        params: Dict[str, Any],
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        전사 단계 (스레드 풀에서 실행되는 블로킹 함수)
+
+        on_segment가 주어지고 모델이 세그먼트를 순차적으로 내보내면(supports_streaming)
+        transcribe_iter()로 세그먼트가 디코딩되는 대로 받아 콜백에 넘기고,
+        끝나면 transcribe()와 같은 형태로 모아 반환합니다.
+        """
+        if on_segment is None or getattr(model, "supports_streaming", False) is not True:
+            return model.transcribe(audio_path=audio_path, language=language, params=params)
+
+        segments = []
+        for segment in model.transcribe_iter(audio_path, language, params):
+            segments.append(segment)
+            on_segment(segment)
+        return {"segments": segments}
+
+    @staticmethod
+    def _asr_input(task: "FileTask", model: Any) -> Any:
+        """디코딩된 오디오를 받을 수 있는 모델이면 공유 오디오 배열, 아니면 파일 경로"""
+        if task.audio is not None and getattr(model, "supports_array_input", False) is True:
+            return task.audio.samples
+        return task.audio_path
+
+    @staticmethod
+    def _prefetch_audio(path: str) -> None:
+        """파일 전체를 OS 페이지 캐시로 선읽기하도록 커널에 요청 (지원되지 않으면 무시)"""
+        fadvise = getattr(os, "posix_fadvise", None)
+        if fadvise is None:
+            return
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError as e:
+            logger.debug(f"Prefetch skipped for {path}: {e}")
+            return
+        try:
+            fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _run_diarization(
+        audio_path: str,
+        transcription_result: Dict[str, Any],
+        diarization_config: Dict[str, Any],
+        hf_token: Optional[str],
+        audio: Optional[Any] = None,
+        device: str = "cpu"
+    ) -> Dict[str, Any]:
+        """
+        스피커 분별 단계 (스레드 풀에서 실행되는 블로킹 함수)
+
+        Args:
+            audio_path: 오디오 파일 경로
+            transcription_result: ASR 전사 결과
+            diarization_config: 스피커 분별 설정
+            hf_token: HuggingFace 토큰
+            audio: 공유 디코딩 오디오 배열 (없으면 audio_path를 디코딩)
+            device: 임베딩 추론 디바이스 (작업의 device)
+
+        Returns:
+            화자 레이블이 추가된 전사 결과
+        """
+        # 임베딩 모델은 embedding_model_cache에서 임대하므로 파일마다 다시 로드하지 않음
+        diarization_processor = DiarizationProcessor(hf_token=hf_token, device=device)
+        try:
+            return diarization_processor.process(
+                audio_path=audio_path,
+                transcription_result=transcription_result,
+                min_speakers=int(diarization_config.get("min_speakers", 2)),
+                max_speakers=int(diarization_config.get("max_speakers", 15)),
+                audio=audio,
+            )
+        finally:
+            # 임대 반환 (모델은 캐시에 유지)
+            diarization_processor.unload_model()
+
+    @staticmethod
+    def _run_window_diarization(
+        audio_path: str,
+        diarization_config: Dict[str, Any],
+        hf_token: Optional[str],
+        audio: Optional[Any] = None,
+        device: str = "cpu"
+    ) -> List[Dict[str, Any]]:
+        """
+        윈도우 분별 단계 (ASR과 동시에 스레드 풀에서 실행되는 블로킹 함수)
+
+        Returns:
+            윈도우별 화자 목록 (DiarizationProcessor.diarize_windows 참고)
+        """
+        diarization_processor = DiarizationProcessor(hf_token=hf_token, device=device)
+        try:
+            return diarization_processor.diarize_windows(
+                audio_path=audio_path,
+                min_speakers=int(diarization_config.get("min_speakers", 2)),
+                max_speakers=int(diarization_config.get("max_speakers", 15)),
+                audio=audio,
+            )
+        finally:
+            diarization_processor.unload_model()
+
+    @staticmethod
+    def _run_alignment(
+        audio_path: str,
+        transcription_result: Dict[str, Any],
+        params: Dict[str, Any],
+        audio: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        강제 정렬 단계 (스레드 풀에서 실행되는 블로킹 함수)
+
+        실패해도 작업 전체를 실패시키지 않고 원본 결과를 반환합니다.
+        """
+        try:
+            # only meaningful if words missing
+            has_words = bool(transcription_result.get("segments") and transcription_result["segments"][0].get("words"))
+            provider = params.get("alignment_provider", "qwen")
+            if not has_words and provider == "qwen":
+                aligner = QwenForcedAligner()
+                transcription_result = aligner.align(
+                    audio_path=audio_path,
+                    transcription_result=transcription_result,
+                    audio=audio,
+                )
+        except Exception as e:
+            logger.error(f"Forced alignment failed: {e}")
+        return transcription_result
+
+    @staticmethod
+    def _run_postprocess(
+        transcription_result: Dict[str, Any],
+        postprocess: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        후처리 단계 (PnC / VAD, 스레드 풀에서 실행되는 블로킹 함수)
+
+        실패해도 작업 전체를 실패시키지 않고 직전 결과를 반환합니다.
+        """
+        try:
+            if postprocess.get("pnc"):
+                pnc = PnCProcessor()
+                transcription_result = pnc.process(transcription_result)
+            if postprocess.get("vad"):
+                vad = VADProcessor()
+                transcription_result = vad.process(transcription_result)
+        except Exception as e:
+            logger.error(f"Postprocess failed: {e}")
+        return transcription_result
 
     async def _save_results(
         self,
         job: Job,
         file: UploadedFile,
-        transcription_result: Dict[str, Any]
+        transcription_result: Dict[str, Any],
+        timings: Optional[StageTimings] = None
     ) -> Dict[str, str]:
         """
         전사 결과를 여러 포맷으로 저장
 
+        파일 쓰기는 "write" 단계 스레드 풀에서 실행됩니다.
+
         Args:
             job: Job 인스턴스
             file: UploadedFile 인스턴스
             transcription_result: 전사 결과
+            timings: 소요 시간을 기록할 StageTimings (선택)
 
         Returns:
             포맷별 출력 경로 딕셔너리
         """
-        from app.config import settings
+        return await stage_executor.run(
+            "write",
+            self._write_outputs,
+            job_id=str(job.id),
+            output_formats=list(job.output_formats),
+            original_filename=file.original_filename,
+            transcription_result=transcription_result,
+            timings=timings,
+        )
+
+    @staticmethod
+    def _write_outputs(
+        job_id: str,
+        output_formats: List[str],
+        original_filename: str,
+        transcription_result: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """
+        포맷별 결과 파일 작성 (블로킹 함수)
 
+        Args:
+            job_id: 작업 ID
+            output_formats: 출력 포맷 목록
+            original_filename: 원본 파일명 (출력 파일명 기준)
+            transcription_result: 전사 결과
+
+        Returns:
+            포맷별 출력 경로 딕셔너리
+        """
         output_paths = {}
 
         # 출력 디렉토리 생성
-        output_dir = Path(settings.results_dir) / str(job.id)
+        output_dir = Path(settings.results_dir) / job_id
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # 각 포맷별 저장
-        for format_name in job.output_formats:
+        for format_name in output_formats:
             try:
                 writer = get_writer(format_name, str(output_dir))
                 output_path = writer(
                     result=transcription_result,
-                    audio_path=file.original_filename,
+                    audio_path=original_filename,
                     options={}  # TODO: 옵션 파라미터 추가
                 )
                 # writer may return a list (for 'all'); normalize
@@ -0,0 +1,187 @@
+"""
+업로드 파일 저장
+
+업로드 스트림을 큰 청크 단위로 읽으면서 한 번의 패스로
+크기 제한 검사, 내용 해시(SHA-256) 계산, 디스크 쓰기를 수행합니다.
+디스크 쓰기와 해시는 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import re
+
+from fastapi import UploadFile
+
+from app.config import settings
+from app.core.audio import probe_duration
+
+logger = logging.getLogger(__name__)
+
+
+class FileTooLargeError(ValueError):
+    """업로드 파일이 최대 허용 크기를 넘는 경우"""
+
+    def __init__(self, filename: str, max_size: int):
+        super().__init__(f"File '{filename}' exceeds the maximum size of {max_size} bytes")
+        self.filename = filename
+        self.max_size = max_size
+
+
+@dataclass
+class StoredUpload:
+    """저장된 업로드 파일 정보"""
+    path: Path
+    size: int
+    content_hash: str
+    duration: Optional[float] = None
+
+
+def _write_chunk(buffer: BinaryIO, digest: Any, chunk: bytes) -> None:
+    digest.update(chunk)
+    buffer.write(chunk)
+
+
+async def save_upload(
+    upload: UploadFile,
+    destination: Path,
+    max_size: Optional[int] = None,
+    chunk_size: Optional[int] = None
+) -> StoredUpload:
+    """
+    업로드 파일을 스트리밍으로 저장
+
+    Args:
+        upload: FastAPI UploadFile
+        destination: 저장 경로
+        max_size: 최대 크기 (None이면 settings.max_file_size)
+        chunk_size: 읽기/쓰기 청크 크기 (None이면 settings.upload_chunk_size)
+
+    Returns:
+        StoredUpload (크기, SHA-256, 길이)
+
+    Raises:
+        FileTooLargeError: 최대 크기 초과 (부분 저장된 파일은 삭제)
+    """
+    max_size = settings.max_file_size if max_size is None else max_size
+    chunk_size = chunk_size or settings.upload_chunk_size
+    filename = upload.filename or destination.name
+
+    # 클라이언트가 크기를 알려준 경우 읽기 전에 거부
+    declared = getattr(upload, "size", None)
+    if isinstance(declared, int) and declared > max_size:
+        raise FileTooLargeError(filename, max_size)
+
+    digest = hashlib.sha256()
+    size = 0
+    buffer = await asyncio.to_thread(open, destination, "wb", buffering=chunk_size)
+    try:
+        while chunk := await upload.read(chunk_size):
+            size += len(chunk)
+            if size > max_size:
+                raise FileTooLargeError(filename, max_size)
+            await asyncio.to_thread(_write_chunk, buffer, digest, chunk)
+    except BaseException:
+        await asyncio.to_thread(buffer.close)
+        destination.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(buffer.close)
+
+    duration = await asyncio.to_thread(probe_duration, destination)
+    return StoredUpload(
+        path=destination,
+        size=size,
+        content_hash=digest.hexdigest(),
+        duration=duration,
+    )
+
+
+_CONTENT_RANGE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+def parse_content_range(header: Optional[str]) -> Tuple[int, int, int]:
+    """
+    Content-Range 헤더 파싱
+
+    Args:
+        header: "bytes {start}-{end}/{total}" 형식 (end 포함)
+
+    Returns:
+        (start, end, total)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위가 맞지 않는 경우
+    """
+    match = _CONTENT_RANGE.match((header or "").strip())
+    if not match:
+        raise ValueError("Content-Range header must look like 'bytes start-end/total'")
+    start, end, total = (int(group) for group in match.groups())
+    if start > end or end >= total:
+        raise ValueError(f"Invalid Content-Range: {header}")
+    return start, end, total
+
+
+async def write_range(
+    path: Path,
+    offset: int,
+    chunks: AsyncIterator[bytes],
+    length: int
+) -> str:
+    """
+    스트림을 부분 파일의 offset 위치에 기록
+
+    정확히 length 바이트를 받지 못하면 파일을 offset 위치로 되돌려
+    다음 재시도가 같은 위치에서 다시 시작할 수 있게 합니다.
+
+    Args:
+        path: 부분 파일 경로 (없으면 생성)
+        offset: 쓰기 시작 위치
+        chunks: 요청 본문 스트림
+        length: 기대하는 바이트 수
+
+    Returns:
+        받은 청크의 SHA-256 hex
+
+    Raises:
+        ValueError: 받은 바이트 수가 length와 다른 경우
+    """
+    digest = hashlib.sha256()
+    written = 0
+    mode = "r+b" if path.exists() else "wb"
+    buffer = await asyncio.to_thread(open, path, mode, buffering=settings.upload_chunk_size)
+    try:
+        await asyncio.to_thread(buffer.seek, offset)
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            written += len(chunk)
+            if written > length:
+                raise ValueError(f"Chunk is larger than its Content-Range ({length} bytes)")
+            await asyncio.to_thread(_write_chunk, buffer, digest, chunk)
+        if written != length:
+            raise ValueError(f"Incomplete chunk: expected {length} bytes, received {written}")
+    except BaseException:
+        await asyncio.to_thread(_truncate_and_close, buffer, offset)
+        raise
+    await asyncio.to_thread(buffer.close)
+    return digest.hexdigest()
+
+
+def _truncate_and_close(buffer: BinaryIO, size: int) -> None:
+    try:
+        buffer.flush()
+        buffer.truncate(size)
+    finally:
+        buffer.close()
+
+
+def hash_file(path: Path, chunk_size: Optional[int] = None) -> str:
+    """파일 전체 SHA-256 계산 (블로킹, 스레드에서 호출)"""
+    digest = hashlib.sha256()
+    chunk_size = chunk_size or settings.upload_chunk_size
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,142 @@
+"""
+모델 프리로드 및 워밍업
+
+배포 직후 첫 작업이 모델 다운로드/로드/CUDA 워밍업 비용을 떠안지 않도록,
+애플리케이션 시작 시 settings.preload_models에 나열된 모델을 백그라운드에서 로드하고
+짧은 무음 오디오로 전사를 한 번 수행합니다.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import time
+import wave
+
+from app.config import settings
+from app.core.models.manager import model_manager
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SAMPLE_RATE = 16000
+WARMUP_SECONDS = 1.0
+
+
+def parse_model_spec(spec: str) -> Tuple[str, str, str, str]:
+    """
+    프리로드 모델 명세 파싱
+
+    Args:
+        spec: "model_type:model_size:device[:compute_type]" 형식 문자열
+
+    Returns:
+        (model_type, model_size, device, compute_type)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    parts = [part.strip() for part in spec.split(":")]
+    if len(parts) not in (3, 4) or not all(parts):
+        raise ValueError(
+            f"Invalid preload model spec '{spec}' "
+            "(expected model_type:model_size:device[:compute_type])"
+        )
+    compute_type = parts[3] if len(parts) == 4 else "float16"
+    return parts[0], parts[1], parts[2], compute_type
+
+
+def write_silence_wav(path: Path, seconds: float = WARMUP_SECONDS) -> Path:
+    """워밍업용 16kHz 모노 무음 WAV 파일 생성"""
+    num_samples = int(WARMUP_SAMPLE_RATE * seconds)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(WARMUP_SAMPLE_RATE)
+        wav.writeframes(b"\x00\x00" * num_samples)
+    return path
+
+
+class ModelWarmup:
+    """
+    시작 시 모델 프리로드/워밍업 실행기
+
+    **상태:**
+    - idle: 프리로드 대상 없음 또는 시작 전
+    - warming: 로드/워밍업 진행 중
+    - ready: 모든 모델 준비 완료
+    - failed: 일부 모델 로드 실패 (나머지는 사용 가능, 실패 모델은 요청 시 다시 로드)
+    """
+
+    def __init__(self, specs: Optional[List[str]] = None, warmup: Optional[bool] = None):
+        """
+        Args:
+            specs: 프리로드 모델 명세 목록 (None이면 settings.preload_models)
+            warmup: 무음 전사 워밍업 여부 (None이면 settings.preload_warmup)
+        """
+        self.specs = list(settings.preload_models if specs is None else specs)
+        self.warmup = settings.preload_warmup if warmup is None else warmup
+        self.state = "idle"
+        self.models: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_warming(self) -> bool:
+        return self.state == "warming"
+
+    def start(self) -> None:
+        """백그라운드 태스크로 프리로드 시작 (대상이 없으면 아무것도 하지 않음)"""
+        if not self.specs or self._task is not None:
+            return
+        self.state = "warming"
+        self._task = asyncio.create_task(self.run(), name="model-warmup")
+
+    async def stop(self) -> None:
+        """진행 중인 프리로드 취소"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def run(self) -> None:
+        """모든 대상 모델을 순서대로 로드/워밍업"""
+        self.state = "warming"
+        failed = False
+        for spec in self.specs:
+            started = time.perf_counter()
+            try:
+                await self._warm(spec)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failed = True
+                self.models[spec] = {"status": "failed", "error": str(e)}
+                logger.error(f"Model preload failed for {spec}: {e}")
+                continue
+            elapsed = round(time.perf_counter() - started, 3)
+            self.models[spec] = {"status": "ready", "seconds": elapsed}
+            logger.info(f"Model {spec} preloaded in {elapsed}s")
+        self.state = "failed" if failed else "ready"
+
+    async def _warm(self, spec: str) -> None:
+        model_type, model_size, device, compute_type = parse_model_spec(spec)
+        async with model_manager.alease(model_type, model_size, device, compute_type) as model:
+            # 프리로드 모델은 LRU 제거 대상에서 제외
+            model_manager.pin(model_manager.make_key(model_type, model_size, device, compute_type))
+
+            if not self.warmup:
+                return
+
+            path = Path(settings.temp_dir) / f"warmup_{model_type}_{model_size}.wav"
+            await asyncio.to_thread(write_silence_wav, path)
+            try:
+                await asyncio.to_thread(model.transcribe, str(path), "en", {})
+            finally:
+                path.unlink(missing_ok=True)
+
+    def status(self) -> Dict[str, Any]:
+        """헬스 체크용 상태 정보"""
+        return {"state": self.state, "models": dict(self.models)}
+
+
+# 전역 워밍업 인스턴스
+model_warmup = ModelWarmup()
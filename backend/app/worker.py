@@ -0,0 +1,73 @@
+"""
+독립 실행형 전사 워커
+
+API 프로세스와 분리된 GPU/CPU 워커로 실행합니다.
+jobs 테이블에서 QUEUED 작업을 선점해 처리하므로 API 재시작과 무관하게 작업이 유지되며,
+API 레플리카와 워커 수를 독립적으로 확장할 수 있습니다.
+
+실행:
+    cd backend
+    JOB_DISPATCH_MODE=worker uvicorn app.main:app   # API (작업 처리 안 함)
+    python -m app.worker                             # 워커 (여러 개 실행 가능)
+"""
+import asyncio
+import logging
+import signal
+
+from app.config import settings
+from app.core.processors.diarization import configure_torch_threads
+from app.db.session import init_db
+from app.services.executor import stage_executor
+from app.services.job_queue import JobPoller, job_queue
+from app.services.scheduler import job_scheduler
+from app.services.warmup import model_warmup
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def run_worker() -> None:
+    """워커 메인 루프 (SIGINT/SIGTERM 수신 시 종료)"""
+    settings.create_directories()
+    await init_db()
+    configure_torch_threads()
+
+    # 작업을 받기 전에 모델을 미리 로드해 첫 작업의 지연을 제거
+    if model_warmup.specs:
+        await model_warmup.run()
+
+    poller = JobPoller(job_queue, job_scheduler)
+    await job_scheduler.start()
+    await poller.start()
+    logger.info(
+        f"Worker {job_queue.worker_id} started "
+        f"(max_concurrent_jobs={settings.max_concurrent_jobs}, db={settings.database_url})"
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:  # pragma: no cover (Windows)
+            pass
+
+    try:
+        await stop_event.wait()
+    finally:
+        logger.info(f"Worker {job_queue.worker_id} shutting down")
+        await poller.stop()
+        # 처리 중이던 작업은 임대 만료 후 다른 워커가 재처리
+        await job_scheduler.stop()
+        stage_executor.shutdown(wait=False)
+
+
+def main() -> None:
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,37 @@ import os
 import tempfile
 from unittest.mock import Mock, patch, MagicMock
 from app.core.models.manager import ModelManager
-from app.core.processors.diarization import DiarizationProcessor
+from app.core.processors.diarization import DiarizationProcessor, _fbank_frames, embedding_model_cache
 from app.core.processors.formatters import get_writer
 
 
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    # 테스트마다 새 Mock 임베딩 모델을 로드하도록 전역 캐시 비우기
+    embedding_model_cache.clear()
+    yield
+    embedding_model_cache.clear()
+
+
+def mock_batched_embedding_model(embedding_dim=256):
+    """
+    배치 임베딩 경로(compute_fbank → resnet)를 흉내 내는 Mock WeSpeaker 모델
+
+    compute_fbank는 클립 길이에 맞는 프레임 수의 fbank를, resnet은 배치 크기만큼의
+    (풀링 전 출력, 임베딩) 튜플을 반환합니다.
+    """
+    import torch
+
+    model = Mock()
+    model.compute_fbank.side_effect = lambda waveform: torch.randn(
+        1, _fbank_frames(waveform.shape[-1]), 80
+    )
+    model.resnet.side_effect = lambda features, weights=None: (
+        None, torch.randn(features.shape[0], embedding_dim)
+    )
+    return model
+
+
 class TestTranscriptionPipeline:
     """전사 파이프라인 통합 테스트"""
 
@@ -79,15 +106,10 @@ class TestTranscriptionPipeline:
         mock_audio = np.random.randn(16000 * 10)  # 10초 오디오
         mock_librosa.load.return_value = (mock_audio, 16000)
 
-        # Mock WeSpeaker 모델
-        mock_embedding_model = Mock()
+        # Mock WeSpeaker 모델 (배치 임베딩 추출)
+        mock_embedding_model = mock_batched_embedding_model()
         mock_wespeaker_class.load_from_checkpoint.return_value = mock_embedding_model
 
-        # Mock 임베딩 출력
-        import torch
-        mock_embedding = torch.randn(1, 256)
-        mock_embedding_model.return_value = mock_embedding
-
         # 전사 결과 (스피커 정보 없음)
         transcription_result = {
             "segments": [
@@ -126,6 +148,12 @@ class TestTranscriptionPipeline:
         assert result["segments"][1]["speaker"] == "발언자_1"
         assert result["segments"][2]["speaker"] == "발언자_0"
 
+        # 세그먼트 3개가 한 배치로 ResNet을 한 번 통과
+        assert mock_embedding_model.compute_fbank.call_count == 3
+        assert mock_embedding_model.resnet.call_count == 1
+        embeddings = mock_cluster.cluster.call_args[0][0]
+        assert embeddings.shape == (3, 256)
+
         # 결과를 VTT로 저장
         output_dir = str(tmp_path)
         writer = get_writer("vtt", output_dir)
@@ -258,14 +286,11 @@ class TestErrorHandling:
         """세그먼트와 클러스터 수 불일치 에러"""
 
         import numpy as np
-        import torch
 
         mock_audio = np.random.randn(16000 * 5)
         mock_librosa.load.return_value = (mock_audio, 16000)
 
-        mock_embedding_model = Mock()
-        mock_wespeaker_class.load_from_checkpoint.return_value = mock_embedding_model
-        mock_embedding_model.return_value = torch.randn(1, 256)
+        mock_wespeaker_class.load_from_checkpoint.return_value = mock_batched_embedding_model()
 
         transcription_result = {
             "segments": [
@@ -0,0 +1,78 @@
+"""
+디코딩된 오디오 아티팩트 단위 테스트
+"""
+import subprocess
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.core.audio import SAMPLE_RATE, DecodedAudio, decode_audio
+
+
+def write_pcm(path, samples):
+    np.asarray(samples, dtype=np.float32).tofile(path)
+    return path
+
+
+class TestDecodedAudio:
+    def test_memory_mapped_zero_copy_slice(self, tmp_path):
+        samples = np.arange(SAMPLE_RATE * 2, dtype=np.float32)
+        decoded = DecodedAudio(write_pcm(tmp_path / "a.f32", samples))
+
+        assert isinstance(decoded.samples, np.memmap)
+        assert decoded.duration == pytest.approx(2.0)
+
+        segment = decoded.slice(0.5, 1.0)
+        assert len(segment) == SAMPLE_RATE // 2
+        assert segment[0] == SAMPLE_RATE // 2
+        # 뷰이므로 원본 버퍼를 공유
+        assert np.shares_memory(segment, decoded.samples)
+
+    def test_empty_audio(self, tmp_path):
+        path = tmp_path / "empty.f32"
+        path.write_bytes(b"")
+        assert DecodedAudio(path).duration == 0
+
+    def test_cleanup_removes_file(self, tmp_path):
+        decoded = DecodedAudio(write_pcm(tmp_path / "a.f32", [0.0, 0.1]))
+        decoded.samples
+        decoded.cleanup()
+        assert not decoded.path.exists()
+
+
+class TestDecodeAudio:
+    def test_ffmpeg_decodes_straight_to_file(self, tmp_path):
+        def fake_run(cmd, **kwargs):
+            write_pcm(cmd[-1], [0.0] * SAMPLE_RATE)
+            return subprocess.CompletedProcess(cmd, 0)
+
+        with patch("app.core.audio.shutil.which", return_value="/usr/bin/ffmpeg"), \
+                patch("app.core.audio.subprocess.run", side_effect=fake_run) as run:
+            decoded = decode_audio("/data/video.mp4", tmp_path, name="file-1")
+
+        cmd = run.call_args.args[0]
+        assert cmd[cmd.index("-ar") + 1] == "16000"
+        assert cmd[cmd.index("-ac") + 1] == "1"
+        assert cmd[cmd.index("-f") + 1] == "f32le"
+        assert decoded.path == tmp_path / "file-1.f32"
+        assert decoded.duration == pytest.approx(1.0)
+
+    def test_falls_back_to_librosa(self, tmp_path):
+        def fake_librosa(source, target):
+            write_pcm(target, [0.0] * 800)
+
+        error = subprocess.CalledProcessError(1, "ffmpeg")
+        with patch("app.core.audio.shutil.which", return_value="/usr/bin/ffmpeg"), \
+                patch("app.core.audio.subprocess.run", side_effect=error), \
+                patch("app.core.audio._decode_with_librosa", side_effect=fake_librosa):
+            decoded = decode_audio("/data/audio.wav", tmp_path)
+
+        assert decoded.path.name == "audio.f32"
+        assert len(decoded.samples) == 800
+
+    def test_raises_when_all_decoders_fail(self, tmp_path):
+        with patch("app.core.audio.shutil.which", return_value=None), \
+                patch("app.core.audio._decode_with_librosa", side_effect=ValueError("bad file")):
+            with pytest.raises(RuntimeError, match="bad file"):
+                decode_audio("/data/broken.wav", tmp_path)
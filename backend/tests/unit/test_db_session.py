@@ -0,0 +1,110 @@
+"""
+DB 스키마 업그레이드(init_db) 단위 테스트
+
+이전 버전 스키마로 만든 SQLite DB에 새 컬럼이 추가되는지 확인합니다.
+"""
+from sqlalchemy import inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models import Job, JobStatus, UploadedFile
+from app.db.session import ADDED_COLUMNS, upgrade_schema
+
+# 처음 배포된 스키마 (priority/임대/stage_timings/content_hash 등 추가 전)
+LEGACY_SCHEMA = [
+    """
+    CREATE TABLE jobs (
+        id VARCHAR NOT NULL PRIMARY KEY,
+        model_type VARCHAR NOT NULL,
+        model_size VARCHAR NOT NULL,
+        language VARCHAR,
+        device VARCHAR NOT NULL,
+        parameters JSON NOT NULL,
+        diarization_config JSON,
+        output_formats JSON NOT NULL,
+        status VARCHAR(10),
+        progress INTEGER,
+        current_file VARCHAR,
+        total_files INTEGER,
+        created_at DATETIME,
+        started_at DATETIME,
+        completed_at DATETIME,
+        error_message TEXT
+    )
+    """,
+    """
+    CREATE TABLE uploaded_files (
+        id VARCHAR NOT NULL PRIMARY KEY,
+        job_id VARCHAR REFERENCES jobs (id) ON DELETE CASCADE,
+        original_filename VARCHAR NOT NULL,
+        storage_path VARCHAR NOT NULL,
+        file_size INTEGER,
+        duration FLOAT,
+        mime_type VARCHAR,
+        uploaded_at DATETIME
+    )
+    """,
+    """
+    INSERT INTO jobs (id, model_type, model_size, device, parameters, output_formats, status)
+    VALUES ('old-job', 'faster_whisper', 'tiny', 'cpu', '{}', '["json"]', 'QUEUED')
+    """,
+]
+
+
+async def make_legacy_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+    async with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            await conn.execute(text(statement))
+    return engine
+
+
+class TestUpgradeSchema:
+    async def test_adds_missing_columns_to_existing_tables(self, tmp_path):
+        engine = await make_legacy_engine(tmp_path)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                added = await conn.run_sync(upgrade_schema)
+
+            assert added == [f"{table}.{column}" for table, column in ADDED_COLUMNS]
+
+            factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            async with factory() as db:
+                job = await db.get(Job, "old-job")
+                # 기존 행은 모델 기본값으로 채워짐
+                assert job.priority == 0
+                assert job.attempts == 0
+                assert job.status == JobStatus.QUEUED
+                assert (await db.execute(select(UploadedFile))).scalars().all() == []
+                # 새 테이블은 create_all이 생성
+                await db.execute(text("SELECT COUNT(*) FROM upload_sessions"))
+
+            async with engine.connect() as conn:
+                indexes = await conn.run_sync(
+                    lambda sync_conn: {index["name"] for index in inspect(sync_conn).get_indexes("jobs")}
+                )
+            assert "ix_jobs_priority" in indexes
+        finally:
+            await engine.dispose()
+
+    async def test_is_idempotent(self, tmp_path):
+        engine = await make_legacy_engine(tmp_path)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(upgrade_schema)
+            async with engine.begin() as conn:
+                assert await conn.run_sync(upgrade_schema) == []
+        finally:
+            await engine.dispose()
+
+    async def test_fresh_database_needs_no_upgrade(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'fresh.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                assert await conn.run_sync(upgrade_schema) == []
+        finally:
+            await engine.dispose()
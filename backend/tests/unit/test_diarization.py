@@ -0,0 +1,350 @@
+"""
+스피커 분별 프로세서 단위 테스트
+"""
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.core.processors.diarization import (
+    FBANK_WINDOW_SAMPLES,
+    DiarizationProcessor,
+    EmbeddingModelCache,
+    WESPEAKER_REPO_ID,
+    configure_torch_threads,
+    _fbank_frames,
+    _make_windows,
+    _plan_batches,
+    _pooled_frames,
+)
+from woa import diarize
+from woa.diarize import AgglomerativeClustering
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    from app.core.processors.diarization import embedding_model_cache
+
+    embedding_model_cache.clear()
+    yield
+    embedding_model_cache.clear()
+
+
+class TestBatchPlanning:
+    def test_frame_counts(self):
+        # 25ms 창 / 10ms 이동
+        assert _fbank_frames(FBANK_WINDOW_SAMPLES) == 1
+        assert _fbank_frames(16000) == 98
+        # stride 2 층 3개: 98 -> 49 -> 25 -> 13
+        assert _pooled_frames(98) == 13
+        assert _pooled_frames(1) == 1
+
+    def test_batches_group_similar_lengths(self):
+        lengths = [900, 100, 500, 120, 880, 510]
+        batches = _plan_batches(lengths, batch_size=2)
+
+        assert [sorted(b.tolist()) for b in batches] == [[1, 3], [2, 5], [0, 4]]
+        # 모든 세그먼트가 정확히 한 번씩 포함
+        assert sorted(np.concatenate(batches).tolist()) == list(range(len(lengths)))
+
+    def test_batch_size_at_least_one(self):
+        assert len(_plan_batches([1, 2, 3], batch_size=0)) == 3
+        assert _plan_batches([], batch_size=8) == []
+
+
+class TestWindowedDiarization:
+    def test_windows_cover_audio(self):
+        windows = _make_windows(4.0, window=1.5, hop=0.75)
+
+        assert windows[0].tolist() == [0.0, 1.5]
+        assert windows[1].tolist() == [0.75, 2.25]
+        # 마지막 윈도우는 오디오 끝에 맞춤
+        assert windows[-1].tolist() == [2.5, 4.0]
+        assert _make_windows(1.0, window=1.5, hop=0.75).tolist() == [[0.0, 1.0]]
+        assert len(_make_windows(0.0, window=1.5, hop=0.75)) == 0
+
+    def test_assign_speakers_by_overlap(self):
+        turns = [
+            {"start": 0.0, "end": 1.5, "speaker": 3},
+            {"start": 0.75, "end": 2.25, "speaker": 3},
+            {"start": 1.5, "end": 3.0, "speaker": 1},
+            {"start": 2.25, "end": 3.75, "speaker": 1},
+        ]
+        result = {
+            "language": "ko",
+            "segments": [
+                {"start": 0.0, "end": 1.4, "text": "a", "words": [
+                    {"word": "a", "start": 0.0, "end": 0.5},
+                ]},
+                {"start": 2.4, "end": 3.6, "text": "b"},
+                # 윈도우 밖 세그먼트는 가장 가까운 윈도우의 화자
+                {"start": 5.0, "end": 6.0, "text": "c"},
+            ],
+        }
+
+        output = DiarizationProcessor.assign_speakers(result, turns)
+
+        # 처음 등장한 화자부터 0번
+        assert [s["speaker"] for s in output["segments"]] == ["발언자_0", "발언자_1", "발언자_1"]
+        assert output["segments"][0]["words"][0]["speaker"] == "발언자_0"
+        assert output["language"] == "ko"
+        # 원본은 수정하지 않음
+        assert "speaker" not in result["segments"][0]
+
+    def test_process_window_mode(self):
+        processor = DiarizationProcessor()
+        turns = [{"start": 0.0, "end": 1.5, "speaker": 0}]
+        with patch.object(processor, "diarize_windows", return_value=turns) as windows:
+            output = processor.process(
+                "a.wav",
+                {"segments": [{"start": 0.0, "end": 1.0, "text": "a"}]},
+                min_speakers=1,
+                max_speakers=3,
+                mode="window",
+            )
+
+        windows.assert_called_once_with("a.wav", 1, 3, audio=None)
+        assert output["segments"][0]["speaker"] == "발언자_0"
+
+
+class TestDiarizationProcessor:
+    def test_settings_defaults(self):
+        with patch("app.core.processors.diarization.settings") as mock_settings:
+            mock_settings.diarization_batch_size = 16
+            processor = DiarizationProcessor()
+
+        assert processor.batch_size == 16
+        assert DiarizationProcessor(batch_size=8).batch_size == 8
+
+    def test_configure_torch_threads(self):
+        with patch("app.core.processors.diarization.torch.set_num_threads") as set_threads, \
+                patch("app.core.processors.diarization.settings") as mock_settings:
+            mock_settings.diarization_num_threads = 4
+            configure_torch_threads()
+            configure_torch_threads(0)
+
+        set_threads.assert_called_once_with(4)
+
+    def test_process_labels_segments_from_batched_embeddings(self):
+        processor = DiarizationProcessor(batch_size=4)
+        processor.is_loaded = True
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "a", "words": [{"word": "a", "start": 0.1, "end": 0.5, "score": 0.9}]},
+            {"start": 1.0, "end": 2.5, "text": "b"},
+            {"start": 2.5, "end": 3.0, "text": "c"},
+        ]
+        embeddings = np.eye(3, dtype=np.float32)
+        clustering = MagicMock()
+        clustering.cluster.return_value = np.array([0, 1, 0])
+
+        with patch.object(
+            processor, "_extract_embeddings", return_value=embeddings
+        ) as extract, patch(
+            "app.core.processors.diarization.AgglomerativeClustering",
+            return_value=clustering,
+        ):
+            result = processor.process(
+                "a.wav", {"segments": segments}, audio=np.zeros(48000, dtype=np.float32)
+            )
+
+        extract.assert_called_once()
+        clustering.cluster.assert_called_once_with(embeddings)
+        assert [s["speaker"] for s in result["segments"]] == ["발언자_0", "발언자_1", "발언자_0"]
+        # ASR 단어 타임스탬프는 그대로 유지
+        assert result["segments"][0]["words"] == segments[0]["words"]
+
+    def test_device_follows_job_and_fp16_only_on_gpu(self):
+        with patch("app.core.processors.diarization.torch.cuda.is_available", return_value=True):
+            gpu = DiarizationProcessor(device="cuda:1", fp16=True)
+            cpu = DiarizationProcessor(device="cpu", fp16=True)
+
+        assert gpu.device == "cuda:1"
+        assert gpu.fp16 is True
+        assert cpu.fp16 is False
+
+    def test_falls_back_to_cpu_without_cuda(self):
+        with patch("app.core.processors.diarization.torch.cuda.is_available", return_value=False):
+            processor = DiarizationProcessor(device="cuda", fp16=True)
+
+        assert processor.device == "cpu"
+        assert processor.fp16 is False
+
+    def test_load_maps_checkpoint_to_device(self):
+        model = MagicMock()
+        with patch("app.core.processors.diarization.torch.cuda.is_available", return_value=True), \
+                patch("app.core.processors.diarization.hf_hub_download", return_value="ckpt.bin"), \
+                patch("app.core.processors.diarization.WeSpeakerResNet34") as wespeaker:
+            wespeaker.load_from_checkpoint.return_value = model
+            processor = DiarizationProcessor(device="cuda", fp16=True)
+            processor.load_embedding_model()
+
+        wespeaker.load_from_checkpoint.assert_called_once_with(
+            "ckpt.bin", strict=False, map_location="cuda"
+        )
+        model.eval.assert_called_once()
+        model.to.assert_called_once_with("cuda")
+        model.resnet.half.assert_called_once()
+
+    def test_load_prefers_pinned_checkpoint(self, tmp_path):
+        from app.core.models.weights import ModelWeightStore
+
+        checkpoint = tmp_path / "pytorch_model.bin"
+        checkpoint.write_bytes(b"")
+        store = ModelWeightStore(tmp_path, offline=True)
+        store.pin("wespeaker", WESPEAKER_REPO_ID, str(checkpoint))
+        with patch("app.core.processors.diarization.model_weight_store", store), \
+                patch("app.core.processors.diarization.hf_hub_download") as download, \
+                patch("app.core.processors.diarization.WeSpeakerResNet34") as wespeaker:
+            DiarizationProcessor().load_embedding_model()
+
+        download.assert_not_called()
+        assert wespeaker.load_from_checkpoint.call_args.args[0] == str(checkpoint.resolve())
+
+
+class TestEmbeddingModelCache:
+    def test_warm_processors_reuse_loaded_model(self):
+        model = MagicMock()
+        with patch("app.core.processors.diarization._load_wespeaker", return_value=model) as load:
+            for _ in range(3):
+                processor = DiarizationProcessor(hf_token="t", device="cpu")
+                processor.load_embedding_model()
+                assert processor.embedding_model is model
+                processor.unload_model()
+
+        # 파일/작업마다 다시 로드하지 않음
+        load.assert_called_once_with("t", "cpu", False)
+
+    def test_keyed_by_device_and_precision(self):
+        cache = EmbeddingModelCache(idle_timeout=0)
+        with patch("app.core.processors.diarization._load_wespeaker",
+                   side_effect=lambda token, device, fp16: MagicMock()) as load:
+            cpu = cache.acquire(None, "cpu").model
+            gpu = cache.acquire(None, "cuda", fp16=True).model
+            assert cache.acquire(None, "cpu").model is cpu
+
+        assert cpu is not gpu
+        assert load.call_count == 2
+        assert cache.get_cache_info()["entries"]["cpu"]["in_use"] == 2
+
+    def test_idle_models_evicted_but_leased_models_kept(self):
+        cache = EmbeddingModelCache(idle_timeout=60)
+        with patch("app.core.processors.diarization._load_wespeaker",
+                   side_effect=lambda token, device, fp16: MagicMock()), \
+                patch.object(EmbeddingModelCache, "_schedule_sweep"):
+            cpu = cache.acquire(None, "cpu")
+            cache.acquire(None, "cuda")
+            cpu.release()
+            later = time.monotonic() + 61
+
+            assert cache.evict_idle(now=later) == 1
+
+        assert list(cache.get_cache_info()["entries"]) == ["cuda"]
+
+    def test_explicit_unload_forces_reload(self):
+        cache = EmbeddingModelCache(idle_timeout=0)
+        with patch("app.core.processors.diarization._load_wespeaker",
+                   side_effect=lambda token, device, fp16: MagicMock()) as load:
+            cache.acquire(None, "cpu").release()
+            assert cache.unload("cpu") is True
+            assert cache.unload("cpu") is False
+            cache.acquire(None, "cpu")
+
+        assert load.call_count == 2
+
+    def test_release_applies_to_leased_entry_only(self):
+        cache = EmbeddingModelCache(idle_timeout=0)
+        with patch("app.core.processors.diarization._load_wespeaker",
+                   side_effect=lambda token, device, fp16: MagicMock()):
+            stale = cache.acquire(None, "cpu")
+            cache.unload("cpu")
+            fresh = cache.acquire(None, "cpu")
+
+            # 내려간 모델의 임대 반환(중복 포함)이 새로 로드된 모델의 임대를 풀지 않음
+            stale.release()
+            stale.release()
+            assert cache.get_cache_info()["entries"]["cpu"]["in_use"] == 1
+
+            with cache.acquire(None, "cpu") as model:
+                assert model is fresh.model
+                assert cache.get_cache_info()["entries"]["cpu"]["in_use"] == 2
+            fresh.release()
+
+        assert cache.get_cache_info()["entries"]["cpu"]["in_use"] == 0
+
+
+def make_speakers(num_speakers, per_speaker, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(num_speakers, dim)) * 5
+    labels = np.repeat(np.arange(num_speakers), per_speaker)
+    rng.shuffle(labels)
+    return centers[labels] + rng.normal(scale=0.1, size=(len(labels), dim)), labels
+
+
+def same_partition(a, b):
+    # 레이블 번호와 무관하게 같은 묶음인지 확인
+    pairs = set(zip(np.asarray(a).tolist(), np.asarray(b).tolist()))
+    return len(pairs) == len(set(a)) == len(set(b))
+
+
+class TestAgglomerativeClustering:
+    def test_threshold_is_configurable(self):
+        assert AgglomerativeClustering().threshold == 0.8
+        assert AgglomerativeClustering(threshold=0.5).threshold == 0.5
+
+    def test_search_reaches_requested_cluster_count(self):
+        embeddings, labels = make_speakers(3, 40)
+        clusters = AgglomerativeClustering().cluster(
+            embeddings, min_clusters=5, max_clusters=5
+        )
+
+        assert len(clusters) == len(labels)
+        assert len(np.unique(clusters)) == 5
+
+    def test_large_inputs_cluster_subset_and_assign_rest(self):
+        embeddings, labels = make_speakers(4, 500)
+        model = AgglomerativeClustering(max_num_embeddings=200)
+        with patch("woa.diarize.linkage", wraps=diarize.linkage) as linkage:
+            clusters = model.cluster(embeddings.copy(), min_clusters=1, max_clusters=10)
+
+        # linkage는 부분집합에만 수행되어 메모리가 제한됨
+        assert all(call.args[0].shape[0] <= 200 for call in linkage.call_args_list)
+        assert len(clusters) == len(labels)
+        assert same_partition(clusters, labels)
+
+    def test_single_embedding(self):
+        clusters = AgglomerativeClustering().cluster(np.ones((1, 4)))
+        assert clusters.tolist() == [0]
+
+    def test_does_not_modify_caller_embeddings_or_print(self, capsys):
+        embeddings, _ = make_speakers(2, 20)
+        original = embeddings.copy()
+
+        AgglomerativeClustering().cluster(embeddings)
+
+        np.testing.assert_array_equal(embeddings, original)
+        assert capsys.readouterr().out == ""
+
+    def test_small_clusters_merged_into_nearest_large_cluster(self):
+        embeddings, labels = make_speakers(2, 30)
+        # 두 화자 근처의 외톨이 임베딩 (단독으로는 작은 군집)
+        outlier = embeddings[labels == 0][0] * 1.3 + 0.5
+        embeddings = np.vstack([embeddings, outlier])
+
+        clusters = AgglomerativeClustering(threshold=0.05, min_cluster_size=5).cluster(
+            embeddings, min_clusters=1, max_clusters=2
+        )
+
+        assert len(np.unique(clusters)) == 2
+        assert same_partition(clusters[:-1], labels)
+        assert clusters[-1] == clusters[:-1][labels == 0][0]
+
+    def test_centroids_match_per_cluster_mean(self):
+        rng = np.random.default_rng(1)
+        embeddings = rng.normal(size=(50, 8))
+        clusters = rng.integers(0, 5, size=50)
+
+        centroids = AgglomerativeClustering._centroids(embeddings, clusters)
+
+        expected = np.vstack([embeddings[clusters == k].mean(axis=0) for k in range(5)])
+        np.testing.assert_allclose(centroids, expected)
@@ -0,0 +1,98 @@
+"""
+StageExecutor 단위 테스트
+"""
+import asyncio
+import threading
+import time
+
+from app.services.executor import StageExecutor, StageTimings
+
+
+class TestStageExecutor:
+    """단계별 스레드 풀 실행기 테스트"""
+
+    async def test_runs_off_event_loop_thread(self):
+        """블로킹 함수는 이벤트 루프 스레드가 아닌 단계 스레드에서 실행"""
+        executor = StageExecutor({"asr": 1})
+        loop_thread = threading.current_thread().name
+
+        try:
+            thread_name = await executor.run("asr", lambda: threading.current_thread().name)
+        finally:
+            executor.shutdown()
+
+        assert thread_name != loop_thread
+        assert thread_name.startswith("stage-asr")
+
+    async def test_event_loop_stays_responsive(self):
+        """블로킹 작업 중에도 이벤트 루프의 다른 코루틴이 진행"""
+        executor = StageExecutor({"asr": 1})
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        try:
+            await executor.run("asr", time.sleep, 0.1)
+        finally:
+            task.cancel()
+            executor.shutdown()
+
+        assert ticks > 5
+
+    async def test_records_stage_timings(self):
+        """단계별 소요 시간이 합산되어 기록"""
+        executor = StageExecutor({"write": 2})
+        timings = StageTimings()
+
+        try:
+            await executor.run("write", time.sleep, 0.02, timings=timings)
+            await executor.run("write", time.sleep, 0.02, timings=timings)
+            await executor.run("asr", lambda: None, timings=timings)
+        finally:
+            executor.shutdown()
+
+        result = timings.as_dict()
+        assert result["write"] >= 0.04
+        assert "asr" in result
+
+    async def test_queue_wait_is_recorded_separately(self):
+        """풀 스레드를 기다린 시간은 단계 시간에 포함되지 않음"""
+        executor = StageExecutor({"asr": 1})
+        timings = StageTimings()
+
+        try:
+            await asyncio.gather(
+                executor.run("asr", time.sleep, 0.1, timings=timings),
+                executor.run("asr", time.sleep, 0.1, timings=timings),
+            )
+        finally:
+            executor.shutdown()
+
+        result = timings.as_dict()
+        # 두 번째 호출은 첫 번째가 끝날 때까지 대기 (대기 시간은 asr_wait)
+        assert 0.2 <= result["asr"] < 0.3
+        assert result["asr_wait"] >= 0.09
+
+    async def test_exception_propagates_and_is_timed(self):
+        """예외는 호출자에게 전달되고 시간은 기록"""
+        executor = StageExecutor({})
+        timings = StageTimings()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        try:
+            try:
+                await executor.run("diarization", fail, timings=timings)
+                assert False, "RuntimeError expected"
+            except RuntimeError as e:
+                assert str(e) == "boom"
+        finally:
+            executor.shutdown()
+
+        assert "diarization" in timings.as_dict()
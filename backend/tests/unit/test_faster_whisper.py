@@ -0,0 +1,175 @@
+"""
+FasterWhisper 어댑터 단위 테스트 (WhisperModel은 Mock)
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.models.faster_whisper import FasterWhisperModel
+
+
+def make_segment(start, end, text):
+    return SimpleNamespace(start=start, end=end, text=text, words=None)
+
+
+def loaded_model():
+    model = FasterWhisperModel("tiny", "cpu")
+    model.model = MagicMock()
+    model.model.transcribe.return_value = (iter([make_segment(0.0, 1.0, "sequential")]), None)
+    model.is_loaded = True
+    return model
+
+
+class TestLoadModel:
+    def test_loads_pinned_local_path_offline(self, tmp_path):
+        from app.core.models.weights import ModelWeightStore
+
+        store = ModelWeightStore(tmp_path, offline=True)
+        store.pin("faster_whisper", "tiny", str(tmp_path))
+        with patch("app.core.models.faster_whisper.model_weight_store", store), \
+                patch("app.core.models.faster_whisper.WhisperModel") as whisper_model:
+            FasterWhisperModel("tiny", "cpu").load_model()
+
+        args, kwargs = whisper_model.call_args
+        assert args[0] == str(tmp_path.resolve())
+        assert kwargs["download_root"] == str(tmp_path)
+        assert kwargs["local_files_only"] is True
+
+
+class TestAsrOptions:
+    def test_options_match_faster_whisper_signature(self):
+        options = FasterWhisperModel._asr_options({"temperature": 0.2, "patience": 0, "length_penalty": 1.5})
+
+        assert options["temperature"] == 0.2
+        assert options["length_penalty"] == 1.5
+        # 0은 기본값 사용 (None을 넘기지 않음)
+        assert "patience" not in options
+        assert "temperatures" not in options
+        assert "suppress_numerals" not in options
+        assert options["word_timestamps"] is False
+
+    def test_word_timestamps_passed_through(self):
+        model = loaded_model()
+        word = SimpleNamespace(word=" hi", start=0.123456, end=0.5, probability=0.98765)
+        segment = SimpleNamespace(start=0.0, end=1.0, text=" hi", words=[word])
+        model.model.transcribe.return_value = (iter([segment]), None)
+
+        result = model.transcribe("a.wav", None, {"batch_size": 1, "word_timestamps": True})
+
+        assert model.model.transcribe.call_args.kwargs["word_timestamps"] is True
+        # 디코딩 한 번으로 단어 정보까지 (정렬 패스 없음)
+        assert result["segments"][0]["words"] == [
+            {"word": " hi", "start": 0.123, "end": 0.5, "score": 0.988}
+        ]
+
+
+class TestBatchedInference:
+    def test_batch_size_uses_vad_batched_pipeline(self):
+        model = loaded_model()
+        with patch("app.core.models.faster_whisper.BatchedInferencePipeline") as pipeline_class:
+            pipeline = pipeline_class.return_value
+            pipeline.transcribe.return_value = (
+                iter([make_segment(0.0, 2.0, "a"), make_segment(31.0, 33.0, "b")]),
+                None,
+            )
+            result = model.transcribe("a.wav", "ko", {"batch_size": 8, "vad_onset": 0.4, "vad_offset": 0.3})
+
+        pipeline_class.assert_called_once_with(model=model.model)
+        kwargs = pipeline.transcribe.call_args.kwargs
+        assert kwargs["batch_size"] == 8
+        assert kwargs["vad_filter"] is True
+        assert kwargs["vad_parameters"] == {
+            "threshold": 0.4,
+            "neg_threshold": 0.3,
+            "min_silence_duration_ms": 160,
+        }
+        assert "condition_on_previous_text" not in kwargs
+        model.model.transcribe.assert_not_called()
+        assert [s["start"] for s in result["segments"]] == [0.0, 31.0]
+
+    def test_batch_size_one_decodes_sequentially(self):
+        model = loaded_model()
+        with patch("app.core.models.faster_whisper.BatchedInferencePipeline") as pipeline_class:
+            result = model.transcribe("a.wav", None, {"batch_size": 1})
+
+        pipeline_class.assert_not_called()
+        assert result["segments"][0]["text"] == "sequential"
+
+    def test_disabled_by_setting(self):
+        model = loaded_model()
+        with patch("app.core.models.faster_whisper.BatchedInferencePipeline") as pipeline_class, \
+                patch("app.core.models.faster_whisper.settings.faster_whisper_batched", False):
+            model.transcribe("a.wav", None, {"batch_size": 8})
+
+        pipeline_class.assert_not_called()
+        model.model.transcribe.assert_called_once()
+
+    def test_vad_parameters_accepted_by_vad_options(self):
+        vad = pytest.importorskip("faster_whisper.vad")
+        model = loaded_model()
+        with patch("app.core.models.faster_whisper.BatchedInferencePipeline") as pipeline_class:
+            pipeline_class.return_value.transcribe.return_value = (iter([]), None)
+            model.transcribe("a.wav", None, {"batch_size": 8, "vad_onset": 0.4, "vad_offset": 0.3})
+
+        options = vad.VadOptions(**pipeline_class.return_value.transcribe.call_args.kwargs["vad_parameters"])
+        assert options.threshold == 0.4
+        assert options.neg_threshold == 0.3
+
+    def test_falls_back_to_sequential_when_unavailable(self):
+        model = loaded_model()
+        with patch("app.core.models.faster_whisper.BatchedInferencePipeline") as pipeline_class:
+            pipeline_class.return_value.transcribe.side_effect = ImportError("No module named 'onnxruntime'")
+            result = model.transcribe("a.wav", None, {"batch_size": 8})
+
+        assert result["segments"][0]["text"] == "sequential"
+
+    def test_other_batched_errors_are_raised(self):
+        model = loaded_model()
+        with patch("app.core.models.faster_whisper.BatchedInferencePipeline") as pipeline_class:
+            pipeline_class.return_value.transcribe.side_effect = TypeError("unexpected keyword")
+            with pytest.raises(TypeError):
+                model.transcribe("a.wav", None, {"batch_size": 8})
+
+        model.model.transcribe.assert_not_called()
+
+
+class TestTranscribeIter:
+    def test_segments_are_yielded_lazily(self):
+        model = loaded_model()
+        decoded = []
+
+        def lazy_segments():
+            for i in range(3):
+                decoded.append(i)
+                yield make_segment(float(i), float(i + 1), f"s{i}")
+
+        model.model.transcribe.return_value = (lazy_segments(), None)
+        iterator = model.transcribe_iter("a.wav", None, {"batch_size": 1})
+
+        first = next(iterator)
+        # 첫 세그먼트를 받을 때 나머지는 아직 디코딩되지 않음
+        assert first["text"] == "s0"
+        assert decoded == [0]
+        assert [s["text"] for s in iterator] == ["s1", "s2"]
+        assert model.supports_streaming is True
+
+    def test_batched_failure_after_first_segment_is_raised(self):
+        model = loaded_model()
+
+        def failing_segments():
+            yield make_segment(0.0, 1.0, "a")
+            raise RuntimeError("decode failed")
+
+        with patch("app.core.models.faster_whisper.BatchedInferencePipeline") as pipeline_class:
+            pipeline_class.return_value.transcribe.return_value = (failing_segments(), None)
+            iterator = model.transcribe_iter("a.wav", None, {"batch_size": 8})
+            assert next(iterator)["text"] == "a"
+            try:
+                next(iterator)
+            except RuntimeError:
+                pass
+            else:  # pragma: no cover
+                raise AssertionError("expected RuntimeError")
+
+        model.model.transcribe.assert_not_called()
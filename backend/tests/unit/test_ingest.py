@@ -0,0 +1,91 @@
+"""
+업로드 후 정규화(ingest) 단위 테스트
+"""
+import subprocess
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import soundfile
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.audio import SAMPLE_RATE, transcode_canonical
+from app.db.base import Base
+from app.db.models import UploadedFile
+from app.services.ingest import normalize_uploaded_file
+
+
+def fake_ffmpeg(cmd, **kwargs):
+    """ffmpeg 대신 출력 경로에 0.5초 16kHz 파일 생성"""
+    target = cmd[-1]
+    fmt = "FLAC" if target.endswith(".flac") else "WAV"
+    soundfile.write(target, np.zeros(SAMPLE_RATE // 2, dtype=np.float32), SAMPLE_RATE, subtype="PCM_16", format=fmt)
+    return subprocess.CompletedProcess(cmd, 0)
+
+
+class TestTranscodeCanonical:
+    @pytest.mark.parametrize("fmt,suffix,codec", [("flac", ".flac", "flac"), ("wav", ".wav", "pcm_s16le")])
+    def test_ffmpeg_command_and_sample_count(self, tmp_path, fmt, suffix, codec):
+        with patch("app.core.audio.shutil.which", return_value="/usr/bin/ffmpeg"), \
+                patch("app.core.audio.subprocess.run", side_effect=fake_ffmpeg) as run:
+            path, samples = transcode_canonical("/data/video.mp4", tmp_path, "file-1", fmt)
+
+        cmd = run.call_args.args[0]
+        assert cmd[cmd.index("-ar") + 1] == "16000"
+        assert cmd[cmd.index("-ac") + 1] == "1"
+        assert cmd[cmd.index("-c:a") + 1] == codec
+        assert path == tmp_path / f"file-1{suffix}"
+        assert samples == SAMPLE_RATE // 2
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            transcode_canonical("/data/a.wav", tmp_path, "x", "mp3")
+
+    def test_failure_removes_partial_output(self, tmp_path):
+        error = subprocess.CalledProcessError(1, "ffmpeg")
+        with patch("app.core.audio.shutil.which", return_value="/usr/bin/ffmpeg"), \
+                patch("app.core.audio.subprocess.run", side_effect=error):
+            with pytest.raises(RuntimeError):
+                transcode_canonical("/data/broken.mp4", tmp_path, "file-1")
+        assert not list(tmp_path.iterdir())
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ingest.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as db:
+        db.add(UploadedFile(id="file-1", original_filename="talk.mp4", storage_path="/data/talk.mp4"))
+        await db.commit()
+
+    yield factory
+
+    await engine.dispose()
+
+
+class TestNormalizeUploadedFile:
+    async def test_records_canonical_file(self, session_factory, tmp_path):
+        with patch("app.core.audio.shutil.which", return_value="/usr/bin/ffmpeg"), \
+                patch("app.core.audio.subprocess.run", side_effect=fake_ffmpeg), \
+                patch("app.services.ingest.settings.upload_dir", tmp_path), \
+                patch("app.services.ingest.settings.ingest_format", "flac"):
+            path = await normalize_uploaded_file("file-1", session_factory)
+
+        assert path == str(tmp_path / "canonical" / "file-1.flac")
+        async with session_factory() as db:
+            file = await db.get(UploadedFile, "file-1")
+        assert file.canonical_path == path
+        assert file.sample_count == SAMPLE_RATE // 2
+        assert file.duration == pytest.approx(0.5)
+
+    async def test_failure_keeps_original(self, session_factory, tmp_path):
+        with patch("app.services.ingest.transcode_canonical", side_effect=RuntimeError("boom")), \
+                patch("app.services.ingest.settings.upload_dir", tmp_path):
+            assert await normalize_uploaded_file("file-1", session_factory) is None
+
+        async with session_factory() as db:
+            file = await db.get(UploadedFile, "file-1")
+        assert file.canonical_path is None
@@ -0,0 +1,156 @@
+"""
+DB 기반 작업 큐(JobQueue) 단위 테스트
+
+임시 SQLite 파일 DB를 사용합니다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models import Job, JobStatus
+from app.services.job_queue import JobPoller, JobQueue
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """임시 SQLite DB 세션 팩토리"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'queue.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def add_job(factory, job_id, priority=0, created_offset=0, **kwargs):
+    """테스트용 Job 행 추가"""
+    async with factory() as db:
+        db.add(Job(
+            id=job_id,
+            model_type="faster_whisper",
+            model_size="tiny",
+            device="cpu",
+            parameters={},
+            output_formats=["json"],
+            priority=priority,
+            created_at=datetime.utcnow() + timedelta(seconds=created_offset),
+            **kwargs,
+        ))
+        await db.commit()
+
+
+async def get_job(factory, job_id):
+    async with factory() as db:
+        return await db.get(Job, job_id)
+
+
+class TestJobQueue:
+    """선점/임대/복구 테스트"""
+
+    async def test_claim_orders_by_priority_then_fifo(self, session_factory):
+        await add_job(session_factory, "old-low", priority=0, created_offset=0)
+        await add_job(session_factory, "new-low", priority=0, created_offset=1)
+        await add_job(session_factory, "high", priority=5, created_offset=2)
+
+        queue = JobQueue(session_factory, worker_id="w1")
+
+        assert await queue.next_queued(limit=3) == ["high", "old-low", "new-low"]
+        assert await queue.claim() == "high"
+        assert await queue.claim() == "old-low"
+
+        job = await get_job(session_factory, "high")
+        assert job.status == JobStatus.PROCESSING
+        assert job.worker_id == "w1"
+        assert job.attempts == 1
+        assert job.lease_expires_at > datetime.utcnow()
+
+    async def test_claim_is_exclusive(self, session_factory):
+        """여러 워커가 동시에 같은 작업을 선점하면 하나만 성공"""
+        await add_job(session_factory, "job-1")
+
+        queues = [JobQueue(session_factory, worker_id=f"w{i}") for i in range(5)]
+        results = await asyncio.gather(*(q.claim("job-1") for q in queues))
+
+        assert results.count("job-1") == 1
+        assert results.count(None) == 4
+
+    async def test_heartbeat_requires_ownership(self, session_factory):
+        await add_job(session_factory, "job-1")
+        owner = JobQueue(session_factory, worker_id="owner")
+        other = JobQueue(session_factory, worker_id="other")
+
+        await owner.claim("job-1")
+
+        assert await owner.heartbeat("job-1") is True
+        assert await other.heartbeat("job-1") is False
+
+    async def test_recover_stale_requeues_expired_lease(self, session_factory):
+        await add_job(
+            session_factory,
+            "stale",
+            status=JobStatus.PROCESSING,
+            worker_id="dead",
+            attempts=1,
+            lease_expires_at=datetime.utcnow() - timedelta(seconds=1),
+        )
+        await add_job(
+            session_factory,
+            "alive",
+            status=JobStatus.PROCESSING,
+            worker_id="live",
+            attempts=1,
+            lease_expires_at=datetime.utcnow() + timedelta(minutes=5),
+        )
+
+        queue = JobQueue(session_factory, worker_id="w1", max_attempts=3)
+
+        assert await queue.recover_stale() == 1
+        assert (await get_job(session_factory, "stale")).status == JobStatus.QUEUED
+        assert (await get_job(session_factory, "alive")).status == JobStatus.PROCESSING
+        assert await queue.claim() == "stale"
+
+    async def test_recover_stale_fails_after_max_attempts(self, session_factory):
+        await add_job(
+            session_factory,
+            "poison",
+            status=JobStatus.PROCESSING,
+            worker_id="dead",
+            attempts=3,
+            lease_expires_at=datetime.utcnow() - timedelta(seconds=1),
+        )
+
+        queue = JobQueue(session_factory, worker_id="w1", max_attempts=3)
+        await queue.recover_stale()
+
+        job = await get_job(session_factory, "poison")
+        assert job.status == JobStatus.FAILED
+        assert "lease expired" in job.error_message
+
+
+class TestJobPoller:
+    """폴러가 스케줄러 여유만큼만 작업을 등록하는지 검증"""
+
+    async def test_poll_once_respects_capacity(self, session_factory):
+        for idx in range(4):
+            await add_job(session_factory, f"job-{idx}", created_offset=idx)
+
+        submitted = []
+
+        class FakeScheduler:
+            def stats(self):
+                return {"max_workers": 2, "queued": 0, "running": len(submitted)}
+
+            def submit(self, job_id, priority=0):
+                submitted.append(job_id)
+                return True
+
+        poller = JobPoller(JobQueue(session_factory, worker_id="w1"), FakeScheduler())
+
+        assert await poller.poll_once() == 2
+        assert submitted == ["job-0", "job-1"]
+        assert await poller.poll_once() == 0
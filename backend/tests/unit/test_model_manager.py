@@ -222,3 +222,508 @@ class TestModelManager:
 
         # load_model이 호출되었는지 확인
         mock_model.load_model.assert_called_once()
+
+
+class TestModelCacheBudget:
+    """메모리 예산 기반 LRU 제거 테스트"""
+
+    @staticmethod
+    def _mock_model(vram_bytes=0, ram_bytes=0):
+        model = Mock(spec=ASRModelBase)
+        model.estimate_memory.return_value = {"ram_bytes": ram_bytes, "vram_bytes": vram_bytes}
+        return model
+
+    @patch('app.core.models.manager.settings.model_cache_max_models', 2)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_lru_eviction_by_model_count(self, mock_faster_class):
+        """최대 모델 수 초과 시 가장 오래 사용하지 않은 모델 제거"""
+        tiny, base, small = self._mock_model(), self._mock_model(), self._mock_model()
+        mock_faster_class.side_effect = [tiny, base, small]
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        manager.get_model("faster_whisper", "tiny", "cpu", "int8")
+        manager.get_model("faster_whisper", "base", "cpu", "int8")
+        # tiny 재사용 → base가 LRU
+        manager.get_model("faster_whisper", "tiny", "cpu", "int8")
+        manager.get_model("faster_whisper", "small", "cpu", "int8")
+
+        base.unload_model.assert_called_once()
+        tiny.unload_model.assert_not_called()
+        assert set(manager.get_cache_info()["entries"]) == {
+            "faster_whisper_tiny_cpu_int8",
+            "faster_whisper_small_cpu_int8",
+        }
+
+    @patch('app.core.models.manager.settings.model_cache_max_vram_bytes', 10)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_vram_budget_evicts_before_load(self, mock_faster_class):
+        """VRAM 예산을 넘기 전에 기존 모델을 먼저 해제"""
+        first = self._mock_model(vram_bytes=6)
+        second = self._mock_model(vram_bytes=6)
+        mock_faster_class.side_effect = [first, second]
+
+        order = []
+        first.unload_model.side_effect = lambda: order.append("unload-first")
+        second.load_model.side_effect = lambda: order.append("load-second")
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        manager.get_model("faster_whisper", "medium", "cuda", "float16")
+        manager.get_model("faster_whisper", "large-v3", "cuda", "float16")
+
+        assert order == ["unload-first", "load-second"]
+        assert manager.get_cache_info()["vram_bytes"] == 6
+
+    @patch('app.core.models.manager.settings.model_cache_max_models', 1)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_pinned_model_not_evicted(self, mock_faster_class):
+        """고정된 모델만 남아 자리가 없으면 RuntimeError"""
+        pinned = self._mock_model()
+        mock_faster_class.side_effect = [pinned, self._mock_model()]
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        key = manager.make_key("faster_whisper", "large-v3", "cuda", "float16")
+        manager.pin(key)
+        try:
+            manager.get_model("faster_whisper", "large-v3", "cuda", "float16")
+
+            with pytest.raises(RuntimeError, match="budget"):
+                manager.get_model("faster_whisper", "tiny", "cuda", "float16")
+
+            pinned.unload_model.assert_not_called()
+            assert manager.get_cache_info()["entries"][key]["pinned"] is True
+        finally:
+            manager.unpin(key)
+            manager.clear_cache()
+
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_cache_info_reports_memory(self, mock_faster_class):
+        mock_faster_class.return_value = self._mock_model(ram_bytes=100)
+
+        manager = ModelManager()
+        manager.clear_cache()
+        manager.get_model("faster_whisper", "small", "cpu", "int8")
+
+        info = manager.get_cache_info()
+        assert info["ram_bytes"] == 100
+        assert info["entries"]["faster_whisper_small_cpu_int8"]["ram_bytes"] == 100
+
+
+class TestSingleFlightLoading:
+    """키별 단일 로드 테스트"""
+
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_concurrent_callers_share_one_load(self, mock_faster_class):
+        """같은 키를 동시에 요청하면 한 번만 로드"""
+        import time
+
+        mock_model = Mock(spec=ASRModelBase)
+        mock_model.load_model.side_effect = lambda: time.sleep(0.1)
+        mock_faster_class.return_value = mock_model
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        results = []
+
+        def load():
+            results.append(manager.get_model("faster_whisper", "large-v3", "cuda", "float16"))
+
+        threads = [threading.Thread(target=load) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_model.load_model.call_count == 1
+        assert mock_faster_class.call_count == 1
+        assert all(r is mock_model for r in results)
+
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_cached_key_not_blocked_by_other_load(self, mock_faster_class):
+        """다른 키가 로드 중이어도 캐시된 모델은 즉시 반환"""
+        release = threading.Event()
+        started = threading.Event()
+
+        cached = Mock(spec=ASRModelBase)
+        slow = Mock(spec=ASRModelBase)
+
+        def slow_load():
+            started.set()
+            release.wait(timeout=5)
+
+        slow.load_model.side_effect = slow_load
+        mock_faster_class.side_effect = [cached, slow]
+
+        manager = ModelManager()
+        manager.clear_cache()
+        manager.get_model("faster_whisper", "tiny", "cpu", "int8")
+
+        loader = threading.Thread(
+            target=manager.get_model, args=("faster_whisper", "large-v3", "cuda", "float16")
+        )
+        loader.start()
+        try:
+            assert started.wait(timeout=5)
+            # 로드가 끝나지 않은 상태에서 캐시된 모델 조회
+            assert manager.get_model("faster_whisper", "tiny", "cpu", "int8") is cached
+        finally:
+            release.set()
+            loader.join()
+
+    @patch('app.core.models.manager.settings.model_cache_wait_seconds', 5)
+    @patch('app.core.models.manager.settings.model_cache_max_models', 1)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_concurrent_loads_of_distinct_keys_wait_for_budget(self, mock_faster_class):
+        """예산이 진행 중인 다른 키의 로드로만 차 있으면 실패하지 않고 로드 완료를 기다림"""
+        release = threading.Event()
+        started = threading.Event()
+        first, second = Mock(spec=ASRModelBase), Mock(spec=ASRModelBase)
+        order = []
+
+        def slow_load():
+            started.set()
+            release.wait(timeout=5)
+            order.append("load-a")
+
+        first.load_model.side_effect = slow_load
+        first.unload_model.side_effect = lambda: order.append("unload-a")
+        second.load_model.side_effect = lambda: order.append("load-b")
+        mock_faster_class.side_effect = [first, second]
+
+        manager = ModelManager()
+        manager.clear_cache()
+        errors = []
+
+        def load(size):
+            try:
+                manager.get_model("faster_whisper", size, "cpu", "int8")
+            except Exception as exc:  # pragma: no cover (실패 시 아래에서 확인)
+                errors.append(exc)
+
+        loader_a = threading.Thread(target=load, args=("a",))
+        loader_a.start()
+        assert started.wait(timeout=5)
+        loader_b = threading.Thread(target=load, args=("b",))
+        loader_b.start()
+        try:
+            loader_b.join(timeout=0.1)
+            # a가 자리를 확보한 채 로드 중이므로 b는 대기
+            assert loader_b.is_alive()
+        finally:
+            release.set()
+            loader_a.join(timeout=5)
+            loader_b.join(timeout=5)
+
+        assert errors == []
+        assert order == ["load-a", "unload-a", "load-b"]
+        assert set(manager.get_cache_info()["entries"]) == {"faster_whisper_b_cpu_int8"}
+        manager.clear_cache()
+
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_failed_load_propagates_to_waiters_and_allows_retry(self, mock_faster_class):
+        broken = Mock(spec=ASRModelBase)
+        broken.load_model.side_effect = RuntimeError("download failed")
+        healthy = Mock(spec=ASRModelBase)
+        mock_faster_class.side_effect = [broken, healthy]
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        with pytest.raises(RuntimeError, match="download failed"):
+            manager.get_model("faster_whisper", "large-v3", "cuda", "float16")
+
+        # 실패 후 재시도는 새로 로드
+        assert manager.get_model("faster_whisper", "large-v3", "cuda", "float16") is healthy
+
+    @patch('app.core.models.manager.FasterWhisperModel')
+    async def test_aget_model(self, mock_faster_class):
+        mock_model = Mock(spec=ASRModelBase)
+        mock_faster_class.return_value = mock_model
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        assert await manager.aget_model("faster_whisper", "base", "cpu", "int8") is mock_model
+
+
+class TestModelLease:
+    """참조 카운트 임대 테스트"""
+
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_clear_cache_defers_unload_until_release(self, mock_faster_class):
+        mock_model = Mock(spec=ASRModelBase)
+        mock_faster_class.return_value = mock_model
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        lease = manager.lease("faster_whisper", "large-v3", "cuda", "float16")
+        info = manager.get_cache_info()
+        assert info["in_use"] == 1
+        assert info["entries"]["faster_whisper_large-v3_cuda_float16"]["in_use"] == 1
+
+        manager.clear_cache()
+        mock_model.unload_model.assert_not_called()
+        assert manager.get_cache_info()["draining"] == 1
+
+        lease.release()
+        mock_model.unload_model.assert_called_once()
+        assert manager.get_cache_info()["draining"] == 0
+
+        # 중복 반환은 무시
+        lease.release()
+        mock_model.unload_model.assert_called_once()
+
+    @patch('app.core.models.manager.settings.model_cache_wait_seconds', 5)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_lease_is_exclusive_per_replica(self, mock_faster_class):
+        """레플리카가 하나면 두 번째 임대는 첫 임대가 반환될 때까지 대기"""
+        mock_model = Mock(spec=ASRModelBase)
+        mock_faster_class.return_value = mock_model
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        first = manager.lease("faster_whisper", "base", "cpu", "int8")
+        assert first.capacity == 1
+        leased = []
+        waiter = threading.Thread(
+            target=lambda: leased.append(manager.lease("faster_whisper", "base", "cpu", "int8"))
+        )
+        waiter.start()
+        try:
+            waiter.join(timeout=0.1)
+            assert leased == []
+            assert manager.get_cache_info()["entries"]["faster_whisper_base_cpu_int8"]["in_use"] == 1
+        finally:
+            first.release()
+            waiter.join(timeout=5)
+
+        assert leased[0].model is mock_model
+        leased[0].release()
+        assert manager.get_cache_info()["in_use"] == 0
+        # 캐시에 남아 있는 모델은 반환 후에도 언로드되지 않음
+        mock_model.unload_model.assert_not_called()
+
+    @patch('app.core.models.manager.settings.model_cache_wait_seconds', 0.05)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_lease_times_out_when_replicas_busy(self, mock_faster_class):
+        mock_faster_class.return_value = Mock(spec=ASRModelBase)
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        with manager.lease("faster_whisper", "base", "cpu", "int8"):
+            with pytest.raises(RuntimeError, match="free replica"):
+                manager.lease("faster_whisper", "base", "cpu", "int8")
+        assert manager.get_cache_info()["in_use"] == 0
+
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_replica_concurrency_allows_shared_slots(self, mock_faster_class):
+        """max_concurrency > 1인 레플리카(CTranslate2 num_workers)는 그만큼 임대를 동시에 허용"""
+        mock_model = Mock(spec=ASRModelBase)
+        mock_model.max_concurrency = 2
+        mock_faster_class.return_value = mock_model
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        with manager.lease("faster_whisper", "base", "cpu", "int8") as first:
+            with manager.lease("faster_whisper", "base", "cpu", "int8") as second:
+                assert first is second is mock_model
+                entry = manager.get_cache_info()["entries"]["faster_whisper_base_cpu_int8"]
+                assert entry["in_use"] == 2
+                assert entry["capacity"] == 2
+
+    @patch('app.core.models.manager.settings')
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_eviction_prefers_idle_models(self, mock_faster_class, mock_settings):
+        mock_settings.model_cache_max_models = 2
+        mock_settings.model_cache_max_ram_bytes = 0
+        mock_settings.model_cache_max_vram_bytes = 0
+
+        in_use, idle, new = (Mock(spec=ASRModelBase) for _ in range(3))
+        mock_faster_class.side_effect = [in_use, idle, new]
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        lease = manager.lease("faster_whisper", "a", "cpu", "int8")
+        manager.get_model("faster_whisper", "b", "cpu", "int8")
+        manager.get_model("faster_whisper", "c", "cpu", "int8")
+
+        # LRU 순서상 a가 먼저지만 사용 중이므로 b를 제거
+        idle.unload_model.assert_called_once()
+        in_use.unload_model.assert_not_called()
+        lease.release()
+
+    @patch('app.core.models.manager.settings.model_cache_wait_seconds', 0.1)
+    @patch('app.core.models.manager.settings.model_cache_max_models', 1)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_leased_model_never_evicted_when_budget_full(self, mock_faster_class):
+        """예산 안의 모델이 모두 사용 중이면 제거하지 않고 대기 후 실패"""
+        in_use, new = Mock(spec=ASRModelBase), Mock(spec=ASRModelBase)
+        mock_faster_class.side_effect = [in_use, new]
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        lease = manager.lease("faster_whisper", "a", "cpu", "int8")
+        try:
+            with pytest.raises(RuntimeError, match="budget exhausted"):
+                manager.get_model("faster_whisper", "b", "cpu", "int8")
+
+            in_use.unload_model.assert_not_called()
+            new.load_model.assert_not_called()
+            assert set(manager.get_cache_info()["entries"]) == {"faster_whisper_a_cpu_int8"}
+        finally:
+            lease.release()
+            manager.clear_cache()
+
+    @patch('app.core.models.manager.settings.model_cache_wait_seconds', 5)
+    @patch('app.core.models.manager.settings.model_cache_max_models', 1)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_load_waits_for_release_then_evicts(self, mock_faster_class):
+        """임대가 반환되면 대기하던 로드가 이전 모델을 언로드한 뒤 진행"""
+        in_use, new = Mock(spec=ASRModelBase), Mock(spec=ASRModelBase)
+        mock_faster_class.side_effect = [in_use, new]
+        order = []
+        in_use.unload_model.side_effect = lambda: order.append("unload-a")
+        new.load_model.side_effect = lambda: order.append("load-b")
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        lease = manager.lease("faster_whisper", "a", "cpu", "int8")
+        loader = threading.Thread(
+            target=manager.get_model, args=("faster_whisper", "b", "cpu", "int8")
+        )
+        loader.start()
+        try:
+            loader.join(timeout=0.1)
+            # 임대 중에는 로드가 진행되지 않음
+            assert loader.is_alive()
+            assert order == []
+        finally:
+            lease.release()
+            loader.join(timeout=5)
+
+        assert order == ["unload-a", "load-b"]
+        manager.clear_cache()
+
+    @patch('app.core.models.manager.settings.model_cache_wait_seconds', 5)
+    @patch('app.core.models.manager.settings.model_cache_max_vram_bytes', 10)
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_draining_model_counts_against_budget(self, mock_faster_class):
+        """캐시에서 빠졌지만 임대 중인 모델의 메모리도 예산에 포함 (두 벌 적재 방지)"""
+        old = TestModelCacheBudget._mock_model(vram_bytes=6)
+        reloaded = TestModelCacheBudget._mock_model(vram_bytes=6)
+        mock_faster_class.side_effect = [old, reloaded]
+        order = []
+        old.unload_model.side_effect = lambda: order.append("unload-old")
+        reloaded.load_model.side_effect = lambda: order.append("load-new")
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        lease = manager.lease("faster_whisper", "large-v3", "cuda", "float16")
+        manager.clear_cache()
+        assert manager.get_cache_info()["draining"] == 1
+
+        loader = threading.Thread(
+            target=manager.get_model, args=("faster_whisper", "large-v3", "cuda", "float16")
+        )
+        loader.start()
+        try:
+            loader.join(timeout=0.1)
+            assert loader.is_alive()
+            assert order == []
+        finally:
+            lease.release()
+            loader.join(timeout=5)
+
+        assert order == ["unload-old", "load-new"]
+        manager.clear_cache()
+
+    @patch('app.core.models.manager.FasterWhisperModel')
+    async def test_alease(self, mock_faster_class):
+        mock_model = Mock(spec=ASRModelBase)
+        mock_faster_class.return_value = mock_model
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        async with manager.alease("faster_whisper", "base", "cpu", "int8") as model:
+            assert model is mock_model
+            assert manager.get_cache_info()["in_use"] == 1
+        assert manager.get_cache_info()["in_use"] == 0
+
+
+class TestModelReplicas:
+    """키별 레플리카 풀 테스트"""
+
+    @patch('app.core.models.manager.settings')
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_leases_spread_across_replicas(self, mock_faster_class, mock_settings):
+        mock_settings.model_replicas = {"faster_whisper": 2}
+        mock_settings.model_replica_device_indices = [0, 1]
+        mock_settings.model_cache_max_models = 4
+        mock_settings.model_cache_max_ram_bytes = 0
+        mock_settings.model_cache_max_vram_bytes = 0
+
+        first, second = Mock(spec=ASRModelBase), Mock(spec=ASRModelBase)
+        mock_faster_class.side_effect = [first, second]
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        lease_a = manager.lease("faster_whisper", "large-v3", "cuda", "float16")
+        lease_b = manager.lease("faster_whisper", "large-v3", "cuda", "float16")
+
+        # 레플리카마다 다른 GPU에 배치
+        device_indices = [c.kwargs["device_index"] for c in mock_faster_class.call_args_list]
+        assert device_indices == [0, 1]
+        assert {lease_a.model, lease_b.model} == {first, second}
+
+        entry_info = manager.get_cache_info()["entries"]["faster_whisper_large-v3_cuda_float16"]
+        assert entry_info["replicas"] == 2
+        assert entry_info["in_use"] == 2
+
+        # 반환된 레플리카가 다음 임대에 재사용됨
+        lease_a.release()
+        lease_c = manager.lease("faster_whisper", "large-v3", "cuda", "float16")
+        assert lease_c.model is lease_a.model
+
+        lease_b.release()
+        lease_c.release()
+        manager.clear_cache()
+        first.unload_model.assert_called_once()
+        second.unload_model.assert_called_once()
+
+    @patch('app.core.models.manager.settings')
+    @patch('app.core.models.manager.FasterWhisperModel')
+    def test_replica_load_failure_unloads_loaded_replicas(self, mock_faster_class, mock_settings):
+        mock_settings.model_replicas = {"faster_whisper": 2}
+        mock_settings.model_replica_device_indices = []
+        mock_settings.model_cache_max_models = 4
+        mock_settings.model_cache_max_ram_bytes = 0
+        mock_settings.model_cache_max_vram_bytes = 0
+
+        ok, broken = Mock(spec=ASRModelBase), Mock(spec=ASRModelBase)
+        broken.load_model.side_effect = RuntimeError("CUDA out of memory")
+        mock_faster_class.side_effect = [ok, broken]
+
+        manager = ModelManager()
+        manager.clear_cache()
+
+        with pytest.raises(RuntimeError):
+            manager.get_model("faster_whisper", "large-v3", "cuda", "float16")
+
+        ok.unload_model.assert_called_once()
+        assert manager.get_cache_info()["total"] == 0
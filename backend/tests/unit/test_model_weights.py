@@ -0,0 +1,143 @@
+"""
+모델 가중치 캐시/프리페치 단위 테스트 (다운로드 함수는 Mock)
+"""
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import prefetch as prefetch_cli
+from app.core.models.weights import ModelWeightStore
+
+
+def fake_whisper(download=None):
+    """openai-whisper 모듈 대체 (체크포인트 URL 목록과 다운로드 함수)"""
+    models = {"tiny": "https://example.com/models/abc/tiny.pt"}
+    return SimpleNamespace(
+        _MODELS=models,
+        _download=download or MagicMock(),
+        available_models=lambda: list(models),
+    )
+
+
+class TestModelWeightStore:
+    def test_hub_kwargs_follow_directory_and_offline(self, tmp_path):
+        store = ModelWeightStore(tmp_path, offline=True)
+
+        assert store.hub_kwargs() == {"cache_dir": str(tmp_path), "local_files_only": True}
+
+    def test_pin_and_resolve(self, tmp_path):
+        store = ModelWeightStore(tmp_path / "models", offline=False)
+        snapshot = tmp_path / "snapshot"
+        snapshot.mkdir()
+
+        assert store.resolve("faster_whisper", "tiny") is None
+        store.pin("faster_whisper", "tiny", str(snapshot))
+
+        # 다른 인스턴스(다른 프로세스)도 같은 매니페스트를 읽음
+        assert ModelWeightStore(tmp_path / "models").resolve("faster_whisper", "tiny") == str(snapshot)
+        assert store.resolve("hf_auto_asr", "tiny") is None
+
+    def test_missing_pinned_path_is_ignored(self, tmp_path):
+        store = ModelWeightStore(tmp_path)
+        store.pin("wespeaker", "repo/id", str(tmp_path / "gone.bin"))
+
+        assert store.resolve("wespeaker", "repo/id") is None
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path):
+        store = ModelWeightStore(tmp_path)
+        store.manifest_path.write_text("{not json", encoding="utf-8")
+
+        assert store.resolve("faster_whisper", "tiny") is None
+
+    def test_prefetch_downloads_into_cache_and_pins(self, tmp_path):
+        store = ModelWeightStore(tmp_path, offline=False)
+        snapshot = tmp_path / "snapshots" / "abc"
+        snapshot.mkdir(parents=True)
+
+        with patch.object(store, "_download_snapshot", return_value=str(snapshot)) as download:
+            path = store.prefetch("hf_auto_asr", "openai/whisper-small", hf_token="hf_x")
+
+        download.assert_called_once_with("openai/whisper-small", "hf_x")
+        assert path == str(snapshot)
+        assert store.resolve("hf_auto_asr", "openai/whisper-small") == str(snapshot)
+
+    def test_prefetch_origin_whisper_downloads_into_cache(self, tmp_path):
+        checkpoint = tmp_path / "tiny.pt"
+        whisper = fake_whisper(download=MagicMock(return_value=str(checkpoint)))
+        store = ModelWeightStore(tmp_path, offline=False)
+
+        with patch.dict(sys.modules, {"whisper": whisper}):
+            assert store.cached_whisper_checkpoint("tiny") is None
+            checkpoint.write_bytes(b"weights")
+            path = store.prefetch("origin_whisper", "tiny")
+
+        whisper._download.assert_called_once_with(
+            "https://example.com/models/abc/tiny.pt", str(tmp_path), False
+        )
+        assert path == str(checkpoint)
+        assert store.resolve("origin_whisper", "tiny") == str(checkpoint)
+
+    def test_offline_origin_whisper_uses_cached_checkpoint_only(self, tmp_path):
+        whisper = fake_whisper()
+        store = ModelWeightStore(tmp_path, offline=True)
+
+        with patch.dict(sys.modules, {"whisper": whisper}):
+            with pytest.raises(FileNotFoundError):
+                store.prefetch("origin_whisper", "tiny")
+            (tmp_path / "tiny.pt").write_bytes(b"weights")
+            assert store.prefetch("origin_whisper", "tiny") == str(tmp_path / "tiny.pt")
+            with pytest.raises(ValueError, match="Unknown Whisper model"):
+                store.cached_whisper_checkpoint("huge")
+
+        whisper._download.assert_not_called()
+
+    def test_prefetch_rejects_unknown_type(self, tmp_path):
+        with pytest.raises(ValueError):
+            ModelWeightStore(tmp_path).prefetch("google_stt", "default")
+
+
+class TestPrefetchCli:
+    def test_parse_spec_accepts_preload_format(self):
+        assert prefetch_cli.parse_prefetch_spec("faster_whisper:large-v3:cuda:float16") == (
+            "faster_whisper", "large-v3"
+        )
+        assert prefetch_cli.parse_prefetch_spec("hf_auto_asr:openai/whisper-small") == (
+            "hf_auto_asr", "openai/whisper-small"
+        )
+        with pytest.raises(ValueError):
+            prefetch_cli.parse_prefetch_spec("google_stt:default")
+
+    def test_configured_models(self):
+        with patch.object(prefetch_cli.settings, "preload_models", [
+            "faster_whisper:large-v3:cuda:float16",
+            "faster_whisper:large-v3:cpu",
+            "google_stt:default:cpu",
+        ]), patch.object(prefetch_cli.settings, "enable_hf_auto_asr", True), \
+                patch.object(prefetch_cli.settings, "hf_auto_default_model", "openai/whisper-small"), \
+                patch.object(prefetch_cli.settings, "huggingface_token", "hf_x"):
+            targets = prefetch_cli.configured_models()
+
+        assert targets == [
+            ("faster_whisper", "large-v3"),
+            ("hf_auto_asr", "openai/whisper-small"),
+            ("wespeaker", prefetch_cli.WESPEAKER_REPO_ID),
+        ]
+
+    def test_wespeaker_repo_matches_processor(self):
+        # prefetch는 torch 없이 동작하도록 값을 복사해 둠
+        diarization = pytest.importorskip("app.core.processors.diarization")
+        assert prefetch_cli.WESPEAKER_REPO_ID == diarization.WESPEAKER_REPO_ID
+
+    def test_main_reports_failures(self):
+        def fake_prefetch(model_type, model_id, hf_token=None):
+            if model_type == "wespeaker":
+                raise RuntimeError("gated")
+            return f"/cache/{model_id}"
+
+        with patch.object(prefetch_cli.model_weight_store, "prefetch", side_effect=fake_prefetch) as prefetch:
+            assert prefetch_cli.main(["faster_whisper:tiny"]) == 0
+            assert prefetch_cli.main(["faster_whisper:tiny", "wespeaker:repo/id"]) == 1
+
+        assert prefetch.call_count == 3
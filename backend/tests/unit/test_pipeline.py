@@ -0,0 +1,115 @@
+"""
+StagedPipeline 단위 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.services.pipeline import PipelineStage, StagedPipeline
+
+
+class TestStagedPipeline:
+    """단계 중첩 파이프라인 테스트"""
+
+    async def test_results_keep_input_order(self):
+        """단계별 처리 시간이 달라도 결과는 입력 순서대로"""
+        async def slow_for_even(x):
+            await asyncio.sleep(0.02 if x % 2 == 0 else 0)
+            return x * 10
+
+        async def add_one(x):
+            return x + 1
+
+        pipeline = StagedPipeline([
+            PipelineStage("mul", slow_for_even, concurrency=3),
+            PipelineStage("add", add_one, concurrency=2),
+        ])
+
+        assert await pipeline.run([0, 1, 2, 3, 4]) == [1, 11, 21, 31, 41]
+
+    async def test_stages_overlap(self):
+        """다음 항목의 앞 단계가 현재 항목의 뒤 단계와 동시에 실행"""
+        active = set()
+        overlaps = []
+
+        def make_stage(name):
+            async def fn(x):
+                active.add(name)
+                if len(active) > 1:
+                    overlaps.append(tuple(sorted(active)))
+                await asyncio.sleep(0.01)
+                active.discard(name)
+                return x
+            return fn
+
+        pipeline = StagedPipeline([
+            PipelineStage("decode", make_stage("decode")),
+            PipelineStage("asr", make_stage("asr")),
+            PipelineStage("write", make_stage("write")),
+        ])
+        await pipeline.run(list(range(5)))
+
+        assert overlaps, "stages never overlapped"
+
+    async def test_stage_concurrency_limit(self):
+        """단계 동시 실행 수 제한 준수"""
+        running = 0
+        peak = 0
+
+        async def fn(x):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return x
+
+        pipeline = StagedPipeline([PipelineStage("asr", fn, concurrency=2, queue_size=10)])
+        await pipeline.run(list(range(8)))
+
+        assert peak == 2
+
+    async def test_on_item_done_called_per_item(self):
+        done = []
+
+        async def identity(x):
+            return x
+
+        async def on_done(idx, value):
+            done.append((idx, value))
+
+        pipeline = StagedPipeline([PipelineStage("only", identity)])
+        await pipeline.run(["a", "b", "c"], on_item_done=on_done)
+
+        assert sorted(done) == [(0, "a"), (1, "b"), (2, "c")]
+
+    async def test_failure_cancels_pipeline(self):
+        """한 항목 실패 시 예외가 전파되고 남은 작업은 중단"""
+        written = []
+
+        async def asr(x):
+            if x == 1:
+                raise RuntimeError("asr failed")
+            await asyncio.sleep(0.01)
+            return x
+
+        async def write(x):
+            written.append(x)
+            return x
+
+        pipeline = StagedPipeline([
+            PipelineStage("asr", asr),
+            PipelineStage("write", write),
+        ])
+
+        with pytest.raises(RuntimeError, match="asr failed"):
+            await pipeline.run(list(range(10)))
+
+        assert len(written) < 10
+
+    async def test_empty_input(self):
+        async def identity(x):
+            return x
+
+        pipeline = StagedPipeline([PipelineStage("a", identity), PipelineStage("b", identity)])
+        assert await pipeline.run([]) == []
@@ -0,0 +1,156 @@
+"""
+전사 결과 캐시 단위 테스트
+"""
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.models import faster_whisper
+from app.db.models import Job
+from app.services.result_cache import ResultCache, params_hash
+
+
+@pytest.fixture(autouse=True)
+def batched_pipeline_available():
+    # 설치된 faster-whisper 버전과 무관하게 배치 파이프라인을 사용할 수 있는 상태로 고정
+    with patch.object(faster_whisper, "BatchedInferencePipeline", MagicMock()), \
+            patch.object(faster_whisper.settings, "faster_whisper_batched", True):
+        yield
+
+
+def make_job(**overrides):
+    values = dict(
+        model_type="faster_whisper",
+        model_size="large-v3",
+        language="ko",
+        device="cuda",
+        parameters={"compute_type": "float16", "beam_size": 5, "batch_size": 8},
+        diarization_config={"enabled": False, "min_speakers": 1, "max_speakers": 5},
+        output_formats=["vtt"],
+    )
+    values.update(overrides)
+    return Job(**values)
+
+
+class TestParamsHash:
+    def test_ignores_outputs_device_and_batch_size(self):
+        base = params_hash(make_job())
+        assert params_hash(make_job(output_formats=["srt", "json"])) == base
+        assert params_hash(make_job(device="cpu")) == base
+        assert params_hash(make_job(parameters={"compute_type": "float16", "beam_size": 5, "batch_size": 4})) == base
+        # 분별이 꺼져 있으면 화자 수 설정은 무관
+        assert params_hash(make_job(diarization_config={"enabled": False, "max_speakers": 9})) == base
+
+    def test_result_affecting_settings_change_hash(self):
+        base = params_hash(make_job())
+        assert params_hash(make_job(model_size="small")) != base
+        assert params_hash(make_job(language="en")) != base
+        assert params_hash(make_job(parameters={"compute_type": "int8", "beam_size": 5})) != base
+        assert params_hash(make_job(diarization_config={"enabled": True, "max_speakers": 5})) != base
+        # batch_size 1은 순차 디코딩 (VAD 구간 배치 디코딩과 결과가 다름)
+        assert params_hash(make_job(parameters={"compute_type": "float16", "beam_size": 5, "batch_size": 1})) != base
+
+    def test_hash_follows_effective_batched_decoding(self):
+        batched = params_hash(make_job())
+        sequential = params_hash(make_job(parameters={"compute_type": "float16", "beam_size": 5}))
+        assert batched != sequential
+
+        # 배치 디코딩이 꺼져 있거나 파이프라인이 없으면 batch_size와 무관하게 순차 디코딩 키
+        with patch.object(faster_whisper.settings, "faster_whisper_batched", False):
+            assert params_hash(make_job()) == sequential
+        with patch.object(faster_whisper, "BatchedInferencePipeline", None):
+            assert params_hash(make_job()) == sequential
+
+    def test_batch_size_ignored_for_other_models(self):
+        hf = dict(model_type="hf_auto_asr", model_size="openai/whisper-small")
+        assert params_hash(make_job(**hf)) == params_hash(
+            make_job(**hf, parameters={"compute_type": "float16", "beam_size": 5})
+        )
+
+    def test_diarization_device_and_precision_change_hash(self):
+        diarized = {"enabled": True, "max_speakers": 5}
+        torch = MagicMock()
+        torch.cuda.is_available.return_value = True
+        with patch.dict(sys.modules, {"torch": torch}):
+            gpu = params_hash(make_job(diarization_config=diarized))
+            assert params_hash(make_job(diarization_config=diarized, device="cuda:1")) == gpu
+            # 분별은 작업 device에서 실행되므로 분별 사용 시 디바이스 종류가 결과에 영향
+            cpu = params_hash(make_job(diarization_config=diarized, device="cpu"))
+            assert cpu != gpu
+
+            with patch("app.services.result_cache.settings.diarization_fp16", True):
+                assert params_hash(make_job(diarization_config=diarized)) != gpu
+                # fp16은 GPU에서만 적용
+                assert params_hash(make_job(diarization_config=diarized, device="cpu")) == cpu
+
+            # CUDA가 없으면 CPU에서 실행
+            torch.cuda.is_available.return_value = False
+            assert params_hash(make_job(diarization_config=diarized)) == cpu
+
+    def test_effective_diarization_defaults_change_hash(self):
+        diarized = {"enabled": True, "max_speakers": 5}
+        base = params_hash(make_job(diarization_config=diarized))
+
+        with patch("app.services.result_cache.settings.diarization_mode", "window"):
+            window = params_hash(make_job(diarization_config=diarized))
+            assert window != base
+            # 명시한 방식이 서버 기본값과 같으면 같은 키
+            assert params_hash(make_job(diarization_config={**diarized, "mode": "window"})) == window
+            with patch("app.services.result_cache.settings.diarization_window_seconds", 3.0):
+                assert params_hash(make_job(diarization_config=diarized)) != window
+            with patch("app.services.result_cache.settings.diarization_window_hop_seconds", 0.5):
+                assert params_hash(make_job(diarization_config=diarized)) != window
+
+        # 윈도우 설정은 segment 방식 결과에 영향 없음
+        with patch("app.services.result_cache.settings.diarization_window_seconds", 3.0):
+            assert params_hash(make_job(diarization_config=diarized)) == base
+        with patch("app.services.result_cache.settings.diarization_max_cluster_embeddings", 200):
+            assert params_hash(make_job(diarization_config=diarized)) != base
+
+    def test_auto_language_equals_none(self):
+        assert params_hash(make_job(language="auto")) == params_hash(make_job(language=None))
+
+
+class TestResultCache:
+    def test_disabled_cache_has_no_keys(self, tmp_path):
+        cache = ResultCache(tmp_path, enabled=False)
+        assert cache.make_key("abc", make_job()) is None
+
+    def test_put_and_get(self, tmp_path):
+        cache = ResultCache(tmp_path, enabled=True, max_bytes=0, max_age_days=0)
+        key = cache.make_key("abc", make_job())
+        result = {"segments": [{"start": 0.0, "end": 1.0, "text": "안녕하세요"}]}
+
+        assert cache.get(key) is None
+        cache.put(key, result)
+        assert cache.get(key) == result
+        assert cache.make_key(None, make_job()) is None
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        cache = ResultCache(tmp_path, enabled=True, max_bytes=0, max_age_days=1)
+        cache.put("old", {"segments": []})
+        stale = time.time() - 2 * 86400
+        os.utime(tmp_path / "old.json", (stale, stale))
+
+        assert cache.get("old") is None
+        assert not (tmp_path / "old.json").exists()
+
+    def test_size_limit_evicts_least_recently_used(self, tmp_path):
+        cache = ResultCache(tmp_path, enabled=True, max_bytes=0, max_age_days=0)
+        payload = {"segments": [{"text": "x" * 100}]}
+        for idx, key in enumerate(["a", "b", "c"]):
+            cache.put(key, payload)
+            past = time.time() - 100 + idx
+            os.utime(tmp_path / f"{key}.json", (past, past))
+
+        cache.get("a")  # a를 최근 사용으로 갱신
+        entry_size = (tmp_path / "a.json").stat().st_size
+        cache.max_bytes = entry_size * 2
+        assert cache.evict() == 1
+
+        assert not (tmp_path / "b.json").exists()
+        assert (tmp_path / "a.json").exists()
+        assert (tmp_path / "c.json").exists()
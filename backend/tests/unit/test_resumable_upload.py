@@ -0,0 +1,199 @@
+"""
+재개 가능한 업로드 API 단위 테스트
+
+upload 라우터만 등록한 앱과 임시 SQLite DB를 사용합니다.
+"""
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.v1.upload import router
+from app.db.base import Base
+from app.db.models import UploadedFile, UploadSession
+from app.db.session import get_db
+
+
+@pytest.fixture
+async def client(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'upload.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_db] = override_get_db
+
+    upload_dir = tmp_path / "uploads"
+    upload_dir.mkdir()
+    with patch("app.api.v1.upload.settings.upload_dir", upload_dir):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            http.factory = factory
+            http.upload_dir = upload_dir
+            yield http
+
+    await engine.dispose()
+
+
+def content_range(start, end, total):
+    return {"Content-Range": f"bytes {start}-{end}/{total}"}
+
+
+class TestResumableUpload:
+    async def test_chunked_upload_with_resume(self, client):
+        data = bytes(range(256)) * 40  # 10240 bytes
+        created = await client.post("/api/v1/upload/sessions", json={
+            "filename": "talk.wav",
+            "size": len(data),
+            "mime_type": "audio/wav",
+            "sha256": hashlib.sha256(data).hexdigest(),
+        })
+        assert created.status_code == 201
+        session_id = created.json()["session_id"]
+        url = f"/api/v1/upload/sessions/{session_id}"
+
+        first = await client.put(
+            url,
+            content=data[:4096],
+            headers={
+                **content_range(0, 4095, len(data)),
+                "X-Chunk-SHA256": hashlib.sha256(data[:4096]).hexdigest(),
+            },
+        )
+        assert first.json()["received_bytes"] == 4096
+
+        # 연결이 끊긴 뒤 상태 조회 → 이어서 전송
+        status = await client.get(url)
+        assert status.json()["received_bytes"] == 4096
+
+        # 이미 받은 청크 재전송은 무시
+        retry = await client.put(url, content=data[:4096], headers=content_range(0, 4095, len(data)))
+        assert retry.json()["received_bytes"] == 4096
+
+        second = await client.put(url, content=data[4096:], headers=content_range(4096, len(data) - 1, len(data)))
+        assert second.json()["received_bytes"] == len(data)
+
+        done = await client.post(f"{url}/complete")
+        assert done.status_code == 200
+        body = done.json()
+        assert body["completed"] is True
+
+        async with client.factory() as db:
+            uploaded = await db.get(UploadedFile, body["file_id"])
+        assert uploaded.content_hash == hashlib.sha256(data).hexdigest()
+        assert uploaded.file_size == len(data)
+        with open(uploaded.storage_path, "rb") as f:
+            assert f.read() == data
+        assert not list(client.upload_dir.glob("*.part"))
+
+    async def test_out_of_order_chunk_conflicts(self, client):
+        created = await client.post("/api/v1/upload/sessions", json={"filename": "a.wav", "size": 100})
+        url = f"/api/v1/upload/sessions/{created.json()['session_id']}"
+
+        response = await client.put(url, content=b"x" * 50, headers=content_range(50, 99, 100))
+        assert response.status_code == 409
+
+    async def test_bad_chunk_checksum_is_discarded(self, client):
+        created = await client.post("/api/v1/upload/sessions", json={"filename": "a.wav", "size": 100})
+        url = f"/api/v1/upload/sessions/{created.json()['session_id']}"
+
+        response = await client.put(
+            url,
+            content=b"x" * 50,
+            headers={**content_range(0, 49, 100), "X-Chunk-SHA256": "0" * 64},
+        )
+        assert response.status_code == 400
+        assert (await client.get(url)).json()["received_bytes"] == 0
+
+    async def test_short_body_is_rejected(self, client):
+        created = await client.post("/api/v1/upload/sessions", json={"filename": "a.wav", "size": 100})
+        url = f"/api/v1/upload/sessions/{created.json()['session_id']}"
+
+        response = await client.put(url, content=b"x" * 10, headers=content_range(0, 49, 100))
+        assert response.status_code == 400
+        assert (await client.get(url)).json()["received_bytes"] == 0
+
+    async def test_complete_requires_all_bytes_and_matching_hash(self, client):
+        created = await client.post("/api/v1/upload/sessions", json={
+            "filename": "a.wav", "size": 10, "sha256": "a" * 64,
+        })
+        url = f"/api/v1/upload/sessions/{created.json()['session_id']}"
+
+        assert (await client.post(f"{url}/complete")).status_code == 400
+
+        await client.put(url, content=b"0123456789", headers=content_range(0, 9, 10))
+        response = await client.post(f"{url}/complete")
+        assert response.status_code == 400
+        assert "sha256" in response.json()["detail"]
+
+        # 불일치 후 세션은 0 바이트부터 다시 받고 부분 파일은 남지 않음
+        assert (await client.get(url)).json()["received_bytes"] == 0
+        assert not list(client.upload_dir.glob("*.part"))
+        retry = await client.put(url, content=b"0123456789", headers=content_range(0, 9, 10))
+        assert retry.status_code == 200
+        assert retry.json()["received_bytes"] == 10
+
+    async def test_concurrent_complete_is_idempotent(self, client):
+        data = b"0123456789" * 100
+        created = await client.post("/api/v1/upload/sessions", json={
+            "filename": "a.wav", "size": len(data), "sha256": hashlib.sha256(data).hexdigest(),
+        })
+        url = f"/api/v1/upload/sessions/{created.json()['session_id']}"
+        await client.put(url, content=data, headers=content_range(0, len(data) - 1, len(data)))
+
+        first, second = await asyncio.gather(
+            client.post(f"{url}/complete"), client.post(f"{url}/complete")
+        )
+
+        assert first.status_code == second.status_code == 200
+        assert first.json()["file_id"] == second.json()["file_id"]
+        assert len(list(client.upload_dir.glob("*.wav"))) == 1
+
+    async def test_abandoned_session_expires(self, client):
+        created = await client.post("/api/v1/upload/sessions", json={"filename": "a.wav", "size": 100})
+        session_id = created.json()["session_id"]
+        url = f"/api/v1/upload/sessions/{session_id}"
+        await client.put(url, content=b"x" * 50, headers=content_range(0, 49, 100))
+        assert list(client.upload_dir.glob("*.part"))
+
+        async with client.factory() as db:
+            session = await db.get(UploadSession, session_id)
+            session.updated_at = datetime.utcnow() - timedelta(days=2)
+            await db.commit()
+
+        # 새 세션 생성 시 방치된 세션과 부분 파일을 정리
+        fresh = await client.post("/api/v1/upload/sessions", json={"filename": "b.wav", "size": 10})
+        assert fresh.status_code == 201
+        assert (await client.get(url)).status_code == 404
+        assert not list(client.upload_dir.glob("*.part"))
+
+    async def test_expired_session_is_gone_on_access(self, client):
+        created = await client.post("/api/v1/upload/sessions", json={"filename": "a.wav", "size": 100})
+        session_id = created.json()["session_id"]
+        url = f"/api/v1/upload/sessions/{session_id}"
+        await client.put(url, content=b"x" * 50, headers=content_range(0, 49, 100))
+
+        async with client.factory() as db:
+            session = await db.get(UploadSession, session_id)
+            session.updated_at = datetime.utcnow() - timedelta(days=2)
+            await db.commit()
+
+        response = await client.put(url, content=b"x" * 50, headers=content_range(50, 99, 100))
+        assert response.status_code == 404
+        assert not list(client.upload_dir.glob("*.part"))
+
+    async def test_rejects_disallowed_extension(self, client):
+        response = await client.post("/api/v1/upload/sessions", json={"filename": "a.exe", "size": 10})
+        assert response.status_code == 400
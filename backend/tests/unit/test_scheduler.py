@@ -0,0 +1,188 @@
+"""
+JobScheduler 단위 테스트
+"""
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.services.scheduler import JobScheduler, run_transcription_job
+
+
+class TestJobScheduler:
+    """워커 풀 스케줄러 테스트"""
+
+    async def test_max_workers_enforced(self):
+        """동시에 실행되는 작업 수가 max_workers를 넘지 않음"""
+        running = 0
+        peak = 0
+
+        async def runner(job_id: str):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        scheduler = JobScheduler(runner=runner, max_workers=2)
+        await scheduler.start()
+        try:
+            for idx in range(6):
+                scheduler.submit(f"job-{idx}")
+            await scheduler.join()
+        finally:
+            await scheduler.stop()
+
+        assert peak == 2
+
+    async def test_priority_then_fifo_order(self):
+        """우선순위가 높은 작업 먼저, 같은 우선순위는 FIFO"""
+        order = []
+        gate = asyncio.Event()
+
+        async def runner(job_id: str):
+            if job_id == "blocker":
+                await gate.wait()
+            order.append(job_id)
+
+        scheduler = JobScheduler(runner=runner, max_workers=1)
+        await scheduler.start()
+        try:
+            scheduler.submit("blocker")
+            await asyncio.sleep(0)  # 워커가 blocker를 가져가도록 양보
+            scheduler.submit("low-1", priority=0)
+            scheduler.submit("high", priority=5)
+            scheduler.submit("low-2", priority=0)
+            gate.set()
+            await scheduler.join()
+        finally:
+            await scheduler.stop()
+
+        assert order == ["blocker", "high", "low-1", "low-2"]
+
+    async def test_duplicate_submit_ignored(self):
+        """대기 중인 작업은 중복 등록되지 않음"""
+        calls = []
+
+        async def runner(job_id: str):
+            calls.append(job_id)
+
+        scheduler = JobScheduler(runner=runner, max_workers=1)
+        await scheduler.start()
+        try:
+            assert scheduler.submit("job-1") is True
+            assert scheduler.submit("job-1") is False
+            await scheduler.join()
+        finally:
+            await scheduler.stop()
+
+        assert calls == ["job-1"]
+
+    async def test_runner_error_does_not_kill_worker(self):
+        """작업 실패 후에도 워커가 다음 작업을 처리"""
+        calls = []
+
+        async def runner(job_id: str):
+            calls.append(job_id)
+            if job_id == "bad":
+                raise RuntimeError("boom")
+
+        scheduler = JobScheduler(runner=runner, max_workers=1)
+        await scheduler.start()
+        try:
+            scheduler.submit("bad")
+            scheduler.submit("good")
+            await scheduler.join()
+            assert scheduler.stats()["running"] == 0
+        finally:
+            await scheduler.stop()
+
+        assert calls == ["bad", "good"]
+
+    def test_submit_before_start_raises(self):
+        """시작 전 등록 시 RuntimeError"""
+        scheduler = JobScheduler(runner=None, max_workers=1)
+
+        with pytest.raises(RuntimeError):
+            scheduler.submit("job-1")
+
+
+class FakeQueue:
+    """임대 갱신 결과를 지정할 수 있는 가짜 작업 큐"""
+
+    worker_id = "worker-1"
+
+    def __init__(self, keep_lease: bool):
+        self.keep_lease = keep_lease
+        self.released = []
+
+    async def claim(self, job_id):
+        return job_id
+
+    async def heartbeat(self, job_id):
+        return self.keep_lease
+
+    async def release(self, job_id):
+        self.released.append(job_id)
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class TestRunTranscriptionJob:
+    """DB 큐 임대를 유지하며 작업 실행"""
+
+    async def run_job(self, queue, process):
+        class FakeService:
+            def __init__(self, db):
+                pass
+
+            process_transcription = staticmethod(process)
+
+        # 전사 서비스 모듈(torch 등 모델 의존성)을 불러오지 않도록 가짜 모듈로 대체
+        transcription = SimpleNamespace(TranscriptionService=FakeService)
+        with patch("app.services.job_queue.job_queue", queue), \
+                patch("app.db.session.AsyncSessionLocal", FakeSession), \
+                patch.dict(sys.modules, {"app.services.transcription": transcription}), \
+                patch("app.services.scheduler.settings.job_heartbeat_interval", 0.01):
+            await asyncio.wait_for(run_transcription_job("job-1"), timeout=5)
+
+    async def test_lost_lease_cancels_job(self):
+        """임대를 잃으면 다른 워커와 중복 처리하지 않도록 작업을 취소"""
+        queue = FakeQueue(keep_lease=False)
+        cancelled = []
+        owners = []
+
+        async def process(job_id, hf_token=None, lease_owner=None):
+            owners.append(lease_owner)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(job_id)
+                raise
+
+        await self.run_job(queue, process)
+
+        assert owners == ["worker-1"]
+        assert cancelled == ["job-1"]
+        assert queue.released == ["job-1"]
+
+    async def test_job_runs_to_completion_while_lease_held(self):
+        queue = FakeQueue(keep_lease=True)
+        done = []
+
+        async def process(job_id, hf_token=None, lease_owner=None):
+            await asyncio.sleep(0.05)
+            done.append(job_id)
+
+        await self.run_job(queue, process)
+
+        assert done == ["job-1"]
+        assert queue.released == ["job-1"]
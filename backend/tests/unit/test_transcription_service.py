@@ -0,0 +1,642 @@
+"""
+TranscriptionService 단위 테스트 (파일 병렬 처리)
+
+ASR 모델은 Mock으로 대체하고 임시 SQLite DB를 사용합니다.
+"""
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.audio import DecodedAudio
+from app.db.base import Base
+from app.db.models import Job, JobStatus, Result, UploadedFile
+from app.services.result_cache import ResultCache
+from app.services.transcription import TranscriptionService
+
+
+class FakeModel:
+    """동시 호출 수를 기록하는 가짜 ASR 모델"""
+
+    def __init__(self, max_concurrency: int, delays=None):
+        self.max_concurrency = max_concurrency
+        self.delays = delays or {}
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio_path, language, params):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays.get(audio_path, 0.05))
+        with self._lock:
+            self.active -= 1
+        return {"segments": [{"start": 0.0, "end": 1.0, "text": audio_path}]}
+
+
+def use_model(manager, model):
+    """Mock ModelManager가 임대하는 모델 설정 (임대 가능 수 = 모델 동시 호출 수)"""
+    manager.lease.return_value.model = model
+    manager.lease.return_value.capacity = model.max_concurrency
+
+
+@pytest.fixture
+async def db_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'service.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def create_job(factory, num_files: int, diarization_config=None) -> str:
+    async with factory() as db:
+        job = Job(
+            id="job-1",
+            status=JobStatus.QUEUED,
+            model_type="faster_whisper",
+            model_size="tiny",
+            language="en",
+            device="cpu",
+            parameters={"compute_type": "int8"},
+            output_formats=["json"],
+            diarization_config=diarization_config,
+            total_files=num_files,
+        )
+        for idx in range(num_files):
+            job.uploaded_files.append(UploadedFile(
+                id=f"file-{idx}",
+                original_filename=f"audio-{idx}.wav",
+                storage_path=f"/data/audio-{idx}.wav",
+            ))
+        db.add(job)
+        await db.commit()
+    return "job-1"
+
+
+class TestParallelFiles:
+    """작업 내 파일 병렬 처리"""
+
+    async def test_files_fan_out_up_to_model_concurrency(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=4)
+        # 첫 번째 파일이 가장 늦게 끝나도록 지연
+        model = FakeModel(max_concurrency=2, delays={"/data/audio-0.wav": 0.2})
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, model)
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        assert model.peak == 2
+        # 로드 확인용 임대 1회 + 파일별 임대, 모두 반환
+        assert manager.lease.call_count == 5
+        assert manager.lease.return_value.release.call_count == 5
+
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.COMPLETED
+            assert job.progress == 100
+            assert job.current_file is not None
+            assert "asr" in job.stage_timings
+
+            results = (await db.execute(select(Result))).scalars().all()
+            assert sorted(r.file_id for r in results) == [f"file-{i}" for i in range(4)]
+            assert all(r.json_path for r in results)
+
+    async def test_prefers_canonical_file(self, db_factory, tmp_path):
+        """업로드 시 정규화된 파일이 있으면 원본 대신 사용"""
+        job_id = await create_job(db_factory, num_files=1)
+        async with db_factory() as db:
+            file = await db.get(UploadedFile, "file-0")
+            file.canonical_path = "/data/canonical/file-0.flac"
+            await db.commit()
+
+        model = FakeModel(max_concurrency=1)
+        model.inputs = []
+        original = model.transcribe
+        model.transcribe = lambda audio_path, language, params: (
+            model.inputs.append(audio_path) or original(audio_path, language, params)
+        )
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, model)
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        assert model.inputs == ["/data/canonical/file-0.flac"]
+
+    async def test_single_concurrency_model_runs_sequentially(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=3)
+        model = FakeModel(max_concurrency=1)
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, model)
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        assert model.peak == 1
+
+    async def test_file_failure_marks_job_failed(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=2)
+
+        class BrokenModel(FakeModel):
+            def transcribe(self, audio_path, language, params):
+                raise RuntimeError("decode error")
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, BrokenModel(max_concurrency=2))
+            async with db_factory() as db:
+                with pytest.raises(RuntimeError):
+                    await TranscriptionService(db).process_transcription(job_id)
+
+        # 실패해도 모델 임대는 모두 반환
+        assert manager.lease.return_value.release.call_count == manager.lease.call_count
+
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.FAILED
+            assert "decode error" in job.error_message
+
+
+    async def test_replicas_parallelize_files_within_job(self, db_factory, tmp_path):
+        """파일마다 임대하므로 한 작업의 파일들이 레플리카 수만큼 서로 다른 레플리카에서 병렬 실행"""
+        from app.core.models.manager import model_manager
+
+        job_id = await create_job(db_factory, num_files=4)
+        counter = FakeModel(max_concurrency=1)
+        replicas = []
+
+        class ReplicaModel(FakeModel):
+            def __init__(self, *args, **kwargs):
+                super().__init__(max_concurrency=1)
+                self.files = []
+                replicas.append(self)
+
+            def load_model(self):
+                pass
+
+            def unload_model(self):
+                pass
+
+            def estimate_memory(self):
+                return {}
+
+            def transcribe(self, audio_path, language, params):
+                self.files.append(audio_path)
+                # 레플리카 간 동시 실행 수를 한곳에서 집계
+                return counter.transcribe(audio_path, language, params)
+
+        model_manager.clear_cache()
+        with patch("app.core.models.manager.FasterWhisperModel", ReplicaModel), \
+                patch("app.core.models.manager.settings.model_replicas", {"faster_whisper": 2}), \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+        info = model_manager.get_cache_info()
+        model_manager.clear_cache()
+
+        assert counter.peak == 2
+        assert all(replica.files for replica in replicas)
+        assert sum(len(replica.files) for replica in replicas) == 4
+        assert info["in_use"] == 0
+
+    async def test_failure_waits_for_in_flight_progress_commit(self, db_factory, tmp_path):
+        """다른 파일의 진행률 커밋 도중 실패해도 커밋이 겹치지 않고 실패 상태 기록"""
+        job_id = await create_job(db_factory, num_files=2)
+
+        class PartlyBrokenModel(FakeModel):
+            def transcribe(self, audio_path, language, params):
+                if audio_path.endswith("audio-1.wav"):
+                    time.sleep(0.1)
+                    raise RuntimeError("decode error")
+                return super().transcribe(audio_path, language, params)
+
+        original_commit = AsyncSession.commit
+        active = 0
+        overlaps = []
+        interrupted = []
+
+        async def slow_commit(self):
+            nonlocal active
+            active += 1
+            overlaps.append(active > 1)
+            try:
+                # 파일 0의 진행률 커밋이 파일 1 실패 시점까지 이어지도록 지연
+                await asyncio.sleep(0.2)
+                await original_commit(self)
+            except asyncio.CancelledError:
+                interrupted.append(True)
+                raise
+            finally:
+                active -= 1
+
+        model = PartlyBrokenModel(max_concurrency=2, delays={"/data/audio-0.wav": 0.01})
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, model)
+            async with db_factory() as db:
+                with patch.object(AsyncSession, "commit", slow_commit):
+                    with pytest.raises(RuntimeError):
+                        await TranscriptionService(db).process_transcription(job_id)
+
+        # 진행률 커밋은 취소되지 않고 끝난 뒤 실패 커밋이 이어짐
+        assert not interrupted
+        assert not any(overlaps)
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.FAILED
+            assert "decode error" in job.error_message
+
+
+class TestLeaseOwnership:
+    """워커 임대를 잃은 뒤에는 완료/실패 상태를 기록하지 않음"""
+
+    async def set_owner(self, db_factory, job_id, worker_id):
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            job.worker_id = worker_id
+            await db.commit()
+
+    async def test_completion_recorded_while_lease_held(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=1)
+        await self.set_owner(db_factory, job_id, "worker-1")
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, FakeModel(max_concurrency=1))
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id, lease_owner="worker-1")
+
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.COMPLETED
+            assert len((await db.execute(select(Result))).scalars().all()) == 1
+
+    async def test_lost_lease_discards_completion(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=1)
+        # 임대 만료 후 다른 워커가 다시 선점한 상태
+        await self.set_owner(db_factory, job_id, "worker-2")
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, FakeModel(max_concurrency=1))
+            async with db_factory() as db:
+                with pytest.raises(RuntimeError, match="Lost lease"):
+                    await TranscriptionService(db).process_transcription(job_id, lease_owner="worker-1")
+
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.PROCESSING
+            assert job.worker_id == "worker-2"
+            assert job.completed_at is None
+            assert job.error_message is None
+            assert (await db.execute(select(Result))).scalars().all() == []
+
+
+class TestSharedAudioDecode:
+    """파일당 한 번 디코딩한 오디오를 ASR/분별이 공유"""
+
+    async def test_decoded_audio_shared_across_stages(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=2, diarization_config={"enabled": True})
+
+        class ArrayModel(FakeModel):
+            def __init__(self):
+                super().__init__(max_concurrency=1)
+                self.supports_array_input = True
+                self.inputs = []
+
+            def transcribe(self, audio_path, language, params):
+                self.inputs.append(audio_path)
+                return {"segments": [{"start": 0.0, "end": 1.0, "text": "hi"}]}
+
+        def fake_decode(source_path, output_dir, name=None):
+            output_dir.mkdir(parents=True, exist_ok=True)
+            path = output_dir / f"{name}.f32"
+            np.zeros(16000, dtype=np.float32).tofile(path)
+            return DecodedAudio(path, source_path)
+
+        diarization_inputs = []
+        diarization_devices = []
+
+        def fake_diarization(audio_path, transcription_result, diarization_config, hf_token,
+                             audio=None, device="cpu"):
+            diarization_inputs.append(audio)
+            diarization_devices.append(device)
+            return transcription_result
+
+        model = ArrayModel()
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.decode_audio", side_effect=fake_decode) as decode, \
+                patch.object(TranscriptionService, "_run_diarization", side_effect=fake_diarization), \
+                patch("app.services.transcription.settings.results_dir", tmp_path / "results"), \
+                patch("app.services.transcription.settings.temp_dir", tmp_path / "temp"):
+            use_model(manager, model)
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        assert decode.call_count == 2
+        assert all(isinstance(a, np.ndarray) for a in model.inputs)
+        assert all(isinstance(a, np.ndarray) for a in diarization_inputs)
+        # 분별은 작업의 device를 따름
+        assert diarization_devices == ["cpu", "cpu"]
+        # 작업 종료 후 디코딩 아티팩트 정리
+        assert not any((tmp_path / "temp").rglob("*.f32"))
+
+
+class TestStreamingAsr:
+    """세그먼트를 순차 수신하는 모델은 디코딩 도중 진행률 보고"""
+
+    def test_run_asr_collects_streamed_segments(self):
+        class StreamingModel:
+            supports_streaming = True
+
+            def transcribe_iter(self, audio_path, language, params):
+                yield {"start": 0.0, "end": 1.0, "text": "a"}
+                yield {"start": 1.0, "end": 2.0, "text": "b"}
+
+            def transcribe(self, audio_path, language, params):  # pragma: no cover
+                raise AssertionError("transcribe() should not be called")
+
+        seen = []
+        result = TranscriptionService._run_asr(
+            StreamingModel(), "a.wav", None, {}, on_segment=seen.append
+        )
+
+        assert [s["text"] for s in result["segments"]] == ["a", "b"]
+        assert seen == result["segments"]
+
+    async def test_partial_progress_reported_while_decoding(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=2)
+        async with db_factory() as db:
+            for file in (await db.execute(select(UploadedFile))).scalars():
+                file.duration = 10.0
+            await db.commit()
+
+        class StreamingModel(FakeModel):
+            supports_streaming = True
+
+            def transcribe_iter(self, audio_path, language, params):
+                yield {"start": 0.0, "end": 5.0, "text": "half"}
+                yield {"start": 5.0, "end": 10.0, "text": "rest"}
+
+        reported = []
+        original = TranscriptionService._asr_stage
+
+        async def spy_asr_stage(self, task, *args, on_progress=None, **kwargs):
+            async def recording(task, fraction):
+                reported.append((task.index, fraction))
+                await on_progress(task, fraction)
+            return await original(self, task, *args, on_progress=recording, **kwargs)
+
+        model = StreamingModel(max_concurrency=1)
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch.object(TranscriptionService, "_asr_stage", spy_asr_stage), \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, model)
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        # 밀린 값은 최신 값만 반영되지만 파일별로 순서대로, 마지막 값까지 보고
+        for index in (1, 2):
+            fractions = [fraction for i, fraction in reported if i == index]
+            assert fractions == sorted(fractions)
+            assert fractions[-1] == 1.0
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.progress == 100
+            results = (await db.execute(select(Result))).scalars().all()
+            assert all(r.segment_count == 2 for r in results)
+
+    async def test_progress_committed_before_asr_stage_returns(self, db_factory, tmp_path):
+        """느린 진행률 커밋도 asr 단계가 끝나기 전에 완료 (파일 완료/작업 완료 커밋보다 늦지 않음)"""
+        job_id = await create_job(db_factory, num_files=1)
+        async with db_factory() as db:
+            for file in (await db.execute(select(UploadedFile))).scalars():
+                file.duration = 10.0
+            await db.commit()
+
+        class StreamingModel(FakeModel):
+            supports_streaming = True
+
+            def transcribe_iter(self, audio_path, language, params):
+                yield {"start": 0.0, "end": 5.0, "text": "half"}
+                time.sleep(0.05)
+                yield {"start": 5.0, "end": 10.0, "text": "rest"}
+
+        events = []
+        original = TranscriptionService._asr_stage
+
+        async def spy_asr_stage(self, task, *args, on_progress=None, **kwargs):
+            async def slow_progress(task, fraction):
+                await asyncio.sleep(0.1)
+                await on_progress(task, fraction)
+                events.append(("progress", fraction))
+            result = await original(self, task, *args, on_progress=slow_progress, **kwargs)
+            events.append(("asr_done", None))
+            return result
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch.object(TranscriptionService, "_asr_stage", spy_asr_stage), \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, StreamingModel(max_concurrency=1))
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        assert events[-1] == ("asr_done", None)
+        assert events[-2] == ("progress", 1.0)
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.COMPLETED
+            assert job.progress == 100
+
+    async def test_progress_commit_error_fails_job(self, db_factory, tmp_path):
+        """진행률 커밋 실패는 버려지지 않고 작업 실패로 전파"""
+        job_id = await create_job(db_factory, num_files=1)
+        async with db_factory() as db:
+            for file in (await db.execute(select(UploadedFile))).scalars():
+                file.duration = 10.0
+            await db.commit()
+
+        class StreamingModel(FakeModel):
+            supports_streaming = True
+
+            def transcribe_iter(self, audio_path, language, params):
+                yield {"start": 0.0, "end": 10.0, "text": "all"}
+
+        original = TranscriptionService._asr_stage
+
+        async def spy_asr_stage(self, task, *args, on_progress=None, **kwargs):
+            async def broken_progress(task, fraction):
+                raise RuntimeError("progress commit failed")
+            return await original(self, task, *args, on_progress=broken_progress, **kwargs)
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch.object(TranscriptionService, "_asr_stage", spy_asr_stage), \
+                patch("app.services.transcription.settings.results_dir", tmp_path):
+            use_model(manager, StreamingModel(max_concurrency=1))
+            async with db_factory() as db:
+                with pytest.raises(RuntimeError, match="progress commit failed"):
+                    await TranscriptionService(db).process_transcription(job_id)
+
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.FAILED
+            assert "progress commit failed" in job.error_message
+
+
+class TestWindowDiarization:
+    """윈도우 분별은 ASR과 동시에 실행된 뒤 세그먼트에 반영"""
+
+    async def test_window_diarization_overlaps_asr(self, db_factory, tmp_path):
+        job_id = await create_job(
+            db_factory, num_files=1, diarization_config={"enabled": True, "mode": "window"}
+        )
+        diarization_started = threading.Event()
+
+        class WaitingModel(FakeModel):
+            def transcribe(self, audio_path, language, params):
+                # 분별이 동시에 시작되지 않으면 타임아웃
+                assert diarization_started.wait(timeout=5)
+                return {"segments": [
+                    {"start": 0.0, "end": 1.0, "text": "a"},
+                    {"start": 1.0, "end": 2.0, "text": "b"},
+                ]}
+
+        def fake_windows(audio_path, diarization_config, hf_token, audio=None, device="cpu"):
+            diarization_started.set()
+            return [
+                {"start": 0.0, "end": 1.5, "speaker": 1},
+                {"start": 1.5, "end": 2.0, "speaker": 0},
+            ]
+
+        model = WaitingModel(max_concurrency=1)
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch.object(TranscriptionService, "_run_window_diarization", side_effect=fake_windows), \
+                patch.object(TranscriptionService, "_run_diarization") as segment_diarization, \
+                patch("app.services.transcription.settings.shared_audio_decode", False), \
+                patch("app.services.transcription.settings.results_dir", tmp_path / "results"):
+            use_model(manager, model)
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        segment_diarization.assert_not_called()
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.COMPLETED
+            result = (await db.execute(select(Result))).scalars().one()
+            assert result.speaker_count == 2
+
+
+    async def test_failure_cancels_outstanding_window_diarization(self, db_factory, tmp_path):
+        job_id = await create_job(
+            db_factory, num_files=2, diarization_config={"enabled": True, "mode": "window"}
+        )
+        second_started = threading.Event()
+        release = threading.Event()
+
+        class SlowSecondModel(FakeModel):
+            def transcribe(self, audio_path, language, params):
+                # 두 번째 파일은 첫 파일의 enrich 실패 시점에 아직 ASR 중
+                time.sleep(0.5 if "audio-1" in audio_path else 0.0)
+                return {"segments": [{"start": 0.0, "end": 1.0, "text": audio_path}]}
+
+        def fake_windows(audio_path, diarization_config, hf_token, audio=None, device="cpu"):
+            if "audio-1" in audio_path:
+                second_started.set()
+                release.wait(timeout=5)
+            else:
+                assert second_started.wait(timeout=5)
+            return [{"start": 0.0, "end": 1.0, "speaker": 0}]
+
+        file_tasks = []
+        original_asr_stage = TranscriptionService._asr_stage
+
+        async def recording_asr_stage(self, task, **kwargs):
+            file_tasks.append(task)
+            return await original_asr_stage(self, task, **kwargs)
+
+        try:
+            with patch("app.services.transcription.model_manager") as manager, \
+                    patch.object(TranscriptionService, "_run_window_diarization", side_effect=fake_windows), \
+                    patch.object(TranscriptionService, "_asr_stage", recording_asr_stage), \
+                    patch("app.services.transcription.DiarizationProcessor.assign_speakers",
+                          side_effect=RuntimeError("assign failed")), \
+                    patch("app.services.transcription.settings.shared_audio_decode", False), \
+                    patch("app.services.transcription.settings.results_dir", tmp_path / "results"):
+                use_model(manager, SlowSecondModel(max_concurrency=2))
+                async with db_factory() as db:
+                    with pytest.raises(RuntimeError, match="assign failed"):
+                        await TranscriptionService(db).process_transcription(job_id)
+
+                # 회수되지 못한 두 번째 파일의 윈도우 분별도 취소되고 정리됨
+                assert second_started.is_set()
+                assert len(file_tasks) == 2
+                assert all(task.speaker_turns is None for task in file_tasks)
+                assert asyncio.all_tasks() == {asyncio.current_task()}
+        finally:
+            release.set()
+
+
+class TestResultCacheReuse:
+    """결과 캐시 적중 시 ASR 생략"""
+
+    async def test_cache_hit_skips_model_and_rewrites_outputs(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=1)
+        async with db_factory() as db:
+            file = await db.get(UploadedFile, "file-0")
+            file.content_hash = "deadbeef"
+            await db.commit()
+
+        cache = ResultCache(tmp_path / "cache", enabled=True, max_bytes=0, max_age_days=0)
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            cache.put(cache.make_key("deadbeef", job), {
+                "segments": [{"start": 0.0, "end": 1.0, "text": "cached"}]
+            })
+
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.result_cache", cache), \
+                patch("app.services.transcription.settings.results_dir", tmp_path / "results"):
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        manager.lease.assert_not_called()
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            assert job.status == JobStatus.COMPLETED
+            result = (await db.execute(select(Result))).scalars().one()
+            assert result.segment_count == 1
+            assert "cached" in open(result.json_path, encoding="utf-8").read()
+
+    async def test_cache_miss_stores_result(self, db_factory, tmp_path):
+        job_id = await create_job(db_factory, num_files=1)
+        async with db_factory() as db:
+            file = await db.get(UploadedFile, "file-0")
+            file.content_hash = "cafebabe"
+            await db.commit()
+
+        cache = ResultCache(tmp_path / "cache", enabled=True, max_bytes=0, max_age_days=0)
+        with patch("app.services.transcription.model_manager") as manager, \
+                patch("app.services.transcription.result_cache", cache), \
+                patch("app.services.transcription.settings.results_dir", tmp_path / "results"):
+            use_model(manager, FakeModel(max_concurrency=1))
+            async with db_factory() as db:
+                await TranscriptionService(db).process_transcription(job_id)
+
+        async with db_factory() as db:
+            job = await db.get(Job, job_id)
+            cached = cache.get(cache.make_key("cafebabe", job))
+        assert cached["segments"][0]["text"] == "/data/audio-0.wav"
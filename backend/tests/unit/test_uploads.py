@@ -0,0 +1,57 @@
+"""
+업로드 스트리밍 저장 단위 테스트
+"""
+import hashlib
+import io
+import wave
+
+import pytest
+from fastapi import UploadFile
+
+from app.services.uploads import FileTooLargeError, save_upload
+
+
+def make_wav_bytes(seconds: float, rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * int(rate * seconds))
+    return buffer.getvalue()
+
+
+class TestSaveUpload:
+    async def test_streams_hashes_and_probes_duration(self, tmp_path):
+        data = make_wav_bytes(1.5)
+        upload = UploadFile(io.BytesIO(data), filename="speech.wav")
+
+        stored = await save_upload(upload, tmp_path / "speech.wav", max_size=10 ** 7, chunk_size=4096)
+
+        assert stored.size == len(data)
+        assert stored.content_hash == hashlib.sha256(data).hexdigest()
+        assert stored.duration == pytest.approx(1.5)
+        assert (tmp_path / "speech.wav").read_bytes() == data
+
+    async def test_unknown_format_has_no_duration(self, tmp_path):
+        upload = UploadFile(io.BytesIO(b"not audio"), filename="clip.mp4")
+        stored = await save_upload(upload, tmp_path / "clip.mp4", max_size=100)
+        assert stored.duration is None
+
+    async def test_rejects_oversized_stream_and_removes_partial_file(self, tmp_path):
+        upload = UploadFile(io.BytesIO(b"x" * 10_000), filename="big.wav")
+
+        with pytest.raises(FileTooLargeError):
+            await save_upload(upload, tmp_path / "big.wav", max_size=5_000, chunk_size=1024)
+
+        assert not (tmp_path / "big.wav").exists()
+
+    async def test_rejects_declared_size_before_reading(self, tmp_path):
+        stream = io.BytesIO(b"x" * 10)
+        upload = UploadFile(stream, filename="big.wav", size=10 ** 9)
+
+        with pytest.raises(FileTooLargeError):
+            await save_upload(upload, tmp_path / "big.wav", max_size=100)
+
+        assert stream.tell() == 0
+        assert not (tmp_path / "big.wav").exists()
@@ -0,0 +1,92 @@
+"""
+모델 프리로드/워밍업 단위 테스트
+"""
+import wave
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services.warmup import ModelWarmup, parse_model_spec, write_silence_wav
+
+
+class TestParseModelSpec:
+    def test_with_compute_type(self):
+        assert parse_model_spec("faster_whisper:large-v3:cuda:int8") == (
+            "faster_whisper", "large-v3", "cuda", "int8"
+        )
+
+    def test_default_compute_type(self):
+        assert parse_model_spec("origin_whisper:base:cpu") == (
+            "origin_whisper", "base", "cpu", "float16"
+        )
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_model_spec("faster_whisper:large-v3")
+
+
+def test_write_silence_wav(tmp_path):
+    path = write_silence_wav(tmp_path / "silence.wav", seconds=0.5)
+    with wave.open(str(path)) as wav:
+        assert wav.getframerate() == 16000
+        assert wav.getnchannels() == 1
+        assert wav.getnframes() == 8000
+
+
+def fake_alease(calls, outcomes):
+    """alease() 대체: 호출 인자를 기록하고 outcomes 순서대로 모델 반환/예외 발생"""
+    outcomes = list(outcomes)
+
+    @asynccontextmanager
+    async def alease(*args):
+        calls.append(args)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        yield outcome
+
+    return alease
+
+
+class TestModelWarmup:
+    async def test_loads_pins_and_transcribes(self, tmp_path):
+        model = Mock()
+        with patch("app.services.warmup.model_manager") as manager, \
+                patch("app.services.warmup.settings.temp_dir", tmp_path):
+            calls = []
+            manager.alease = fake_alease(calls, [model])
+            manager.make_key.return_value = "faster_whisper_tiny_cpu_int8"
+
+            warmup = ModelWarmup(["faster_whisper:tiny:cpu:int8"], warmup=True)
+            await warmup.run()
+
+        assert calls == [("faster_whisper", "tiny", "cpu", "int8")]
+        manager.pin.assert_called_once_with("faster_whisper_tiny_cpu_int8")
+        model.transcribe.assert_called_once()
+        assert warmup.state == "ready"
+        assert warmup.status()["models"]["faster_whisper:tiny:cpu:int8"]["status"] == "ready"
+        # 임시 WAV 정리
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_failure_does_not_block_other_models(self, tmp_path):
+        model = Mock()
+        with patch("app.services.warmup.model_manager") as manager, \
+                patch("app.services.warmup.settings.temp_dir", tmp_path):
+            manager.alease = fake_alease([], [RuntimeError("no gpu"), model])
+
+            warmup = ModelWarmup(
+                ["faster_whisper:large-v3:cuda", "faster_whisper:tiny:cpu:int8"], warmup=False
+            )
+            await warmup.run()
+
+        assert warmup.state == "failed"
+        assert warmup.models["faster_whisper:large-v3:cuda"]["error"] == "no gpu"
+        assert warmup.models["faster_whisper:tiny:cpu:int8"]["status"] == "ready"
+        model.transcribe.assert_not_called()
+
+    async def test_start_without_specs_stays_idle(self):
+        warmup = ModelWarmup([])
+        warmup.start()
+        assert warmup.state == "idle"
+        assert not warmup.is_warming
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for AgglomerativeClustering post-processing.
+
+Compares the previous per-cluster Python loops (np.mean per cluster for
+centroids, clusters[clusters == small] = large per small cluster, in-place
+normalization) with the vectorized path in woa/diarize.py, and times a full
+cluster() call (subset linkage + nearest-centroid assignment above
+max_num_embeddings).
+
+Usage:
+  python scripts/bench_clustering.py
+  python scripts/bench_clustering.py --sizes 1000 10000 50000 --min-cluster-size 20 --repeat 5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.spatial.distance import cdist
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from woa.diarize import AgglomerativeClustering  # noqa: E402
+
+
+def make_inputs(num_embeddings: int, num_clusters: int, dim: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    embeddings = rng.normal(size=(num_embeddings, dim)).astype(np.float32)
+    # skewed cluster sizes so that many clusters fall below min_cluster_size
+    weights = 1.0 / np.arange(1, num_clusters + 1)
+    clusters = rng.choice(num_clusters, size=num_embeddings, p=weights / weights.sum())
+    _, clusters = np.unique(clusters, return_inverse=True)
+    return embeddings, clusters
+
+
+def postprocess_loop(embeddings, clusters, min_cluster_size, metric="cosine"):
+    embeddings = embeddings.copy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        embeddings /= np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    clusters = clusters.copy()
+    cluster_unique, cluster_counts = np.unique(clusters, return_counts=True)
+    large_clusters = cluster_unique[cluster_counts >= min_cluster_size]
+    small_clusters = cluster_unique[cluster_counts < min_cluster_size]
+    large_centroids = np.vstack(
+        [np.mean(embeddings[clusters == k], axis=0) for k in large_clusters]
+    )
+    small_centroids = np.vstack(
+        [np.mean(embeddings[clusters == k], axis=0) for k in small_clusters]
+    )
+    centroids_cdist = cdist(large_centroids, small_centroids, metric=metric)
+    for small_k, large_k in enumerate(np.argmin(centroids_cdist, axis=0)):
+        clusters[clusters == small_clusters[small_k]] = large_clusters[large_k]
+    _, clusters = np.unique(clusters, return_inverse=True)
+    return clusters
+
+
+def postprocess_vectorized(embeddings, clusters, min_cluster_size, metric="cosine"):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        embeddings = embeddings / np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    cluster_unique, cluster_counts = np.unique(clusters, return_counts=True)
+    large_clusters = cluster_unique[cluster_counts >= min_cluster_size]
+    small_clusters = cluster_unique[cluster_counts < min_cluster_size]
+    centroids = AgglomerativeClustering._centroids(embeddings, clusters)
+    centroids_cdist = cdist(
+        centroids[large_clusters], centroids[small_clusters], metric=metric
+    )
+    mapping = np.arange(len(centroids))
+    mapping[small_clusters] = large_clusters[np.argmin(centroids_cdist, axis=0)]
+    _, clusters = np.unique(mapping[clusters], return_inverse=True)
+    return clusters
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument(
+        "--clusters", type=int, default=None,
+        help="clusters before post-processing (default: embeddings / 20)",
+    )
+    parser.add_argument("--min-cluster-size", type=int, default=20)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'embeddings':>10} {'loop (s)':>10} {'vector (s)':>11} {'speedup':>8} {'cluster() (s)':>14}")
+    for size in args.sizes:
+        embeddings, clusters = make_inputs(size, args.clusters or max(2, size // 20), args.dim)
+        loop_time, expected = best_of(
+            lambda: postprocess_loop(embeddings, clusters, args.min_cluster_size), args.repeat
+        )
+        vector_time, actual = best_of(
+            lambda: postprocess_vectorized(embeddings, clusters, args.min_cluster_size), args.repeat
+        )
+        if not np.array_equal(expected, actual):
+            raise SystemExit(f"vectorized result differs from loop result at {size} embeddings")
+
+        model = AgglomerativeClustering(max_num_embeddings=1000)
+        cluster_time, _ = best_of(
+            lambda: model.cluster(embeddings, min_clusters=1, max_clusters=20), args.repeat
+        )
+        print(
+            f"{size:>10} {loop_time:>10.4f} {vector_time:>11.4f} "
+            f"{loop_time / vector_time:>7.1f}x {cluster_time:>14.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
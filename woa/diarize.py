@@ -8,6 +8,7 @@ import torch.nn.functional as F
 import torchaudio.compliance.kaldi as kaldi
 from einops import rearrange
 from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.sparse import csr_matrix
 from scipy.spatial.distance import cdist
 from torch import nn
 
@@ -253,10 +254,17 @@ class AgglomerativeClustering():
         metric: str="cosine",
         max_num_embeddings: int=1000,
         constrained_assignment: bool=False,
+        threshold: float=0.8,
+        min_cluster_size: int=1,
     ):
         self.metric = metric
+        # linkage is O(n^2) in memory: above this many embeddings, cluster an
+        # evenly spaced subset and assign the rest to the nearest centroid
         self.max_num_embeddings = max_num_embeddings
         self.constrained_assignment = constrained_assignment
+        self.threshold = threshold
+        # clusters smaller than this are merged into the closest large cluster
+        self.min_cluster_size = min_cluster_size
         
     def set_num_clusters(
         self,
@@ -290,14 +298,110 @@ class AgglomerativeClustering():
     ):
 
         num_embeddings = embeddings.shape[0]
-        min_cluster_size = 1
+        # normalized copy: the caller's embeddings are left untouched
         with np.errstate(divide="ignore", invalid="ignore"):
-            embeddings /= np.linalg.norm(embeddings, axis=-1, keepdims=True)
+            embeddings = embeddings / np.linalg.norm(embeddings, axis=-1, keepdims=True)
+
+        if self.max_num_embeddings and num_embeddings > self.max_num_embeddings:
+            return self._cluster_subsampled(
+                embeddings, min_clusters, max_clusters, num_clusters
+            )
+        return self._cluster(embeddings, min_clusters, max_clusters, num_clusters)
+
+    def _cluster_subsampled(
+        self,
+        embeddings: np.ndarray,
+        min_clusters: int,
+        max_clusters: int,
+        num_clusters: int=None,
+    ):
+        num_embeddings = embeddings.shape[0]
+        # evenly spaced in time so that every part of the recording is represented
+        subset = np.unique(
+            np.linspace(0, num_embeddings - 1, self.max_num_embeddings).round().astype(int)
+        )
+        subset_clusters = self._cluster(
+            embeddings[subset], min_clusters, max_clusters, num_clusters
+        )
+
+        centroids = self._centroids(embeddings[subset], subset_clusters)
+        centroids_cdist = cdist(embeddings, centroids, metric=self.metric)
+        clusters = np.argmin(np.nan_to_num(centroids_cdist, nan=np.inf), axis=1)
+        clusters[subset] = subset_clusters
+
+        _, clusters = np.unique(clusters, return_inverse=True)
+        return clusters
+
+    @staticmethod
+    def _centroids(embeddings: np.ndarray, clusters: np.ndarray) -> np.ndarray:
+        """Mean embedding of every cluster label 0..max(clusters) in one pass."""
+        num_clusters = int(clusters.max()) + 1
+        counts = np.bincount(clusters, minlength=num_clusters)
+        # segment sum as a (clusters x embeddings) one-hot sparse product
+        membership = csr_matrix(
+            (np.ones(len(clusters), dtype=embeddings.dtype), (clusters, np.arange(len(clusters)))),
+            shape=(num_clusters, len(clusters)),
+        )
+        sums = membership @ embeddings
+        if np.isnan(sums).any():
+            # zero-norm embeddings normalize to NaN: leave them out of the means
+            sums = membership @ np.nan_to_num(embeddings)
+        return sums / np.maximum(counts, 1)[:, None]
+
+    def _search_num_clusters(
+        self,
+        dendrogram: np.ndarray,
+        num_clusters: int,
+        min_cluster_size: int,
+    ):
+        """Binary search over dendrogram merges for the cut closest to num_clusters."""
+        num_embeddings = dendrogram.shape[0] + 1
+        # merge order instead of (possibly non-monotonic) centroid distances:
+        # cutting at t keeps the first t + 1 merges, so the number of clusters
+        # decreases as t grows
+        _dendrogram = np.copy(dendrogram)
+        _dendrogram[:, 2] = np.arange(num_embeddings - 1)
+
+        best_clusters = None
+        best_num_large_clusters = None
+        low, high = 0, num_embeddings - 2
+        while low <= high:
+            iteration = (low + high) // 2
+            clusters = fcluster(_dendrogram, iteration, criterion="distance") - 1
+            _, cluster_counts = np.unique(clusters, return_counts=True)
+            num_large_clusters = int(np.sum(cluster_counts >= min_cluster_size))
+
+            if best_clusters is None or abs(num_large_clusters - num_clusters) < abs(
+                best_num_large_clusters - num_clusters
+            ):
+                best_clusters = clusters
+                best_num_large_clusters = num_large_clusters
+
+            if num_large_clusters == num_clusters:
+                break
+            if num_large_clusters > num_clusters:
+                low = iteration + 1
+            else:
+                high = iteration - 1
+
+        return best_clusters, best_num_large_clusters
+
+    def _cluster(
+        self,
+        embeddings: np.ndarray,
+        min_clusters: int,
+        max_clusters: int,
+        num_clusters: int=None,
+    ):
+        num_embeddings = embeddings.shape[0]
+        min_cluster_size = self.min_cluster_size
+        if num_embeddings < 2:
+            return np.zeros(num_embeddings, dtype=int)
+
         dendrogram: np.ndarray = linkage(embeddings, method="centroid", metric="euclidean")
         
-        clusters = fcluster(dendrogram, 0.8, criterion="distance") - 1
+        clusters = fcluster(dendrogram, self.threshold, criterion="distance") - 1
         cluster_unique, cluster_counts = np.unique(clusters, return_counts=True)
-        print(cluster_unique, cluster_counts)
         large_clusters = cluster_unique[cluster_counts >= min_cluster_size]
         num_large_clusters = len(large_clusters)
         
@@ -307,38 +411,13 @@ class AgglomerativeClustering():
             num_clusters = max_clusters
             
         if num_clusters is not None and num_large_clusters != num_clusters:
-            _dendrogram = np.copy(dendrogram)
-            _dendrogram[:, 2] = np.arange(num_embeddings - 1)
-
-            best_iteration = num_embeddings - 1
-            best_num_large_clusters = 1
-            
-            for iteration in np.argsort(np.abs(dendrogram[:, 2] - self.threshold)):
-                new_cluster_size = _dendrogram[iteration, 3]
-                if new_cluster_size < min_cluster_size:
-                    continue
-                
-                clusters = fcluster(_dendrogram, iteration, criterion="distance") - 1
-                cluster_unique, cluster_counts = np.unique(clusters, return_counts=True)
-                large_clusters = cluster_unique[cluster_counts >= min_cluster_size]
-                num_large_clusters = len(large_clusters)
-                
-                if abs(num_large_clusters - num_clusters) < abs(
-                    best_num_large_clusters - num_clusters
-                ):
-                    best_iteration = iteration
-                    best_num_large_clusters = num_large_clusters
-                
-                if num_large_clusters == num_clusters:
-                    break
-            if best_num_large_clusters != num_clusters:
-                clusters = (
-                    fcluster(_dendrogram, best_iteration, criterion="distance") - 1
-                )
-                cluster_unique, cluster_counts = np.unique(clusters, return_counts=True)
-                large_clusters = cluster_unique[cluster_counts >= min_cluster_size]
-                num_large_clusters = len(large_clusters)
-                print(
+            clusters, num_large_clusters = self._search_num_clusters(
+                dendrogram, num_clusters, min_cluster_size
+            )
+            cluster_unique, cluster_counts = np.unique(clusters, return_counts=True)
+            large_clusters = cluster_unique[cluster_counts >= min_cluster_size]
+            if num_large_clusters != num_clusters:
+                warnings.warn(
                     f"Found only {num_large_clusters} clusters. Using a smaller value than {min_cluster_size} for `min_cluster_size` might help."
                 )
         if num_large_clusters == 0:
@@ -348,28 +427,22 @@ class AgglomerativeClustering():
         small_clusters = cluster_unique[cluster_counts < min_cluster_size]
         if len(small_clusters) == 0:
             return clusters
-        
-        large_centroids = np.vstack(
-            [
-                np.mean(embeddings[clusters == large_k], axis=0)
-                for large_k in large_clusters
-            ]
-        )
-        small_centroids = np.vstack(
-            [
-                np.mean(embeddings[clusters == small_k], axis=0)
-                for small_k in small_clusters
-            ]
+
+        # fcluster labels are contiguous, so centroids and the relabelling map
+        # can be indexed by label directly
+        centroids = self._centroids(embeddings, clusters)
+        centroids_cdist = cdist(
+            centroids[large_clusters], centroids[small_clusters], metric=self.metric
         )
-        centroids_cdist = cdist(large_centroids, small_centroids, metric=self.metric)
-        for small_k, large_k in enumerate(np.argmin(centroids_cdist, axis=0)):
-            clusters[clusters == small_clusters[small_k]] = large_clusters[large_k]
-            
+        mapping = np.arange(len(centroids))
+        mapping[small_clusters] = large_clusters[np.argmin(centroids_cdist, axis=0)]
+        clusters = mapping[clusters]
+
         _, clusters = np.unique(clusters, return_inverse=True)
         return clusters
 
 
-def diarization_process(filename, results, token, min_speakers=2, max_speakers=15):
+def diarization_process(filename, results, token, min_speakers=2, max_speakers=15, device='cpu'):
     from woa.diarize import WeSpeakerResNet34
     import librosa
     from woa.diarize import AgglomerativeClustering
@@ -378,9 +451,11 @@ def diarization_process(filename, results, token, min_speakers=2, max_speakers=1
 
     wespeaker = hf_hub_download(repo_id="pyannote/wespeaker-voxceleb-resnet34-LM", filename="pytorch_model.bin", token=token)
     
-    embedding_model = WeSpeakerResNet34.load_from_checkpoint(wespeaker, strict=False, map_location='cpu')
+    if device.startswith('cuda') and not torch.cuda.is_available():
+        device = 'cpu'
+    embedding_model = WeSpeakerResNet34.load_from_checkpoint(wespeaker, strict=False, map_location=device)
     embedding_model.eval()
-    embedding_model.to('cpu')
+    embedding_model.to(device)
 
     audio, sr = librosa.load(filename, sr=16000, mono=True)
 
@@ -391,9 +466,10 @@ def diarization_process(filename, results, token, min_speakers=2, max_speakers=1
         for transcript in result[0]["segments"]:
             start, end = transcript["start"], transcript["end"]
             audio_segment = audio[int(start * sr):int(end * sr)]
-            audio_segment = torch.Tensor(audio_segment).reshape(1, 1, -1)
-            embedding = embedding_model(audio_segment)
-            embeddings.append(embedding.detach().numpy())
+            audio_segment = torch.Tensor(audio_segment).reshape(1, 1, -1).to(device)
+            with torch.inference_mode():
+                embedding = embedding_model(audio_segment)
+            embeddings.append(embedding.cpu().numpy())
     
         cluster_model = AgglomerativeClustering()
         cluster_model.set_num_clusters(embedding.shape[0], min_clusters=min_speakers, max_clusters=max_speakers)
@@ -408,18 +408,35 @@ def create_word_details(words):
         for word in words
     ]
 
+def format_segment_largev3(segment):
+    output = {
+        'start': segment.start,
+        'end': segment.end,
+        'text': segment.text,
+    }
+    # only present when transcribed with word_timestamps=True
+    words = getattr(segment, 'words', None)
+    if words:
+        output['words'] = format_words_compact(words)
+    return output
+
+
+def format_words_compact(words):
+    return [
+        {
+            'word': word.word,
+            'start': round(word.start, 3),
+            'end': round(word.end, 3),
+            'score': round(word.probability, 3),
+        }
+        for word in words
+    ]
+
+
 def format_output_largev3(segments):
     
     output = {
-        'segments': [
-            {
-                'start': segment.start,
-                'end': segment.end,
-                'text': segment.text,
-                
-            }
-            for segment in segments
-        ],
+        'segments': [format_segment_largev3(segment) for segment in segments],
     }
 
     return output